@@ -0,0 +1,142 @@
+/**
+ * AptiRise - Clustered Entry Point
+ *
+ * Runs several server.js workers behind the same port. The primary syncs the
+ * database once, forks CLUSTER_WORKERS workers (default: one per CPU core),
+ * replaces workers that crash, and performs a rolling restart on SIGHUP so the
+ * port never stops accepting connections.
+ *
+ * Workers share nothing in memory, so sessions and the question cache default
+ * to the Redis backends here.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+const cluster = require('cluster');
+const os = require('os');
+const path = require('path');
+require('dotenv').config();
+
+const WORKERS = parseInt(process.env.CLUSTER_WORKERS) || os.cpus().length;
+// How long a worker may take to finish in-flight requests before it is killed
+const SHUTDOWN_TIMEOUT_MS = parseInt(process.env.CLUSTER_SHUTDOWN_TIMEOUT_MS) || 15000;
+
+// Shared state must live outside the worker processes
+for (const setting of ['SESSION_STORE', 'QUESTION_STORE', 'PROFILE_CACHE']) {
+    if (!process.env[setting]) {
+        process.env[setting] = 'redis';
+    } else if (process.env[setting] !== 'redis') {
+        console.warn(`[Cluster] ${setting}=${process.env[setting]} keeps state per worker; use redis when clustering`);
+    }
+}
+
+// The upstream rate limit is enforced per process, so split both the rate and
+// the burst between workers (defaults match utils/geminiClient.js)
+const RATE_LIMIT_DEFAULTS = { GEMINI_RATE_LIMIT_RPM: 60, GEMINI_RATE_LIMIT_BURST: 10 };
+const workerEnv = {};
+for (const [setting, fallback] of Object.entries(RATE_LIMIT_DEFAULTS)) {
+    const total = parseInt(process.env[setting]) || fallback;
+    workerEnv[setting] = String(Math.max(1, Math.floor(total / WORKERS)));
+}
+
+let restarting = false;
+let shuttingDown = false;
+// Workers stopped on purpose; any other exit is a crash and gets replaced
+const stopping = new WeakSet();
+// Workers that reached 'listening'; one that dies during startup is not respawned in a loop
+const started = new WeakSet();
+
+/**
+ * Forks one worker and resolves once it is accepting connections.
+ * @returns {Promise<cluster.Worker>} The listening worker.
+ */
+function forkWorker() {
+    return new Promise((resolve, reject) => {
+        const worker = cluster.fork(workerEnv);
+        worker.once('listening', () => {
+            started.add(worker);
+            resolve(worker);
+        });
+        worker.once('exit', (code) => reject(new Error(`Worker ${worker.process.pid} exited with code ${code} during startup`)));
+    });
+}
+
+/**
+ * Gracefully stops a worker: it stops accepting connections, finishes the
+ * requests in flight and exits, or is killed after SHUTDOWN_TIMEOUT_MS.
+ * @param {cluster.Worker} worker - Worker to stop.
+ * @returns {Promise<void>} Resolves when the worker has exited.
+ */
+function stopWorker(worker) {
+    return new Promise((resolve) => {
+        if (worker.isDead()) return resolve();
+        stopping.add(worker);
+        const timer = setTimeout(() => worker.kill('SIGKILL'), SHUTDOWN_TIMEOUT_MS);
+        worker.once('exit', () => {
+            clearTimeout(timer);
+            resolve();
+        });
+        worker.process.kill('SIGTERM');
+    });
+}
+
+/**
+ * Replaces workers one at a time, starting each replacement before stopping
+ * the worker it supersedes.
+ */
+async function rollingRestart() {
+    if (restarting) return;
+    restarting = true;
+    console.log('[Cluster] Rolling restart started');
+    try {
+        for (const worker of Object.values(cluster.workers)) {
+            // A worker that crashed mid-roll has already been replaced
+            if (worker.isDead()) continue;
+            await forkWorker();
+            await stopWorker(worker);
+        }
+        console.log('[Cluster] Rolling restart complete');
+    } catch (err) {
+        console.error('[Cluster] Rolling restart aborted:', err.message);
+    } finally {
+        restarting = false;
+    }
+}
+
+/**
+ * Stops every worker and exits the primary.
+ */
+async function shutdown() {
+    if (shuttingDown) return;
+    console.log('[Cluster] Shutting down');
+    shuttingDown = true; // Suppress respawning
+    await Promise.all(Object.values(cluster.workers).map(stopWorker));
+    process.exit(0);
+}
+
+async function startPrimary() {
+    // Sync once here rather than racing schema changes from every worker
+    const { sequelize } = require('./models/index');
+    await sequelize.sync();
+
+    cluster.setupPrimary({ exec: path.join(__dirname, 'server.js') });
+    cluster.on('exit', (worker, code, signal) => {
+        // Crashes are replaced even mid-roll, or capacity would drop for good
+        if (shuttingDown || stopping.has(worker) || worker.exitedAfterDisconnect || !started.has(worker)) return;
+        console.warn(`[Cluster] Worker ${worker.process.pid} died (${signal || code}), starting a replacement`);
+        forkWorker().catch(err => console.error('[Cluster] Replacement failed:', err.message));
+    });
+
+    await Promise.all(Array.from({ length: WORKERS }, forkWorker));
+    console.log(`[Cluster] ${WORKERS} workers listening on port ${process.env.PORT || 3000} (SIGHUP to reload)`);
+
+    process.on('SIGHUP', rollingRestart);
+    process.on('SIGTERM', shutdown);
+    process.on('SIGINT', shutdown);
+}
+
+startPrimary().catch(err => {
+    console.error('[Cluster] Failed to start:', err);
+    process.exit(1);
+});
@@ -3,13 +3,45 @@
  * 
  * Intercepts requests to protected routes and validates 
  * the JSON Web Token (JWT) provided in the Authorization header.
+ * Recently verified tokens are cached (keyed by their SHA-256) until they
+ * expire, so the requests of an active quiz skip signature verification.
  * 
  * @author Aptitude AI Team
- * @version 1.0.0
+ * @version 1.1.0
  */
 
+const crypto = require('crypto');
 const jwt = require('jsonwebtoken');
 require('dotenv').config();
+const LruCache = require('../utils/lruCache');
+
+// Upper bound on how long a verified token is trusted without re-checking its signature
+const TOKEN_CACHE_TTL_MS = (parseInt(process.env.AUTH_TOKEN_CACHE_TTL_SECONDS) || 300) * 1000;
+
+const tokenCache = new LruCache({
+    maxEntries: parseInt(process.env.AUTH_TOKEN_CACHE_MAX_ENTRIES) || 10000,
+    ttlMs: TOKEN_CACHE_TTL_MS
+});
+
+/**
+ * Verifies a token, reusing the decoded payload of a recent verification.
+ * @param {string} token - Raw JWT.
+ * @returns {Object} Decoded payload; throws like jwt.verify on invalid tokens.
+ */
+function verifyToken(token) {
+    const key = crypto.createHash('sha256').update(token).digest('hex');
+    const cached = tokenCache.get(key);
+    if (cached && (!cached.exp || cached.exp * 1000 > Date.now())) {
+        return cached;
+    }
+    if (cached) tokenCache.delete(key); // Expired since it was cached
+
+    const decoded = jwt.verify(token, process.env.JWT_SECRET);
+    // Never keep a token past its own expiry
+    const ttlMs = decoded.exp ? Math.min(TOKEN_CACHE_TTL_MS, decoded.exp * 1000 - Date.now()) : TOKEN_CACHE_TTL_MS;
+    if (ttlMs > 0) tokenCache.set(key, decoded, ttlMs);
+    return decoded;
+}
 
 /**
  * JWT Authentication Middleware
@@ -27,7 +59,7 @@ function authMiddleware(req, res, next) {
     }
     const token = authHeader.split(' ')[1];
     try {
-        const decoded = jwt.verify(token, process.env.JWT_SECRET);
+        const decoded = verifyToken(token);
         req.user = decoded;
         next();
     } catch (err) {
@@ -36,4 +68,10 @@ function authMiddleware(req, res, next) {
     }
 }
 
+/**
+ * Returns verified-token cache counters for monitoring.
+ * @returns {Object} Hits, misses, evictions, expirations, hit rate and entries.
+ */
+authMiddleware.getTokenCacheStats = () => tokenCache.getStats();
+
 module.exports = authMiddleware;
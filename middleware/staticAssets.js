@@ -0,0 +1,80 @@
+/**
+ * Built Static Asset Middleware
+ *
+ * Serves the output of scripts/build_assets.py. Fingerprinted files never
+ * change under the same name, so they are cached for a year as immutable;
+ * pages are always revalidated. Clients that accept brotli or gzip receive
+ * the precompressed variant written at build time, so nothing is compressed
+ * per request.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+const express = require('express');
+const fs = require('fs');
+const path = require('path');
+
+// name.<10 hex chars>.css|js, as written by the build
+const FINGERPRINTED = /\.[0-9a-f]{10}\.(?:css|js)$/;
+const IMMUTABLE = 'public, max-age=31536000, immutable';
+
+/**
+ * Lists every file below a directory as URL paths ("/assets/js/app.js").
+ * @param {string} root - Directory to walk.
+ * @returns {Set<string>} URL paths of all files.
+ */
+function listFiles(root) {
+    const files = new Set();
+    const walk = (dir) => {
+        for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
+            const full = path.join(dir, entry.name);
+            if (entry.isDirectory()) walk(full);
+            else files.add('/' + path.relative(root, full).split(path.sep).join('/'));
+        }
+    };
+    walk(root);
+    return files;
+}
+
+/**
+ * Creates the middleware for a build directory.
+ * @param {string} root - Build output (dist/public).
+ * @returns {Function} Express middleware.
+ */
+function staticAssets(root) {
+    // The build is fixed once the server starts, so variants are looked up in memory
+    const files = listFiles(root);
+    const serve = express.static(root, {
+        setHeaders(res, filePath) {
+            const original = filePath.replace(/\.(?:br|gz)$/, '');
+            res.setHeader('Cache-Control', FINGERPRINTED.test(original) ? IMMUTABLE : 'no-cache');
+        }
+    });
+
+    return (req, res, next) => {
+        if (req.method !== 'GET' && req.method !== 'HEAD') return next();
+
+        let pathname = req.path;
+        if (pathname.endsWith('/')) pathname += 'index.html';
+
+        const hasBr = files.has(pathname + '.br');
+        const hasGz = files.has(pathname + '.gz');
+        if (hasBr || hasGz) {
+            res.vary('Accept-Encoding');
+            const accepted = req.headers['accept-encoding'] || '';
+            const encoding = hasBr && /\bbr\b/.test(accepted) ? 'br'
+                : hasGz && /\bgzip\b/.test(accepted) ? 'gz'
+                : null;
+            if (encoding) {
+                // Type comes from the original name; send keeps a Content-Type that is already set
+                res.type(path.extname(pathname));
+                res.setHeader('Content-Encoding', encoding === 'br' ? 'br' : 'gzip');
+                req.url = pathname + '.' + encoding + req.url.slice(req.path.length);
+            }
+        }
+        serve(req, res, next);
+    };
+}
+
+module.exports = staticAssets;
@@ -20,10 +20,12 @@ const sequelize = new Sequelize({
 const User = require('./user')(sequelize);
 const Milestone = require('./milestone')(sequelize);
 const Session = require('./session')(sequelize);
+const TopicStat = require('./topicStat')(sequelize);
 
 // Define Associations
 User.hasMany(Session, { foreignKey: 'userId', as: 'sessions' });
 Session.belongsTo(User, { foreignKey: 'userId', as: 'user' });
+User.hasMany(TopicStat, { foreignKey: 'userId', as: 'topicStats' });
 
 /**
  * Central Sequelize instance for database operations.
@@ -32,5 +34,6 @@ module.exports = {
     sequelize,
     User,
     Milestone,
-    Session
+    Session,
+    TopicStat
 };
@@ -63,7 +63,11 @@ module.exports = (sequelize) => {
         }
     }, {
         timestamps: true,
-        tableName: 'sessions'
+        tableName: 'sessions',
+        indexes: [
+            // Serves the per-user history pages (keyset on createdAt, id) and per-user counts
+            { name: 'sessions_user_created_id', fields: ['userId', 'createdAt', 'id'] }
+        ]
     });
 
     return Session;
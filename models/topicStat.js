@@ -0,0 +1,60 @@
+/**
+ * Topic Statistics Model
+ *
+ * Running per-user, per-topic totals maintained whenever a session result
+ * is persisted, so weak area analysis reads one small indexed row set
+ * instead of aggregating a user's whole session history.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+const { DataTypes } = require('sequelize');
+
+module.exports = (sequelize) => {
+    const TopicStat = sequelize.define('TopicStat', {
+        id: {
+            type: DataTypes.INTEGER,
+            primaryKey: true,
+            autoIncrement: true
+        },
+        userId: {
+            type: DataTypes.INTEGER,
+            allowNull: false
+        },
+        topicName: {
+            type: DataTypes.STRING,
+            allowNull: false
+        },
+        // Number of completed sessions on this topic
+        sessionsCount: {
+            type: DataTypes.INTEGER,
+            defaultValue: 0
+        },
+        // Sum of session accuracy percentages (average = accuracySum / sessionsCount)
+        accuracySum: {
+            type: DataTypes.INTEGER,
+            defaultValue: 0
+        },
+        correctAnswers: {
+            type: DataTypes.INTEGER,
+            defaultValue: 0
+        },
+        totalQuestions: {
+            type: DataTypes.INTEGER,
+            defaultValue: 0
+        },
+        lastSessionAt: {
+            type: DataTypes.DATE,
+            allowNull: true
+        }
+    }, {
+        timestamps: true,
+        tableName: 'topic_stats',
+        indexes: [
+            { unique: true, fields: ['userId', 'topicName'] }
+        ]
+    });
+
+    return TopicStat;
+};
@@ -212,7 +212,7 @@ const SessionHelpers = {
                     'Content-Type': 'application/json',
                     'Authorization': `Bearer ${token}`
                 },
-                body: JSON.stringify(config)
+                body: JSON.stringify(config) // Pass bundle: true for the whole set up front
             });
 
             if (!res.ok) throw new Error('Failed to start session');
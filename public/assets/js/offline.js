@@ -0,0 +1,245 @@
+/**
+ * Offline Practice
+ *
+ * Registers the service worker and lets practice keep working without the
+ * server: when the device is offline, /api/session/start cannot be reached,
+ * or it does not answer within the latency budget (e.g. a slow cold AI
+ * generation), a session is started from the topic's fallback questions
+ * cached by the service worker. Aborting a slow start closes the request, so
+ * the server discards the session it was building. Offline results are
+ * queued in localStorage and synced to /api/session/offline-sync once the
+ * server is reachable again.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+const OfflinePractice = {
+    START_LATENCY_BUDGET_MS: 4000,
+    QUEUE_KEY: 'offlineSyncQueue',
+    RESULT_KEY: 'lastOfflineResult',
+    SYNC_BATCH_SIZE: 20,
+    BASE_XP: 10, // Matches the server's XP per correct answer; the server's figure is final
+
+    syncing: null,
+
+    register() {
+        if ('serviceWorker' in navigator) {
+            navigator.serviceWorker.register('/sw.js').catch(err => console.warn('Service worker registration failed', err));
+        }
+        window.addEventListener('online', () => this.sync());
+        this.sync();
+    },
+
+    bankUrl(topicId) {
+        return `/api/milestones/topic/${topicId}/offline-bank`;
+    },
+
+    /**
+     * Asks the service worker to cache the offline banks of the given topics.
+     * @param {Array<number>} topicIds - Topics the user is likely to practise.
+     */
+    warmBanks(topicIds) {
+        if (!('serviceWorker' in navigator)) return;
+        navigator.serviceWorker.ready.then(reg => {
+            if (reg.active) reg.active.postMessage({ type: 'cache-urls', urls: topicIds.map(id => this.bankUrl(id)) });
+        });
+    },
+
+    /**
+     * Starts a session on the server, or locally when the device is offline,
+     * the server cannot be reached, or it takes longer than the latency budget.
+     * @param {Object} config - /start body (topicId, topicName, milestoneName, numQuestions, difficulty, bundle).
+     * @param {string} token - JWT.
+     * @returns {Promise<Object>} The /start response, or a local session flagged `local: true`.
+     */
+    async startSession(config, token) {
+        if (!navigator.onLine) return this.startLocalSession(config);
+
+        // Aborting closes the request, and the server drops the session it was building
+        const controller = new AbortController();
+        const timer = setTimeout(() => controller.abort(), this.START_LATENCY_BUDGET_MS);
+        try {
+            const res = await fetch('/api/session/start', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'Authorization': `Bearer ${token}`
+                },
+                body: JSON.stringify(config),
+                signal: controller.signal
+            });
+            // Server answers, errors included, are final
+            return await res.json();
+        } catch (err) {
+            console.warn('Starting an offline session:', err.name === 'AbortError' ? 'server is slow' : err.message);
+            return this.startLocalSession(config);
+        } finally {
+            clearTimeout(timer);
+        }
+    },
+
+    /**
+     * Builds a session from the topic's cached fallback questions.
+     * @param {Object} config - Session configuration.
+     * @returns {Promise<Object>} Local session, including the answer key.
+     */
+    async startLocalSession(config) {
+        const res = await fetch(this.bankUrl(config.topicId)); // Served by the service worker when offline
+        if (!res.ok) throw new Error('No offline questions available for this topic');
+        const bank = await res.json();
+
+        const n = Number(config.numQuestions) || 5;
+        let pool = bank.questions;
+        if (config.difficulty && config.difficulty !== 'mixed') {
+            const bucket = pool.filter(q => q.difficulty === config.difficulty);
+            if (bucket.length >= n) pool = bucket;
+        }
+
+        // Partial Fisher-Yates on a copy
+        const copy = pool.slice();
+        const count = Math.min(n, copy.length);
+        for (let i = 0; i < count; i++) {
+            const j = i + Math.floor(Math.random() * (copy.length - i));
+            [copy[i], copy[j]] = [copy[j], copy[i]];
+        }
+        const questions = copy.slice(0, count);
+
+        const durationMap = { 5: 8 * 60, 10: 15 * 60, 15: 23 * 60, 20: 30 * 60 };
+        return {
+            sessionId: `local_${Date.now().toString(36)}${Math.random().toString(36).slice(2, 8)}`,
+            local: true,
+            topicId: config.topicId,
+            topicName: bank.category,
+            milestoneName: config.milestoneName,
+            totalQuestions: questions.length,
+            questions,
+            durationSeconds: durationMap[n] || n * 90,
+            startedAt: Date.now()
+        };
+    },
+
+    /**
+     * Grades an answer in a local session; same shape as POST /api/session/answer.
+     * @param {Object} session - Local session (updated in place).
+     * @param {number} questionIndex - Answered question.
+     * @param {number} selectedOption - Chosen option (-1 for skipped).
+     * @returns {Object} { isCorrect, correctOptionIndex, solution, nextIndex, isComplete }.
+     */
+    answerLocally(session, questionIndex, selectedOption) {
+        const question = session.questions[questionIndex];
+        session.localAnswers = session.localAnswers || [];
+        session.localAnswers[questionIndex] = selectedOption;
+        const nextIndex = questionIndex + 1;
+        return {
+            message: 'Answer recorded',
+            isCorrect: selectedOption === question.correctOptionIndex,
+            correctOptionIndex: question.correctOptionIndex,
+            solution: question.solution,
+            nextIndex,
+            isComplete: nextIndex >= session.questions.length
+        };
+    },
+
+    /**
+     * Finishes a local session: stores its result for the result page and
+     * queues it for syncing.
+     * @param {Object} session - Local session.
+     * @returns {Object} Result in the shape of GET /api/session/result.
+     */
+    completeLocalSession(session) {
+        const chosen = (session.localAnswers || []).slice();
+        (session.pendingAnswers || []).forEach(a => { chosen[a.questionIndex] = a.selectedOption; });
+
+        let correct = 0;
+        const details = session.questions.map((q, i) => {
+            const userAnswer = chosen[i] !== undefined ? chosen[i] : null;
+            const isCorrect = userAnswer === q.correctOptionIndex;
+            if (isCorrect) correct++;
+            return { question: q.question, options: q.options, correctOptionIndex: q.correctOptionIndex, userAnswer, isCorrect, solution: q.solution };
+        });
+        const total = session.questions.length;
+        const duration = Math.round((Date.now() - session.startedAt) / 1000);
+
+        const queue = this.readQueue();
+        queue.push({
+            clientSessionId: session.sessionId,
+            topicId: session.topicId,
+            topicName: session.topicName,
+            milestoneName: session.milestoneName,
+            durationSeconds: duration,
+            answers: session.questions.map((q, i) => ({ questionId: q.id, selectedOption: chosen[i] !== undefined ? chosen[i] : null }))
+        });
+        localStorage.setItem(this.QUEUE_KEY, JSON.stringify(queue));
+
+        const result = {
+            sessionId: session.sessionId,
+            offline: true,
+            total,
+            correct,
+            accuracy: total ? Math.round((correct / total) * 100) : 0,
+            xpEarned: correct * this.BASE_XP,
+            duration,
+            details
+        };
+        localStorage.setItem(this.RESULT_KEY, JSON.stringify(result));
+        return result;
+    },
+
+    getLocalResult(sessionId) {
+        const result = JSON.parse(localStorage.getItem(this.RESULT_KEY) || 'null');
+        return result && result.sessionId === sessionId ? result : null;
+    },
+
+    readQueue() {
+        return JSON.parse(localStorage.getItem(this.QUEUE_KEY) || '[]');
+    },
+
+    /**
+     * Sends queued offline sessions to the server. Concurrent calls share one run.
+     * @returns {Promise<Array<string>>} Ids of the sessions newly recorded by the server.
+     */
+    sync() {
+        if (!this.syncing) {
+            this.syncing = this.flushQueue().finally(() => { this.syncing = null; });
+        }
+        return this.syncing;
+    },
+
+    async flushQueue() {
+        const recorded = [];
+        const token = localStorage.getItem('token');
+        if (!token || !navigator.onLine) return recorded;
+
+        let batch = this.readQueue().slice(0, this.SYNC_BATCH_SIZE);
+        while (batch.length > 0) {
+            try {
+                const res = await fetch('/api/session/offline-sync', {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                        'Authorization': `Bearer ${token}`
+                    },
+                    body: JSON.stringify({ sessions: batch })
+                });
+                if (!res.ok) break;
+                const { results } = await res.json();
+
+                // Drop everything the server settled; sessions that failed transiently stay queued
+                const settled = new Set(results.filter(r => !r.retry).map(r => r.clientSessionId));
+                results.filter(r => r.created).forEach(r => recorded.push(r.clientSessionId));
+                const remaining = this.readQueue().filter(s => !settled.has(s.clientSessionId));
+                localStorage.setItem(this.QUEUE_KEY, JSON.stringify(remaining));
+                if (settled.size === 0) break;
+                batch = remaining.slice(0, this.SYNC_BATCH_SIZE);
+            } catch (err) {
+                console.warn('Offline sync failed, will retry when back online', err);
+                break;
+            }
+        }
+        return recorded;
+    }
+};
+
+window.OfflinePractice = OfflinePractice;
+OfflinePractice.register();
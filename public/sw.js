@@ -0,0 +1,101 @@
+/**
+ * Service Worker
+ *
+ * Keeps the practice app shell and the per-topic offline question banks in
+ * the Cache API, so a session can start and run without the network (see
+ * assets/js/offline.js). Pages, the curriculum and the banks are fetched
+ * network-first and fall back to the cached copy; fingerprinted assets
+ * (from npm run build:assets) never change and are served cache-first.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+// The asset build rewrites these paths to their fingerprinted names
+const APP_SHELL = [
+    '/practice.html',
+    '/question.html',
+    '/result.html',
+    '/assets/css/style.css',
+    '/assets/js/app.js',
+    '/assets/js/theme.js',
+    '/assets/js/offline.js',
+    '/api/milestones'
+];
+
+/**
+ * Short, stable hash of a string (djb2), so a new build gets a new cache.
+ * @param {string} text - Input.
+ * @returns {string} Hex digest.
+ */
+function hashString(text) {
+    let hash = 5381;
+    for (let i = 0; i < text.length; i++) hash = ((hash << 5) + hash + text.charCodeAt(i)) >>> 0;
+    return hash.toString(16);
+}
+
+const CACHE_NAME = `aptirise-${hashString(APP_SHELL.join('|'))}`;
+const FINGERPRINTED = /\.[0-9a-f]{10}\.(?:css|js)$/;
+
+self.addEventListener('install', (event) => {
+    event.waitUntil(
+        caches.open(CACHE_NAME)
+            .then(cache => cache.addAll(APP_SHELL))
+            .then(() => self.skipWaiting())
+    );
+});
+
+self.addEventListener('activate', (event) => {
+    // Drop caches from earlier builds
+    event.waitUntil(
+        caches.keys()
+            .then(keys => Promise.all(keys.filter(key => key !== CACHE_NAME).map(key => caches.delete(key))))
+            .then(() => self.clients.claim())
+    );
+});
+
+// Pages ask for the offline banks of the topics the user is likely to practise
+self.addEventListener('message', (event) => {
+    if (event.data && event.data.type === 'cache-urls') {
+        event.waitUntil(
+            caches.open(CACHE_NAME).then(cache => Promise.allSettled(event.data.urls.map(url => cache.add(url))))
+        );
+    }
+});
+
+async function networkFirst(request) {
+    const cache = await caches.open(CACHE_NAME);
+    try {
+        const response = await fetch(request);
+        if (response.ok) cache.put(request, response.clone());
+        return response;
+    } catch (err) {
+        const cached = await cache.match(request, { ignoreSearch: true });
+        return cached || Response.error();
+    }
+}
+
+async function cacheFirst(request) {
+    const cache = await caches.open(CACHE_NAME);
+    const cached = await cache.match(request);
+    if (cached) return cached;
+    const response = await fetch(request);
+    if (response.ok) cache.put(request, response.clone());
+    return response;
+}
+
+self.addEventListener('fetch', (event) => {
+    const { request } = event;
+    const url = new URL(request.url);
+    if (request.method !== 'GET' || url.origin !== self.location.origin) return;
+
+    if (url.pathname.startsWith('/api/')) {
+        // Only the public curriculum and question banks work offline; other APIs need the server
+        if (url.pathname === '/api/milestones' || url.pathname.endsWith('/offline-bank')) {
+            event.respondWith(networkFirst(request));
+        }
+        return;
+    }
+
+    event.respondWith(FINGERPRINTED.test(url.pathname) ? cacheFirst(request) : networkFirst(request));
+});
@@ -11,50 +11,21 @@
 const express = require('express');
 const router = express.Router();
 const jwt = require('jsonwebtoken');
-const bcrypt = require('bcryptjs');
+const passwordHasher = require('../utils/passwordHasher');
 require('dotenv').config();
 const authMiddleware = require('../middleware/auth');
 const { User } = require('../models/index');
-
-
-
-// Badge tiers with updated XP thresholds
-// Iron: 500 XP target, Silver: 2000 XP, Gold: 4500 XP, Elite: 7000 XP, Expert: 9500 XP, Master: 12000 XP
-const BADGE_TIERS = [
-    { name: 'Iron', minXP: 0, maxXP: 499 },
-    { name: 'Silver', minXP: 500, maxXP: 1999 },
-    { name: 'Gold', minXP: 2000, maxXP: 4499 },
-    { name: 'Elite', minXP: 4500, maxXP: 6999 },
-    { name: 'Expert', minXP: 7000, maxXP: 9499 },
-    { name: 'Master', minXP: 9500, maxXP: Infinity }
-];
+const { getBadge } = require('../utils/badges');
+const profileCache = require('../utils/profileCache');
 
 /**
- * Determines the badge name based on accumulated XP.
- * @param {number} xp - The total experience points of the user.
- * @returns {string} The name of the earned badge tier.
+ * Sheds load when the password hashing queue is full.
+ * @param {Object} res - Express response object.
  */
-function getBadge(xp) {
-    for (const tier of BADGE_TIERS) {
-        if (xp >= tier.minXP && xp <= tier.maxXP) return tier.name;
-    }
-    return 'Iron';
-}
-
-/**
- * Gets the next badge info for progress display.
- * @param {number} xp - Current XP
- * @returns {object} Next badge name and XP required
- */
-function getNextBadgeInfo(xp) {
-    const nextTier = BADGE_TIERS.find(t => t.minXP > xp);
-    if (nextTier) {
-        return {
-            nextBadge: nextTier.name,
-            xpToNext: nextTier.minXP - xp
-        };
-    }
-    return { nextBadge: 'Master', xpToNext: 0 };
+function rejectBusy(res) {
+    console.warn('[Auth] Password hashing pool saturated, rejecting request');
+    res.set('Retry-After', '2');
+    return res.status(503).json({ error: 'Server is busy. Please try again in a moment.' });
 }
 
 // ==========================================
@@ -79,7 +50,7 @@ router.post('/register', async (req, res) => {
             return res.status(400).json({ error: 'Username already taken' });
         }
 
-        const passwordHash = await bcrypt.hash(password, 10);
+        const passwordHash = await passwordHasher.hash(password, 10);
         // Create user in SQLite database
         const newUser = await User.create({
             username,
@@ -100,6 +71,8 @@ router.post('/register', async (req, res) => {
             { expiresIn: '7d' }
         );
 
+        await profileCache.store(newUser);
+
         res.json({
             message: 'Registration successful',
             token,
@@ -114,6 +87,7 @@ router.post('/register', async (req, res) => {
         });
         console.log(`[Auth] New user registered: ${username}`);
     } catch (err) {
+        if (err instanceof passwordHasher.PoolSaturatedError) return rejectBusy(res);
         console.error('[Auth] Registration error:', err);
         res.status(500).json({ error: 'Registration failed: ' + err.message });
     }
@@ -125,8 +99,8 @@ router.post('/register', async (req, res) => {
 
 // OTP-based authentication imports
 
-const redisClient = require('../utils/redisClient');
-const { sendOTP } = require('../utils/emailService');
+const otpStore = require('../utils/otpStore');
+const emailQueue = require('../utils/emailQueue');
 
 /**
  * Login Step 1: Validate credentials and send OTP.
@@ -152,7 +126,7 @@ router.post('/login/step1', async (req, res) => {
             return res.status(401).json({ error: 'Invalid credentials' });
         }
 
-        const validPassword = await bcrypt.compare(password, user.passwordHash);
+        const validPassword = await passwordHasher.compare(password, user.passwordHash);
         if (!validPassword) {
             console.warn(`[Auth] Step 1 failed: Incorrect password for "${email}"`);
         // Generate cryptographically random OTP
@@ -165,32 +139,22 @@ router.post('/login/step1', async (req, res) => {
         // Generate 6-digit OTP
         const otp = Math.floor(100000 + Math.random() * 900000).toString();
 
-        // Store in Redis (Expires in 5 minutes = 300 seconds)
-        // If Redis unavailable, use in-memory fallback
-        const redisKey = `otp:${email}`;
-        try {
-            await redisClient.setEx(redisKey, 300, otp);
-        // Email delivery with error handling
-
-            console.log(`[Auth] OTP stored in Redis for ${email}`);
-        } catch (redisErr) {
-            console.warn('[Auth] Redis unavailable, using in-memory OTP storage');
-            if (!global.otpStore) global.otpStore = {};
-            global.otpStore[email] = { otp, expiresAt: Date.now() + 300000 };
-        }
+        // Store for 5 minutes (Redis, or the bounded in-memory fallback if Redis is down)
+        await otpStore.set(email, otp, 300);
 
-        // Send OTP Email
+        // Queue the OTP email (sent inline only if the queue is unavailable)
         try {
-            await sendOTP(email, otp, user.username);
+            await emailQueue.enqueueOTP(email, otp, user.username);
         } catch (emailErr) {
             console.error('[Auth] Failed to send email:', emailErr);
             return res.status(500).json({ error: 'Failed to send verification code. Please try again.' });
         }
 
-        console.log(`[Auth] OTP sent to ${email}`);
+        console.log(`[Auth] OTP queued for ${email}`);
         res.json({ message: 'Verification code sent to your email' });
 
     } catch (err) {
+        if (err instanceof passwordHasher.PoolSaturatedError) return rejectBusy(res);
         console.error('[Auth] Login Step 1 error:', err);
         res.status(500).json({ error: 'Login failed. Please try again.' });
     }
@@ -210,21 +174,8 @@ router.post('/login/step2', async (req, res) => {
     }
 
     try {
-        const redisKey = `otp:${email}`;
-        let storedOtp;
-
-        // Try Redis first, fallback to in-memory
-        try {
-            storedOtp = await redisClient.get(redisKey);
-        // Verify OTP matches user input
-
-        } catch (redisErr) {
-            console.warn('[Auth] Redis unavailable, checking in-memory store');
-            const memStore = global.otpStore && global.otpStore[email];
-            if (memStore && memStore.expiresAt > Date.now()) {
-                storedOtp = memStore.otp;
-            }
-        }
+        // Retrieve OTP from storage (Redis or memory)
+        const storedOtp = await otpStore.get(email);
 
         if (!storedOtp) {
             return res.status(400).json({ error: 'Verification code expired or invalid' });
@@ -235,16 +186,7 @@ router.post('/login/step2', async (req, res) => {
         }
 
         // OTP Valid - Clean up
-        try {
-            await redisClient.del(redisKey);
-        } catch (err) {
-            // Clean up in-memory if Redis fails
-        // Update user activity and streak
-
-            if (global.otpStore && global.otpStore[email]) {
-                delete global.otpStore[email];
-            }
-        }
+        await otpStore.remove(email);
 
         // Fetch user to generate token
         const user = await User.findOne({ where: { email } });
@@ -268,6 +210,8 @@ router.post('/login/step2', async (req, res) => {
             user.lastActiveDate = new Date().toISOString();
             await user.save();
         }
+        // Warms the cache for the dashboard's first profile read
+        await profileCache.store(user);
 
         const token = jwt.sign(
             { id: user.id, username: user.username },
@@ -301,45 +245,12 @@ router.post('/login/step2', async (req, res) => {
  */
 router.get('/profile', authMiddleware, async (req, res) => {
     try {
-        const user = await User.findByPk(req.user.id);
-        if (!user) {
+        // Precomputed view, kept current by every write to the user's profile data
+        const profile = await profileCache.get(req.user.id);
+        if (!profile) {
             return res.status(404).json({ error: 'User not found' });
         }
-
-        const currentBadge = getBadge(user.totalXP);
-        const nextBadgeInfo = getNextBadgeInfo(user.totalXP);
-
-        // Calculate progress within current tier
-        const currentTier = BADGE_TIERS.find(t => t.name === currentBadge);
-        const xpInCurrentTier = user.totalXP - currentTier.minXP;
-        const tierRange = currentTier.maxXP === Infinity ? 10000 : (currentTier.maxXP - currentTier.minXP + 1); // +1 because inclusive
-
-        // Calculate average accuracy
-        const avgAccuracy = user.sessionsCompleted > 0
-            ? Math.round(user.totalAccuracySum / user.sessionsCompleted)
-            : 0;
-
-        res.json({
-            id: user.id,
-            username: user.username,
-            email: user.email,
-            totalXP: user.totalXP,
-            currentBadge: currentBadge,
-            streakCount: user.streakCount,
-            preferences: user.preferences,
-            stats: {
-                sessionsCompleted: user.sessionsCompleted,
-                avgAccuracy: avgAccuracy
-            },
-            badgeProgress: {
-                current: currentBadge,
-                currentXP: user.totalXP,
-                xpInCurrentTier,
-                tierRange,
-                nextBadge: nextBadgeInfo.nextBadge,
-                xpToNext: nextBadgeInfo.xpToNext
-            }
-        });
+        res.json(profile);
     } catch (err) {
         console.error('[Auth] Profile fetch error:', err);
         res.status(500).json({ error: 'Failed to fetch profile' });
@@ -363,6 +274,7 @@ router.post('/update-profile', authMiddleware, async (req, res) => {
         if (email) user.email = email;
 
         await user.save();
+        await profileCache.store(user);
 
         res.json({
             message: 'Profile updated successfully',
@@ -406,16 +318,12 @@ router.post('/update-xp', authMiddleware, async (req, res) => {
 
         // Save updated XP to database
         await user.save();
+        const { badgeProgress } = await profileCache.store(user);
 
-        const newBadge = getBadge(user.totalXP);
+        const newBadge = badgeProgress.current;
 
         const badgeUpgrade = oldBadge !== newBadge;
 
-        const nextBadgeInfo = getNextBadgeInfo(user.totalXP);
-        const currentTier = BADGE_TIERS.find(t => t.name === newBadge);
-        const xpInCurrentTier = user.totalXP - currentTier.minXP;
-        const tierRange = currentTier.maxXP === Infinity ? 10000 : (currentTier.maxXP - currentTier.minXP + 1);
-
         console.log(`[Auth] XP updated for user ${user.username}: +${xpGained} XP (Total: ${user.totalXP})`);
         if (badgeUpgrade) {
             console.log(`[Auth] Badge upgrade for ${user.username}: ${oldBadge} -> ${newBadge}`);
@@ -426,14 +334,7 @@ router.post('/update-xp', authMiddleware, async (req, res) => {
             currentBadge: newBadge,
             badgeUpgrade,
             previousBadge: badgeUpgrade ? oldBadge : null,
-            badgeProgress: {
-                current: newBadge,
-                currentXP: user.totalXP,
-                xpInCurrentTier,
-                tierRange,
-                nextBadge: nextBadgeInfo.nextBadge,
-                xpToNext: nextBadgeInfo.xpToNext
-            }
+            badgeProgress
         });
     } catch (err) {
         console.error('[Auth] XP update error:', err);
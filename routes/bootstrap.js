@@ -0,0 +1,63 @@
+/**
+ * Page Bootstrap Route
+ *
+ * Returns everything a page needs on load in one response, so the dashboard,
+ * practice and weak-areas pages make a single round-trip instead of chaining
+ * separate profile, milestone and weak-area requests. Sections are assembled
+ * in parallel.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+const express = require('express');
+const router = express.Router();
+const authMiddleware = require('../middleware/auth');
+const milestones = require('../data/milestones');
+const profileCache = require('../utils/profileCache');
+const topicStats = require('../utils/topicStats');
+
+// Data each page renders on load
+const PAGE_SECTIONS = {
+    dashboard: ['profile', 'milestones'],
+    practice: ['profile', 'milestones'],
+    'weak-areas': ['profile', 'milestones', 'weakAreas']
+};
+
+/**
+ * Bootstraps a page.
+ * @route GET /api/bootstrap?page=dashboard|practice|weak-areas
+ */
+router.get('/', authMiddleware, async (req, res) => {
+    const sections = PAGE_SECTIONS[req.query.page];
+    if (!sections) {
+        return res.status(400).json({ error: `page must be one of: ${Object.keys(PAGE_SECTIONS).join(', ')}` });
+    }
+
+    try {
+        const profilePromise = profileCache.get(req.user.id);
+        const loaders = {
+            profile: () => profilePromise,
+            milestones: () => milestones,
+            // Runs alongside the other sections; only the unlock check waits on the profile
+            weakAreas: async () => {
+                const profile = await profilePromise;
+                return profile ? topicStats.getWeakAreas(req.user.id, profile.stats.sessionsCompleted) : null;
+            }
+        };
+
+        const values = await Promise.all(sections.map(name => loaders[name]()));
+        const body = {};
+        sections.forEach((name, i) => { body[name] = values[i]; });
+
+        if (!body.profile) {
+            return res.status(404).json({ error: 'User not found' });
+        }
+        res.json(body);
+    } catch (err) {
+        console.error(`[Bootstrap] Failed to load ${req.query.page}:`, err);
+        res.status(500).json({ error: 'Failed to load page data' });
+    }
+});
+
+module.exports = router;
@@ -1,140 +1,115 @@
 /**
  * Milestone and Topic Configuration
  * 
- * Defines the curriculum structure, including milestones, topics, 
- * difficulty ratings, and point weights for the aptitude platform.
+ * Serves the curriculum structure (data/milestones.js), including milestones,
+ * topics, difficulty ratings, and point weights for the aptitude platform.
+ * Responses are serialized once at startup and served with strong ETags.
  * 
  * @author Aptitude AI Team
- * @version 1.0.0
+ * @version 1.1.0
  */
 
+const crypto = require('crypto');
 const express = require('express');
 const router = express.Router();
-const milestones = [
-    {
-        id: 1,
-        name: 'Milestone 1',
-        topics: [
-            { id: 101, name: 'Number System', weight: 1.0, difficultyTag: 'easy' },
-            { id: 102, name: 'HCF and LCM', weight: 1.0, difficultyTag: 'easy' },
-            { id: 103, name: 'Average', weight: 1.0, difficultyTag: 'easy' },
-            { id: 104, name: 'Blood Relation', weight: 1.0, difficultyTag: 'easy' },
-            { id: 105, name: 'Number Series', weight: 1.0, difficultyTag: 'easy' }
-        ]
-    },
-    {
-        id: 2,
-        name: 'Milestone 2',
-        topics: [
-            { id: 201, name: 'Ratio & Proportion', weight: 1.0, difficultyTag: 'easy' },
-            { id: 202, name: 'Problems on Ages', weight: 1.25, difficultyTag: 'medium' },
-            { id: 203, name: 'Mixture & Alligation', weight: 1.25, difficultyTag: 'medium' },
-            { id: 204, name: 'Directions', weight: 1.0, difficultyTag: 'easy' },
-            { id: 205, name: 'Alphanumeric Series', weight: 1.0, difficultyTag: 'easy' }
-        ]
-    },
-    {
-        id: 3,
-        name: 'Milestone 3',
-        topics: [
-            { id: 301, name: 'Percentage', weight: 1.0, difficultyTag: 'easy' },
-            { id: 302, name: 'Profit or Loss, Discount', weight: 1.25, difficultyTag: 'medium' },
-            { id: 303, name: 'Simple Interest', weight: 1.0, difficultyTag: 'easy' },
-            { id: 304, name: 'Compound Interest', weight: 1.25, difficultyTag: 'medium' },
-            { id: 305, name: 'Seating Arrangement 1', weight: 1.5, difficultyTag: 'hard' }
-        ]
-    },
-    {
-        id: 4,
-        name: 'Milestone 4',
-        topics: [
-            { id: 401, name: 'Time & Work', weight: 1.25, difficultyTag: 'medium' },
-            { id: 402, name: 'Pipes & Cisterns', weight: 1.25, difficultyTag: 'medium' },
-            { id: 403, name: 'Data Interpretation', weight: 1.5, difficultyTag: 'hard' },
-            { id: 404, name: 'Seating Arrangement 2', weight: 1.5, difficultyTag: 'hard' },
-            { id: 405, name: 'Coding Decoding', weight: 1.0, difficultyTag: 'easy' }
-        ]
-    },
-    {
-        id: 5,
-        name: 'Milestone 5',
-        topics: [
-            { id: 501, name: 'Permutation', weight: 1.25, difficultyTag: 'medium' },
-            { id: 502, name: 'Combination', weight: 1.25, difficultyTag: 'medium' },
-            { id: 503, name: 'Probability', weight: 1.25, difficultyTag: 'medium' },
-            { id: 504, name: 'Syllogism', weight: 1.0, difficultyTag: 'easy' },
-            { id: 505, name: 'Inequalities', weight: 1.0, difficultyTag: 'easy' },
-            { id: 506, name: 'Analogy & Non-Verbal Reasoning', weight: 1.0, difficultyTag: 'easy' }
-        ]
-    },
-    {
-        id: 6,
-        name: 'Milestone 6',
-        topics: [
-            { id: 601, name: 'Time, Speed and Distance', weight: 1.25, difficultyTag: 'medium' },
-            { id: 602, name: 'Problems on Trains', weight: 1.25, difficultyTag: 'medium' },
-            { id: 603, name: 'Boats and Stream', weight: 1.25, difficultyTag: 'medium' },
-            { id: 604, name: 'Ranking & Ordering', weight: 1.0, difficultyTag: 'easy' },
-            { id: 605, name: 'Data Sufficiency', weight: 1.5, difficultyTag: 'hard' },
-            { id: 606, name: 'Statement & Argument', weight: 1.5, difficultyTag: 'hard' }
-        ]
+const milestones = require('../data/milestones');
+const fallbackBank = require('../utils/fallbackBank');
+
+// The curriculum only changes on deploy: let clients reuse responses briefly, then revalidate
+const CACHE_CONTROL = 'public, max-age=300, must-revalidate';
+
+/**
+ * Serializes a response body once and derives its strong ETag.
+ * @param {Object} body - Response body.
+ * @returns {Object} { json, etag }.
+ */
+function precompute(body) {
+    const json = JSON.stringify(body);
+    const etag = `"${crypto.createHash('sha1').update(json).digest('base64url')}"`;
+    return { json, etag };
+}
+
+/**
+ * Sends a precomputed response, or 304 when the client's copy is current.
+ * @param {Object} req - Express request object.
+ * @param {Object} res - Express response object.
+ * @param {Object} entry - Result of precompute().
+ */
+function sendPrecomputed(req, res, entry) {
+    res.set({ 'ETag': entry.etag, 'Cache-Control': CACHE_CONTROL });
+    if (req.fresh) return res.status(304).end();
+    res.type('json').send(entry.json);
+}
+
+// Everything below is built once at startup
+const allMilestonesResponse = precompute({ milestones });
+const topicsByMilestone = new Map();   // milestoneId -> precomputed /topics response
+const topicById = new Map();           // topicId -> precomputed /topic/:topicId response
+const flatTopics = [];                 // every topic with its milestone, for /random
+const topicNames = new Map();          // topicId -> topic name
+const offlineBanks = new Map();        // topicId -> precomputed bank slice, built on first request
+
+for (const milestone of milestones) {
+    topicsByMilestone.set(milestone.id, precompute({
+        milestoneId: milestone.id,
+        milestoneName: milestone.name,
+        topics: milestone.topics
+    }));
+    for (const topic of milestone.topics) {
+        topicNames.set(topic.id, topic.name);
+        topicById.set(topic.id, precompute({ ...topic, milestoneId: milestone.id, milestoneName: milestone.name }));
+        flatTopics.push({
+            milestoneId: milestone.id,
+            milestoneName: milestone.name,
+            topicId: topic.id,
+            topicName: topic.name
+        });
     }
-];
+}
 
 // Get all milestones with topics
 router.get('/', (req, res) => {
-    res.json({ milestones });
+    sendPrecomputed(req, res, allMilestonesResponse);
 });
 
-// Get a random topic and milestone
+// Get a random topic and milestone (uniform over all topics)
 router.get('/random', (req, res) => {
-    if (milestones.length === 0) return res.status(404).json({ error: 'No milestones available' });
-
-    // Pick random milestone
-    const randomMilestone = milestones[Math.floor(Math.random() * milestones.length)];
-    if (!randomMilestone.topics || randomMilestone.topics.length === 0) {
-        return res.status(404).json({ error: 'No topics available' });
-    }
-
-    // Pick random topic
-    const randomTopic = randomMilestone.topics[Math.floor(Math.random() * randomMilestone.topics.length)];
-
-    res.json({
-        milestoneId: randomMilestone.id,
-        milestoneName: randomMilestone.name,
-        topicId: randomTopic.id,
-        topicName: randomTopic.name
-    });
+    if (flatTopics.length === 0) return res.status(404).json({ error: 'No topics available' });
+    res.set('Cache-Control', 'no-store');
+    res.json(flatTopics[Math.floor(Math.random() * flatTopics.length)]);
 });
 
 // Get topics for a specific milestone
 router.get('/topics', (req, res) => {
-    const milestoneId = parseInt(req.query.milestoneId);
-    const milestone = milestones.find(m => m.id === milestoneId);
-    if (!milestone) {
+    const entry = topicsByMilestone.get(parseInt(req.query.milestoneId));
+    if (!entry) {
         return res.status(404).json({ error: 'Milestone not found' });
     }
-    res.json({
-        milestoneId: milestone.id,
-        milestoneName: milestone.name,
-        topics: milestone.topics
-    });
+    sendPrecomputed(req, res, entry);
 });
 
 // Get single topic by ID
 router.get('/topic/:topicId', (req, res) => {
+    const entry = topicById.get(parseInt(req.params.topicId));
+    if (!entry) {
+        return res.status(404).json({ error: 'Topic not found' });
+    }
+    sendPrecomputed(req, res, entry);
+});
+
+// Fallback questions for a topic, cached by the service worker for offline practice
+router.get('/topic/:topicId/offline-bank', (req, res) => {
     const topicId = parseInt(req.params.topicId);
-    for (const milestone of milestones) {
-        const topic = milestone.topics.find(t => t.id === topicId);
-        if (topic) {
-            return res.json({
-                ...topic,
-                milestoneId: milestone.id,
-                milestoneName: milestone.name
-            });
+    let entry = offlineBanks.get(topicId);
+    if (!entry) {
+        const topicName = topicNames.get(topicId);
+        if (!topicName) {
+            return res.status(404).json({ error: 'Topic not found' });
         }
+        entry = precompute({ topicId, ...fallbackBank.slice(topicName) });
+        offlineBanks.set(topicId, entry);
     }
-    res.status(404).json({ error: 'Topic not found' });
+    sendPrecomputed(req, res, entry);
 });
 
 module.exports = router;
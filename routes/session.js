@@ -11,19 +11,219 @@
 const express = require('express');
 const router = express.Router();
 const aiGenerator = require('../utils/aiGenerator');
+const fallbackBank = require('../utils/fallbackBank');
+const questionStore = require('../utils/questionStore');
+const sessionStore = require('../utils/sessionStore');
+const feedbackJobs = require('../utils/feedbackJobs');
+const sessionResults = require('../utils/sessionResults');
+const topicStats = require('../utils/topicStats');
+const profileCache = require('../utils/profileCache');
 const authMiddleware = require('../middleware/auth');
-const { Session, User } = require('../models/index');
+const { Session } = require('../models/index');
 const { Op } = require('sequelize');
 
-// In-memory store for active sessions (persisted to DB on completion)
-const sessions = {};
+// Streaming mode: /start answers as soon as the first question has been generated
+const STREAMING_ENABLED = process.env.AI_STREAMING === 'true';
+
+// Sessions whose questions are still streaming in on this process, keyed by sessionId.
+// The live session object stays here until the stream ends so appends never race the store.
+const questionStreams = new Map();
+
+// Longest a feedback event stream stays open waiting for the background job
+const FEEDBACK_STREAM_WAIT_MS = 30000;
+
+// Sessions streaming on another cluster worker are followed through the shared store
+const REMOTE_STREAM_POLL_MS = 250;
+const REMOTE_STREAM_WAIT_MS = 30000;
+
+// Limits for sessions completed offline from the client-side fallback bank
+const OFFLINE_SYNC_MAX_SESSIONS = 20;
+// An offline session can only draw on the topic slice the client was sent
+const OFFLINE_SESSION_MAX_QUESTIONS = fallbackBank.OFFLINE_SLICE_SIZE;
+const OFFLINE_SESSION_MAX_SECONDS = 2 * 60 * 60;
+
+/**
+ * Loads an active session, preferring the live copy of a session that is still streaming.
+ * @param {string} sessionId - Active session identifier.
+ * @returns {Promise<Object|null>} The session, or null if unknown or expired.
+ */
+async function loadSession(sessionId) {
+    const stream = questionStreams.get(sessionId);
+    if (stream) return stream.session;
+    return sessionStore.get(sessionId);
+}
+
+/**
+ * Waits until the session holds more than `index` questions or its stream has ended.
+ * Streams owned by this process wake waiters directly; streams owned by another
+ * worker are polled from the session store.
+ * @param {string} sessionId - Active session identifier.
+ * @param {number} index - Question index the caller needs.
+ * @param {Object} session - Session as loaded by the caller.
+ * @returns {Promise<Object|null>} The up-to-date session.
+ */
+async function waitForQuestion(sessionId, index, session) {
+    const stream = questionStreams.get(sessionId);
+    if (stream) {
+        if (index >= stream.session.questions.length) {
+            await new Promise(resolve => stream.waiters.push({ index, resolve }));
+        }
+        return stream.session;
+    }
+
+    const deadline = Date.now() + REMOTE_STREAM_WAIT_MS;
+    while (session && session.streaming && index >= session.questions.length && Date.now() < deadline) {
+        await new Promise(resolve => setTimeout(resolve, REMOTE_STREAM_POLL_MS));
+        session = await sessionStore.get(sessionId);
+    }
+    return session;
+}
+
+/**
+ * Copies answers recorded by other workers into the live session so the
+ * streaming worker's next write does not discard them.
+ * @param {Object} session - Live session owned by this process.
+ * @param {Object} stored - Copy currently in the session store.
+ */
+function mergeStoredAnswers(session, stored) {
+    (stored.answers || []).forEach((ans, i) => {
+        if (ans && (!session.answers[i] || session.answers[i].timestamp < ans.timestamp)) {
+            session.answers[i] = ans;
+        }
+    });
+    session.currentIndex = Math.max(session.currentIndex, stored.currentIndex || 0);
+}
+
+/**
+ * Client view of a question: the answer key and solution stay on the server.
+ * @param {Object} question - Stored question.
+ * @returns {Object} { question, options }.
+ */
+function stripAnswer(question) {
+    return { question: question.question, options: question.options };
+}
+
+/**
+ * Looks up unseen cached questions without marking them seen (that happens
+ * once the session is served). The cache is best-effort: when the store
+ * fails, the lookup counts as a miss and the caller generates instead.
+ * @param {number} userId - User starting the session.
+ * @param {Object} params - Generation parameters (category, difficulty, n).
+ * @returns {Promise<Array|null>} Cached questions, or null on a miss.
+ */
+async function takeCachedQuestions(userId, params) {
+    try {
+        return await questionStore.findUnseen(userId, params.category, params.difficulty, params.n);
+    } catch (err) {
+        console.error('[Session] Question cache lookup failed, generating instead:', err);
+        return null;
+    }
+}
+
+/**
+ * Adds served questions to the shared cache (cached ones are already there)
+ * and marks them all seen for the user.
+ * Failures are logged and never reach the session.
+ * @param {number} userId - User the questions were served to.
+ * @param {Object} params - Generation parameters (category, difficulty).
+ * @param {Array} questions - Questions served in the session.
+ */
+async function cacheServedQuestions(userId, params, questions) {
+    try {
+        await questionStore.add(userId, params.category, params.difficulty, questions);
+    } catch (err) {
+        console.error('[Session] Failed to cache served questions:', err);
+    }
+}
+
+/**
+ * Resolves once the response is done: true if it reached the client with a
+ * success status, false if it failed or the client went away first.
+ * @param {Object} res - Express response object.
+ * @returns {Promise<boolean>} Whether the response was served.
+ */
+function whenServed(res) {
+    return new Promise(resolve => {
+        res.once('finish', () => resolve(res.statusCode < 400));
+        res.once('close', () => resolve(res.writableFinished && res.statusCode < 400));
+    });
+}
+
+/**
+ * Starts streaming questions into an active session. Progress is written to the
+ * session store after every question so other workers can serve it.
+ * @param {string} sessionId - Session receiving the questions.
+ * @param {Object} session - The live session object.
+ * @param {Object} params - Generation configuration passed to the AI generator.
+ * @param {Promise<boolean>} served - Whether /start reached the client (see whenServed).
+ */
+function startQuestionStream(sessionId, session, params, served) {
+    const stream = { session, waiters: [], saving: Promise.resolve(), controller: new AbortController() };
+    questionStreams.set(sessionId, stream);
+    session.streaming = true;
+
+    const wake = (all) => {
+        stream.waiters = stream.waiters.filter(w => {
+            if (!all && w.index >= session.questions.length) return true;
+            w.resolve();
+            return false;
+        });
+    };
+
+    // Writes are chained so they reach the store in order; a cancelled session is removed instead
+    const persist = () => {
+        stream.saving = stream.saving.then(async () => {
+            if (stream.controller.signal.aborted) return sessionStore.delete(sessionId);
+            const stored = await sessionStore.get(sessionId);
+            if (stored && stored !== session) mergeStoredAnswers(session, stored);
+            await sessionStore.set(sessionId, session);
+        }).catch(err => {
+            console.error(`[Session] Failed to store streamed session ${sessionId}:`, err);
+        });
+        return stream.saving;
+    };
+
+    aiGenerator.streamQuestions(params, (question) => {
+        session.questions.push(question);
+        wake(false);
+        persist();
+    }, { signal: stream.controller.signal }).catch(err => {
+        console.error(`[Session] Question stream for ${sessionId} failed:`, err);
+    }).finally(async () => {
+        // Nothing awaits this callback, so it must never reject
+        session.streaming = false;
+        try {
+            await persist();
+        } catch (err) {
+            console.error(`[Session] Failed to store streamed session ${sessionId}:`, err);
+        } finally {
+            questionStreams.delete(sessionId);
+            wake(true);
+        }
+        console.log(`[Session] Stream complete for ${sessionId}: ${session.questions.length} questions`);
+        // Questions only count as seen once the session was actually handed out
+        if (await served) await cacheServedQuestions(session.userId, params, session.questions);
+    });
+}
 
 /**
- * Initializes a new practice session for a specific topic.
+ * Stops a question stream whose session was never handed out, e.g. because
+ * the client gave up on /start. The stream's session is removed from the store.
+ * @param {string} sessionId - Streaming session.
+ */
+function cancelQuestionStream(sessionId) {
+    const stream = questionStreams.get(sessionId);
+    if (stream) stream.controller.abort();
+}
+
+/**
+ * Initializes a new practice session for a specific topic. With `bundle: true`
+ * the response carries every question (answers stripped) so the client can
+ * run the whole session without fetching questions one by one.
  * @route POST /api/session/start
  */
 router.post('/start', authMiddleware, async (req, res) => {
-    let { topicId, topicName, milestoneName, numQuestions, difficulty } = req.body;
+    let { topicId, topicName, milestoneName, numQuestions, difficulty, bundle } = req.body;
     const userId = req.user.id;
 
     try {
@@ -42,14 +242,12 @@ router.post('/start', authMiddleware, async (req, res) => {
         }
 
         console.log(`[Session] Starting session for Topic="${topicName}", Difficulty="${difficulty}", Questions=${numQuestions}`);
-        const generated = await aiGenerator.generateQuestions({
+        const generationParams = {
             category: topicName || 'General Aptitude',
             milestone: milestoneName || 'Milestone 1',
             n: numQuestions,
             difficulty: difficulty || 'medium'
-        });
-
-        console.log(`[Session] Questions successfully fetched/generated for ${topicName}`);
+        };
 
         const durationMap = {
             5: 8 * 60,
@@ -60,22 +258,64 @@ router.post('/start', authMiddleware, async (req, res) => {
         const durationSeconds = durationMap[numQuestions] || (numQuestions * 90); // Fallback 1.5 min per q
 
         const sessionId = `sess_${Date.now()}_${userId}`;
-        sessions[sessionId] = {
+        const session = {
             userId,
             topicId,
-            questions: generated.questions,
+            topicName: generationParams.category,
+            questions: [],
             answers: [],
             currentIndex: 0,
             startTime: Date.now(),
             durationSeconds: durationSeconds // Store expected duration
         };
 
+        // A client that gives up (e.g. its latency budget ran out) gets no session at all
+        let abandoned = false;
+        res.on('close', () => {
+            if (res.writableFinished) return;
+            abandoned = true;
+            cancelQuestionStream(sessionId);
+        });
+
+        let totalQuestions;
+        const served = whenServed(res);
+        const cached = await takeCachedQuestions(userId, generationParams);
+        if (cached) {
+            // Every question is already validated and unseen by this user: no upstream call needed
+            console.log(`[Session] Serving ${cached.length} cached questions for ${topicName}`);
+            session.questions = cached;
+            totalQuestions = cached.length;
+            served.then(ok => ok && cacheServedQuestions(userId, generationParams, cached));
+        } else if (STREAMING_ENABLED && !bundle) {
+            // A bundle needs the full set up front, so it is generated in one call instead
+            startQuestionStream(sessionId, session, generationParams, served);
+            await waitForQuestion(sessionId, 0, session);
+            // The stream tops up from the fallback bank, so the planned size is what the client should expect
+            totalQuestions = questionStreams.has(sessionId) ? numQuestions : session.questions.length;
+            console.log(`[Session] First streamed question ready for ${topicName}`);
+        } else {
+            const generated = await aiGenerator.generateQuestions(generationParams);
+            console.log(`[Session] Questions successfully fetched/generated for ${topicName}`);
+            session.questions = generated.questions;
+            totalQuestions = session.questions.length;
+            // A client that gave up before the response arrived never sees these questions
+            served.then(ok => ok && cacheServedQuestions(userId, generationParams, session.questions));
+        }
+
+        if (abandoned) {
+            console.log(`[Session] Client left before ${sessionId} was ready; discarding it`);
+            return;
+        }
+
+        session.startTime = Date.now();
+        await sessionStore.set(sessionId, session);
         res.json({
             sessionId,
-            totalQuestions: generated.questions.length,
-            currentQuestion: generated.questions[0],
+            totalQuestions,
+            currentQuestion: bundle ? stripAnswer(session.questions[0]) : session.questions[0],
             currentIndex: 0,
-            durationSeconds
+            durationSeconds,
+            ...(bundle && { questions: session.questions.map(stripAnswer) })
         });
     } catch (err) {
         console.error('Session start error:', err);
@@ -87,60 +327,140 @@ router.post('/start', authMiddleware, async (req, res) => {
  * Fetches a specific question from an active session by its index.
  * @route GET /api/session/question/:sessionId/:index
  */
-router.get('/question/:sessionId/:index', authMiddleware, (req, res) => {
+router.get('/question/:sessionId/:index', authMiddleware, async (req, res) => {
     const { sessionId, index } = req.params;
-    const session = sessions[sessionId];
 
-    if (!session) {
-        return res.status(404).json({ error: 'Session not found' });
-    }
+    try {
+        let session = await loadSession(sessionId);
+        if (!session) {
+            return res.status(404).json({ error: 'Session not found' });
+        }
 
-    const idx = parseInt(index);
-    if (idx < 0 || idx >= session.questions.length) {
-        return res.status(400).json({ error: 'Invalid question index' });
-    }
+        const idx = parseInt(index);
+        session = await waitForQuestion(sessionId, idx, session);
+        if (!session) {
+            return res.status(404).json({ error: 'Session not found' });
+        }
+        if (idx < 0 || idx >= session.questions.length) {
+            return res.status(400).json({ error: 'Invalid question index' });
+        }
 
-    const question = session.questions[idx];
-    res.json({
-        question: question.question,
-        options: question.options,
-        currentIndex: idx,
-        totalQuestions: session.questions.length,
-        isLast: idx === session.questions.length - 1
-    });
+        const question = session.questions[idx];
+        res.json({
+            question: question.question,
+            options: question.options,
+            currentIndex: idx,
+            totalQuestions: session.questions.length,
+            isLast: idx === session.questions.length - 1
+        });
+    } catch (err) {
+        console.error('[Session] Failed to load question:', err);
+        res.status(500).json({ error: 'Failed to load question' });
+    }
 });
 
 /**
  * Records a user's answer and provides immediate correctness feedback.
  * @route POST /api/session/answer
  */
-router.post('/answer', authMiddleware, (req, res) => {
+router.post('/answer', authMiddleware, async (req, res) => {
     const { sessionId, questionIndex, selectedOption } = req.body;
-    const session = sessions[sessionId];
 
-    if (!session) {
-        return res.status(404).json({ error: 'Session not found' });
+    try {
+        let session = await loadSession(sessionId);
+        if (!session) {
+            return res.status(404).json({ error: 'Session not found' });
+        }
+
+        // While streaming, wait for the next question so isComplete reflects the final set size
+        session = await waitForQuestion(sessionId, questionIndex + 1, session);
+        if (!session) {
+            return res.status(404).json({ error: 'Session not found' });
+        }
+
+        // Record answer
+        session.answers[questionIndex] = {
+            selectedOption,
+            timestamp: Date.now()
+        };
+        session.currentIndex = questionIndex + 1;
+        await sessionStore.set(sessionId, session);
+
+        // Check if immediate feedback mode
+        const question = session.questions[questionIndex];
+        const isCorrect = selectedOption === question.correctOptionIndex;
+
+        res.json({
+            message: 'Answer recorded',
+            isCorrect,
+            correctOptionIndex: question.correctOptionIndex,
+            solution: question.solution,
+            nextIndex: session.currentIndex,
+            isComplete: session.currentIndex >= session.questions.length
+        });
+    } catch (err) {
+        console.error('[Session] Failed to record answer:', err);
+        res.status(500).json({ error: 'Failed to record answer' });
     }
+});
 
-    // Record answer
-    session.answers[questionIndex] = {
-        selectedOption,
-        timestamp: Date.now()
-    };
-    session.currentIndex = questionIndex + 1;
+/**
+ * Records several answers in one request, e.g. a whole bundled session on submit.
+ * Per-answer correctness and solutions are included when `feedback` is true.
+ * @route POST /api/session/answers
+ */
+router.post('/answers', authMiddleware, async (req, res) => {
+    const { sessionId, answers, feedback } = req.body;
 
-    // Check if immediate feedback mode
-    const question = session.questions[questionIndex];
-    const isCorrect = selectedOption === question.correctOptionIndex;
+    if (!Array.isArray(answers) || answers.length === 0) {
+        return res.status(400).json({ error: 'answers must be a non-empty array' });
+    }
 
-    res.json({
-        message: 'Answer recorded',
-        isCorrect,
-        correctOptionIndex: question.correctOptionIndex,
-        solution: question.solution,
-        nextIndex: session.currentIndex,
-        isComplete: session.currentIndex >= session.questions.length
-    });
+    try {
+        let session = await loadSession(sessionId);
+        if (!session) {
+            return res.status(404).json({ error: 'Session not found' });
+        }
+
+        // As in /answer, wait past the last answered question so isComplete sees the final set size
+        const lastIndex = Math.max(...answers.map(a => a.questionIndex));
+        session = await waitForQuestion(sessionId, lastIndex + 1, session);
+        if (!session) {
+            return res.status(404).json({ error: 'Session not found' });
+        }
+        if (answers.some(a => !Number.isInteger(a.questionIndex) || a.questionIndex < 0 || a.questionIndex >= session.questions.length)) {
+            return res.status(400).json({ error: 'Invalid question index' });
+        }
+
+        const timestamp = Date.now();
+        for (const { questionIndex, selectedOption } of answers) {
+            session.answers[questionIndex] = { selectedOption, timestamp };
+        }
+        session.currentIndex = Math.max(session.currentIndex, lastIndex + 1);
+        await sessionStore.set(sessionId, session);
+
+        const response = {
+            message: 'Answers recorded',
+            recorded: answers.length,
+            nextIndex: session.currentIndex,
+            isComplete: session.currentIndex >= session.questions.length
+        };
+        if (feedback) {
+            response.results = answers.map(({ questionIndex, selectedOption }) => {
+                const question = session.questions[questionIndex];
+                return {
+                    questionIndex,
+                    isCorrect: selectedOption === question.correctOptionIndex,
+                    correctOptionIndex: question.correctOptionIndex,
+                    solution: question.solution
+                };
+            });
+        }
+        res.json(response);
+    } catch (err) {
+        console.error('[Session] Failed to record answers:', err);
+        res.status(500).json({ error: 'Failed to record answers' });
+    }
 });
 
 /**
@@ -149,125 +469,49 @@ router.post('/answer', authMiddleware, (req, res) => {
  */
 router.get('/result/:sessionId', authMiddleware, async (req, res) => {
     const { sessionId } = req.params;
-    const session = sessions[sessionId];
+    let session;
+    try {
+        session = await loadSession(sessionId);
+    } catch (err) {
+        console.error('[Session] Failed to load session for result:', err);
+        return res.status(500).json({ error: 'Failed to load session' });
+    }
 
     if (!session) {
         return res.status(404).json({ error: 'Session not found' });
     }
 
-    const total = session.questions.length;
-    let correct = 0;
-    const details = session.questions.map((q, idx) => {
-        const ans = session.answers[idx];
-        const isCorrect = ans && ans.selectedOption === q.correctOptionIndex;
-        if (isCorrect) correct++;
-        return {
-            question: q.question,
-            options: q.options,
-            correctOptionIndex: q.correctOptionIndex,
-            userAnswer: ans ? ans.selectedOption : null,
-            isCorrect,
-            solution: q.solution
-        };
-    });
-
-    // Calculate accuracy percentage
-    const accuracy = Math.round((correct / total) * 100);
+    try {
+        session = await waitForQuestion(sessionId, Infinity, session);
+    } catch (err) {
+        console.error('[Session] Failed to load session for result:', err);
+        return res.status(500).json({ error: 'Failed to load session' });
+    }
+    if (!session) {
+        return res.status(404).json({ error: 'Session not found' });
+    }
 
-    // XP calculation: Accuracy * baseXP * category specific weight
-    const categoryWeight = 1.0; // TODO: Fetch weight from topic configuration
-    const baseXP = 10;
-    const xpEarned = Math.round(correct * baseXP * categoryWeight);
+    const { total, correct, accuracy, xpEarned, categoryWeight, details } = sessionResults.scoreSession(session);
 
-    // Save session to database
+    // Save the session and the user's aggregates once, however often the result is requested
+    let persisted = null;
     try {
-        // Check if session already exists to avoid duplicates on refresh
-        const existingSession = await Session.findOne({ where: { id: sessionId } });
-
-        if (!existingSession) {
-            await Session.create({
-                id: sessionId,
-                userId: req.user.id,
-                topicId: session.topicId,
-                topicName: session.questions[0].topic || 'General', // Fallback
-                milestoneName: session.questions[0].milestone || 'Unknown',
-                totalQuestions: total,
-                correctAnswers: correct,
-                accuracy, // percentage
-                xpEarned,
-                difficulty: session.questions[0].difficulty || 'medium',
-                durationSeconds: Math.round((Date.now() - session.startTime) / 1000)
-            });
-            console.log(`[Session] Persisted session ${sessionId} to DB.`);
-        }
+        persisted = await sessionResults.persistSessionResult(sessionId, req.user.id, session, { total, correct, accuracy, xpEarned });
     } catch (dbErr) {
         console.error('[Session] Failed to persist session:', dbErr);
     }
 
-    // Save session stats to user profile if not already saved for this session
-    // Note: In a real DB we'd have a separate Sessions table and join. 
-    // Here we just update aggregates on the User model.
-    try {
-        const user = await User.findByPk(req.user.id);
-        if (user) {
-            // Update Aggregate Stats
-            user.totalXP += xpEarned;
-            user.sessionsCompleted += 1;
-            user.totalAccuracySum += accuracy;
-
-            // --- Streak Logic ---
-            const today = new Date();
-            // Reset time part to ensure we strictly compare dates
-            today.setHours(0, 0, 0, 0);
-
-            let lastActive = user.lastActiveDate ? new Date(user.lastActiveDate) : null;
-            if (lastActive) {
-                lastActive.setHours(0, 0, 0, 0);
-            }
-
-            if (!lastActive) {
-                // First session ever
-                user.streakCount = 1;
-                user.lastActiveDate = new Date();
-            } else {
-                const diffTime = Math.abs(today - lastActive);
-                const diffDays = Math.ceil(diffTime / (1000 * 60 * 60 * 24));
-
-                if (diffDays === 1) {
-                    // Consecutive day
-                    user.streakCount += 1;
-                    user.lastActiveDate = new Date();
-                } else if (diffDays > 1) {
-                    // Break in streak
-                    user.streakCount = 1;
-                    user.lastActiveDate = new Date();
-                } else {
-                    // Same day (diffDays === 0) - streak remains same, just update timestamp if needed
-                    user.lastActiveDate = new Date();
-                }
-            }
-
-            await user.save();
-            console.log(`[Session] User stats updated. Streak: ${user.streakCount}, XP: ${user.totalXP}`);
-        }
-    } catch (e) { console.error(e); }
-
     // Progress is capped at 100%
     const progressPercent = Math.min(accuracy * categoryWeight, 100);
 
-    // Generate AI Feedback
-    let feedback = null;
+    // AI feedback is generated in the background; clients fetch it from /feedback/:sessionId
     try {
-        console.log(`[Session] Generating feedback for session ${sessionId}...`);
-        feedback = await aiGenerator.generateFeedback({
-            questions: session.questions,
-            answers: session.answers,
-            accuracy,
-            total
-        });
+        await feedbackJobs.startFeedback(sessionId, session, { accuracy, total });
     } catch (err) {
-        console.error('Error getting feedback:', err);
+        console.error('Error starting feedback:', err);
     }
+    const feedbackState = session.feedback || { status: 'none' };
+    const feedback = feedbackState.status === 'ready' ? feedbackState.data : null;
 
     console.log(`[Session] Session completed: User=${req.user.id}, Accuracy=${accuracy}%, XP=${xpEarned}`);
 
@@ -279,23 +523,206 @@ router.get('/result/:sessionId', authMiddleware, async (req, res) => {
         xpEarned,
         progressPercent,
         details,
-        feedback, // Add feedback to response
+        feedback, // Present once ready (e.g. when the result is reloaded)
+        feedbackStatus: feedbackState.status,
+        totalXP: persisted ? persisted.totalXP : null,
+        previousXP: persisted ? persisted.previousXP : null,
+        xpApplied: persisted ? persisted.created : false,
         duration: Math.round((Date.now() - session.startTime) / 1000)
     });
 });
 
 /**
- * Get user's assessment history.
- * @route GET /api/session/history
+ * Returns the AI feedback for a completed session, or its status while it is being generated.
+ * @route GET /api/session/feedback/:sessionId
+ */
+router.get('/feedback/:sessionId', authMiddleware, async (req, res) => {
+    try {
+        const state = await feedbackJobs.getFeedback(req.params.sessionId);
+        if (!state) {
+            return res.status(404).json({ error: 'Session not found' });
+        }
+        res.json(state);
+    } catch (err) {
+        console.error('[Session] Failed to load feedback:', err);
+        res.status(500).json({ error: 'Failed to load feedback' });
+    }
+});
+
+/**
+ * Server-sent events variant of the feedback endpoint: sends a single event
+ * (named after the final status) as soon as the feedback is ready.
+ * @route GET /api/session/feedback/:sessionId/stream
+ */
+router.get('/feedback/:sessionId/stream', authMiddleware, async (req, res) => {
+    let closed = false;
+    // The response closes when the client disconnects from a streaming reply
+    res.on('close', () => { closed = true; });
+
+    res.set({
+        'Content-Type': 'text/event-stream',
+        'Cache-Control': 'no-cache',
+        Connection: 'keep-alive'
+    });
+    res.flushHeaders();
+
+    try {
+        const state = await feedbackJobs.waitForFeedback(req.params.sessionId, FEEDBACK_STREAM_WAIT_MS);
+        if (closed) return;
+        const payload = state || { status: 'none', feedback: null };
+        res.write(`event: ${payload.status}\ndata: ${JSON.stringify(payload)}\n\n`);
+    } catch (err) {
+        console.error('[Session] Feedback stream failed:', err);
+        if (!closed) res.write(`event: error\ndata: ${JSON.stringify({ error: 'Failed to load feedback' })}\n\n`);
+    }
+    if (!closed) res.end();
+});
+
+// History page size limits and the columns a client may project
+const HISTORY_DEFAULT_LIMIT = 50;
+const HISTORY_MAX_LIMIT = 100;
+const HISTORY_FIELDS = new Set([
+    'id', 'topicId', 'topicName', 'milestoneName', 'totalQuestions', 'correctAnswers',
+    'accuracy', 'xpEarned', 'difficulty', 'durationSeconds', 'completedAt', 'createdAt'
+]);
+
+/**
+ * Encodes the position after a history row as an opaque cursor.
+ * @param {Object} row - Last session row of a page.
+ * @returns {string} Base64url cursor over "createdAt|id".
+ */
+function encodeHistoryCursor(row) {
+    return Buffer.from(`${new Date(row.createdAt).toISOString()}|${row.id}`).toString('base64url');
+}
+
+/**
+ * Decodes a history cursor.
+ * @param {string} cursor - Cursor from a previous page.
+ * @returns {Object|null} { createdAt, id }, or null if the cursor is malformed.
+ */
+function decodeHistoryCursor(cursor) {
+    const decoded = Buffer.from(String(cursor), 'base64url').toString('utf8');
+    const separator = decoded.indexOf('|');
+    if (separator === -1) return null;
+    const createdAt = new Date(decoded.slice(0, separator));
+    const id = decoded.slice(separator + 1);
+    return isNaN(createdAt) || !id ? null : { createdAt, id };
+}
+
+/**
+ * Scores and persists one session the client ran offline. Questions are looked
+ * up in the server's fallback bank by id, so only the chosen options are taken
+ * from the client.
+ * @param {number} userId - Owner of the session.
+ * @param {Object} offline - { clientSessionId, topicId, topicName, milestoneName, durationSeconds, answers }.
+ * @returns {Promise<Object>} Per-session sync result.
+ */
+async function syncOfflineSession(userId, offline) {
+    const { clientSessionId, topicId, topicName, milestoneName, durationSeconds, answers } = offline || {};
+    if (!/^[A-Za-z0-9_-]{1,64}$/.test(clientSessionId || '') || !Number.isInteger(topicId) || !topicName ||
+        !Array.isArray(answers) || answers.length === 0 || answers.length > OFFLINE_SESSION_MAX_QUESTIONS) {
+        return { clientSessionId, error: 'Invalid offline session' };
+    }
+
+    const questionIds = answers.map(a => a.questionId);
+    // Each bank question can be answered once per session, or a replayed answer would inflate the score
+    if (new Set(questionIds).size !== questionIds.length) {
+        return { clientSessionId, error: 'Duplicate questions in offline session' };
+    }
+
+    const questions = fallbackBank.findByIds(topicName, questionIds);
+    if (questions.includes(null)) {
+        return { clientSessionId, error: 'Unknown questions in offline session' };
+    }
+
+    const duration = Math.min(Math.max(parseInt(durationSeconds) || 0, 0), OFFLINE_SESSION_MAX_SECONDS);
+    const session = {
+        userId,
+        topicId,
+        topicName: questions[0].category, // The bank category the questions were verified against
+        questions: questions.map(q => ({ ...q, milestone: milestoneName })),
+        answers: answers.map(a => (Number.isInteger(a.selectedOption) ? { selectedOption: a.selectedOption } : null)),
+        // Duration is the time spent answering, not the time until the sync
+        startTime: Date.now() - duration * 1000
+    };
+    const score = sessionResults.scoreSession(session);
+
+    // The client id makes retries idempotent: a session already synced is not counted again
+    const sessionId = `offline_${userId}_${clientSessionId}`;
+    const persisted = await sessionResults.persistSessionResult(sessionId, userId, session, score);
+    return {
+        clientSessionId,
+        sessionId,
+        created: persisted.created,
+        accuracy: score.accuracy,
+        xpEarned: persisted.created ? score.xpEarned : 0,
+        totalXP: persisted.totalXP
+    };
+}
+
+/**
+ * Records sessions completed offline (queued by the client until it reconnects).
+ * @route POST /api/session/offline-sync
+ */
+router.post('/offline-sync', authMiddleware, async (req, res) => {
+    const { sessions } = req.body;
+    if (!Array.isArray(sessions) || sessions.length === 0 || sessions.length > OFFLINE_SYNC_MAX_SESSIONS) {
+        return res.status(400).json({ error: `sessions must be an array of 1-${OFFLINE_SYNC_MAX_SESSIONS} offline sessions` });
+    }
+
+    const results = [];
+    // One at a time: each result is its own write transaction
+    for (const offline of sessions) {
+        try {
+            results.push(await syncOfflineSession(req.user.id, offline));
+        } catch (err) {
+            console.error('[Session] Failed to sync offline session:', err);
+            results.push({ clientSessionId: offline && offline.clientSessionId, error: 'Sync failed', retry: true });
+        }
+    }
+    console.log(`[Session] Synced ${results.filter(r => r.created).length}/${sessions.length} offline sessions for user ${req.user.id}`);
+    res.json({ results });
+});
+
+/**
+ * Get user's assessment history, newest first, one page at a time.
+ * Pages are keyset-paginated on (createdAt, id) so each page is a range scan
+ * of the (userId, createdAt, id) index, however deep the client has scrolled.
+ * @route GET /api/session/history?limit=&cursor=&fields=
  */
 router.get('/history', authMiddleware, async (req, res) => {
+    const limit = Math.min(Math.max(parseInt(req.query.limit) || HISTORY_DEFAULT_LIMIT, 1), HISTORY_MAX_LIMIT);
+
+    const where = { userId: req.user.id };
+    if (req.query.cursor) {
+        const cursor = decodeHistoryCursor(req.query.cursor);
+        if (!cursor) {
+            return res.status(400).json({ error: 'Invalid cursor' });
+        }
+        where[Op.or] = [
+            { createdAt: { [Op.lt]: cursor.createdAt } },
+            { createdAt: cursor.createdAt, id: { [Op.lt]: cursor.id } }
+        ];
+    }
+
+    // Optional projection; the cursor columns are always selected
+    let attributes;
+    if (req.query.fields) {
+        const requested = String(req.query.fields).split(',').map(f => f.trim()).filter(f => HISTORY_FIELDS.has(f));
+        attributes = [...new Set([...requested, 'id', 'createdAt'])];
+    }
+
     try {
-        const history = await Session.findAll({
-            where: { userId: req.user.id },
-            order: [['createdAt', 'DESC']],
-            limit: 50 // Limit to last 50 sessions
+        // One extra row tells us whether another page exists
+        const rows = await Session.findAll({
+            where,
+            attributes,
+            order: [['createdAt', 'DESC'], ['id', 'DESC']],
+            limit: limit + 1
         });
-        res.json({ history });
+        const history = rows.slice(0, limit);
+        const nextCursor = rows.length > limit ? encodeHistoryCursor(history[history.length - 1]) : null;
+        res.json({ history, nextCursor });
     } catch (err) {
         console.error('Failed to fetch history:', err);
         res.status(500).json({ error: 'Failed to fetch history' });
@@ -308,42 +735,11 @@ router.get('/history', authMiddleware, async (req, res) => {
  */
 router.get('/weak-areas', authMiddleware, async (req, res) => {
     try {
-        const user = await User.findByPk(req.user.id);
-        if (user.sessionsCompleted < 10) {
-            return res.json({
-                eligible: false,
-                message: `Complete ${10 - user.sessionsCompleted} more sessions to unlock Weak Area analysis.`
-            });
+        const profile = await profileCache.get(req.user.id);
+        if (!profile) {
+            return res.status(404).json({ error: 'User not found' });
         }
-
-        // Find topics with average accuracy < 60%
-        // We'll verify raw sessions for this logic
-        const sessions = await Session.findAll({
-            where: { userId: req.user.id }
-        });
-
-        const topicStats = {};
-        sessions.forEach(s => {
-            if (!topicStats[s.topicName]) {
-                topicStats[s.topicName] = { total: 0, accuracySum: 0, count: 0 };
-            }
-            topicStats[s.topicName].count++;
-            topicStats[s.topicName].accuracySum += s.accuracy;
-        });
-
-        const weakAreas = [];
-        for (const [name, stats] of Object.entries(topicStats)) {
-            const avg = stats.accuracySum / stats.count;
-            if (avg < 60) {
-                weakAreas.push({ name, accuracy: Math.round(avg), count: stats.count });
-            }
-        }
-
-        res.json({
-            eligible: true,
-            weakAreas: weakAreas.sort((a, b) => a.accuracy - b.accuracy)
-        });
-
+        res.json(await topicStats.getWeakAreas(req.user.id, profile.stats.sessionsCompleted));
     } catch (err) {
         console.error('Failed to fetch weak areas:', err);
         res.status(500).json({ error: 'Failed to analyze weak areas' });
@@ -0,0 +1,339 @@
+"""
+Question bank compiler and deduplicator.
+
+Merges the compiled fallback bank (data/fallback/) with exported
+AI-generated questions (data/generated/, written by
+`npm run export:questions`), removes exact and near-duplicate questions, and
+writes a content-hashed bank in the same artifact layout the server loads
+(one JSON file per category + index.json). `npm run build:bank` runs it right
+after compiling data/fallbackQuestionBank.js, so the deduplicated bank is
+rebuilt from its sources every time.
+
+Near-duplicates are found with MinHash signatures over word shingles and
+locality-sensitive hashing (banding), so only candidate pairs that share an
+LSH bucket are compared instead of all O(n^2) pairs. By default two questions
+are only merged when they also use the same numbers, since "first 10 natural
+numbers" and "first 20 natural numbers" are different exercises.
+
+Usage:
+    npm run export:questions && npm run build:bank
+    python scripts/bank_dedupe.py --generated extra.jsonl --out /tmp/bank
+
+Generated inputs may be JSON Lines (one question per line), a JSON array, or
+a JSON object with a "questions" array. Each question needs "category",
+"question", "options" and "correctOptionIndex"; "solution" and "difficulty"
+are optional. numpy is used for signatures when installed.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import unicodedata
+
+try:
+    import numpy as np
+except ImportError:  # Pure-Python signatures are slower but produce identical results
+    np = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BANK_DIR = os.path.join(ROOT, 'data', 'fallback')
+DEFAULT_GENERATED_DIR = os.path.join(ROOT, 'data', 'generated')
+DIFFICULTIES = ('easy', 'medium', 'hard')
+
+MERSENNE_PRIME = (1 << 31) - 1
+NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+TOKEN_RE = re.compile(r'[a-z0-9]+(?:\.[0-9]+)?|[^\sa-z0-9]')
+
+
+def slugify(category):
+    """Returns the artifact file stem for a category (matches utils/fallbackBank.js)."""
+    return re.sub(r'[^a-z0-9]+', '-', category.lower()).strip('-')
+
+
+def question_id(question):
+    """Returns the 16-hex content hash used as the question id (matches utils/fallbackBank.js)."""
+    payload = question['question'].strip() + '\n' + '\n'.join(question['options'])
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def normalize(text):
+    """Returns text folded for comparison: NFKC, lowercase, single-spaced."""
+    text = unicodedata.normalize('NFKC', text).lower()
+    return ' '.join(text.split())
+
+
+def shingles(text, size):
+    """Returns the set of word n-grams of the normalized text."""
+    tokens = TOKEN_RE.findall(text)
+    if len(tokens) < size:
+        return {' '.join(tokens)}
+    return {' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+def shingle_hashes(shingle_set):
+    """Returns stable 31-bit hashes of shingles (independent of PYTHONHASHSEED)."""
+    return [
+        int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'little') % MERSENNE_PRIME
+        for s in shingle_set
+    ]
+
+
+class MinHasher:
+    """Computes MinHash signatures with universal hashes (a*x + b) mod p."""
+
+    def __init__(self, num_perm, seed=1):
+        rng = hashlib.sha256(str(seed).encode()).digest()
+        params = []
+        counter = 0
+        while len(params) < num_perm:
+            block = hashlib.sha256(rng + counter.to_bytes(4, 'little')).digest()
+            counter += 1
+            a = int.from_bytes(block[:4], 'little') % (MERSENNE_PRIME - 1) + 1
+            b = int.from_bytes(block[4:8], 'little') % MERSENNE_PRIME
+            params.append((a, b))
+        self.params = params
+        if np is not None:
+            self.a = np.array([a for a, _ in params], dtype=np.uint64)
+            self.b = np.array([b for _, b in params], dtype=np.uint64)
+
+    def signature(self, hashes):
+        """Returns the MinHash signature (tuple of ints) for a list of shingle hashes."""
+        if np is not None:
+            x = np.array(hashes, dtype=np.uint64)[:, None]
+            return tuple(((x * self.a + self.b) % MERSENNE_PRIME).min(axis=0).tolist())
+        return tuple(min((a * h + b) % MERSENNE_PRIME for h in hashes) for a, b in self.params)
+
+
+class UnionFind:
+    """Disjoint sets over question indices."""
+
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, i):
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i, j):
+        ri, rj = self.find(i), self.find(j)
+        if ri != rj:
+            # Keep the lower index as root so the earliest (bank-first) question survives
+            self.parent[max(ri, rj)] = min(ri, rj)
+
+
+def load_bank(bank_dir):
+    """Returns questions from the compiled bank, each tagged with category and difficulty."""
+    with open(os.path.join(bank_dir, 'index.json'), encoding='utf-8') as f:
+        manifest = json.load(f)
+    questions = []
+    for category, entry in manifest['categories'].items():
+        with open(os.path.join(bank_dir, entry['file']), encoding='utf-8') as f:
+            compiled = json.load(f)
+        for difficulty, bucket in compiled['buckets'].items():
+            for q in bucket:
+                questions.append(dict(q, category=category, difficulty=difficulty, source='bank'))
+    return manifest.get('defaultCategory', 'General Aptitude'), questions
+
+
+def default_generated():
+    """Returns the export files in data/generated/, oldest name first."""
+    if not os.path.isdir(DEFAULT_GENERATED_DIR):
+        return []
+    return [
+        os.path.join(DEFAULT_GENERATED_DIR, name)
+        for name in sorted(os.listdir(DEFAULT_GENERATED_DIR))
+        if name.endswith(('.json', '.jsonl'))
+    ]
+
+
+def read_generated(path):
+    """Yields raw question dicts from a JSON, JSON-array or JSON Lines file."""
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        data = None
+    if isinstance(data, list):
+        yield from data
+        return
+    if isinstance(data, dict):
+        yield from (data['questions'] if isinstance(data.get('questions'), list) else [data])
+        return
+    for line_no, line in enumerate(text.splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            print(f"Skipping {path}:{line_no}: {e}", file=sys.stderr)
+
+
+def clean_generated(item):
+    """Returns a validated question dict, or None if the item cannot be served."""
+    if not isinstance(item, dict):
+        return None
+    question, options = item.get('question'), item.get('options')
+    answer, category = item.get('correctOptionIndex'), item.get('category')
+    if not isinstance(question, str) or not question.strip() or not isinstance(category, str):
+        return None
+    if not isinstance(options, list) or len(options) < 2 or not all(isinstance(o, str) for o in options):
+        return None
+    if not isinstance(answer, int) or isinstance(answer, bool) or not 0 <= answer < len(options):
+        return None
+    difficulty = item.get('difficulty') if item.get('difficulty') in DIFFICULTIES else 'medium'
+    return {
+        'question': question.strip(),
+        'options': options,
+        'correctOptionIndex': answer,
+        'solution': item.get('solution') or '',
+        'category': category,
+        'difficulty': difficulty,
+        'source': 'generated',
+    }
+
+
+def jaccard(a, b):
+    """Returns |a & b| / |a | b|."""
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def dedupe_category(questions, hasher, bands, threshold, shingle_size, match_numbers):
+    """Returns (kept questions, exact duplicates removed, near duplicates removed) for one category."""
+    # Pass 1: exact duplicates after normalization
+    seen, unique, exact = set(), [], 0
+    for q in questions:
+        key = normalize(q['question']) + '\x1f' + '\x1f'.join(normalize(o) for o in q['options'])
+        if key in seen:
+            exact += 1
+            continue
+        seen.add(key)
+        unique.append(q)
+
+    # Pass 2: MinHash + LSH banding; only items sharing a band bucket are compared
+    texts = [normalize(q['question']) for q in unique]
+    sets = [shingles(t, shingle_size) for t in texts]
+    numbers = [tuple(sorted(NUMBER_RE.findall(t))) for t in texts]
+    rows = len(hasher.params) // bands
+    buckets = {}
+    for idx, shingle_set in enumerate(sets):
+        sig = hasher.signature(shingle_hashes(shingle_set))
+        for band in range(bands):
+            key = (band, sig[band * rows:(band + 1) * rows])
+            buckets.setdefault(key, []).append(idx)
+
+    uf = UnionFind(len(unique))
+    checked = set()
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        for pos, i in enumerate(members):
+            for j in members[pos + 1:]:
+                if (i, j) in checked:
+                    continue
+                checked.add((i, j))
+                if match_numbers and numbers[i] != numbers[j]:
+                    continue
+                if jaccard(sets[i], sets[j]) >= threshold:
+                    uf.union(i, j)
+
+    kept = [q for idx, q in enumerate(unique) if uf.find(idx) == idx]
+    return kept, exact, len(unique) - len(kept)
+
+
+def write_bank(out_dir, default_category, by_category, stats):
+    """Writes per-category artifacts and index.json in the server's format."""
+    os.makedirs(out_dir, exist_ok=True)
+    for name in os.listdir(out_dir):
+        if name.endswith('.json'):
+            os.remove(os.path.join(out_dir, name))
+
+    manifest = {'version': 1, 'defaultCategory': default_category, 'categories': {}}
+    all_ids = []
+    for category in by_category:
+        buckets = {}
+        for q in by_category[category]:
+            qid = question_id(q)
+            all_ids.append(qid)
+            buckets.setdefault(q['difficulty'], []).append({
+                'id': qid,
+                'question': q['question'],
+                'options': q['options'],
+                'correctOptionIndex': q['correctOptionIndex'],
+                'solution': q['solution'],
+            })
+        file_name = slugify(category) + '.json'
+        with open(os.path.join(out_dir, file_name), 'w', encoding='utf-8') as f:
+            json.dump({'category': category, 'buckets': buckets}, f, ensure_ascii=False, separators=(',', ':'))
+        manifest['categories'][category] = {
+            'file': file_name,
+            'counts': {d: len(b) for d, b in buckets.items()},
+        }
+
+    manifest['contentHash'] = hashlib.sha1('\n'.join(sorted(all_ids)).encode('utf-8')).hexdigest()
+    manifest['dedupe'] = stats
+    with open(os.path.join(out_dir, 'index.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Merge and deduplicate the fallback question bank.')
+    parser.add_argument('--bank', default=DEFAULT_BANK_DIR, help='Compiled bank directory to read')
+    parser.add_argument('--generated', nargs='*', default=None,
+                        help='Generated question exports (JSON or JSONL; default: data/generated/*)')
+    parser.add_argument('--out', default=DEFAULT_BANK_DIR, help='Directory to write the deduplicated bank')
+    parser.add_argument('--threshold', type=float, default=0.8, help='Jaccard similarity treated as duplicate')
+    parser.add_argument('--num-perm', type=int, default=128, help='MinHash permutations')
+    parser.add_argument('--bands', type=int, default=16, help='LSH bands (must divide --num-perm)')
+    parser.add_argument('--shingle-size', type=int, default=3, help='Words per shingle')
+    parser.add_argument('--ignore-numbers', action='store_true', help='Merge near-duplicates even if their numbers differ')
+    args = parser.parse_args()
+
+    if args.num_perm % args.bands:
+        parser.error('--bands must divide --num-perm')
+
+    default_category, questions = load_bank(args.bank)
+    bank_count = len(questions)
+    rejected = 0
+    for path in default_generated() if args.generated is None else args.generated:
+        for item in read_generated(path):
+            q = clean_generated(item)
+            if q is None:
+                rejected += 1
+            else:
+                questions.append(q)
+    print(f"Loaded {bank_count} bank + {len(questions) - bank_count} generated questions ({rejected} invalid skipped)")
+
+    # Bank questions come first, so they win over generated near-duplicates
+    by_category = {}
+    for q in questions:
+        by_category.setdefault(q['category'], []).append(q)
+
+    hasher = MinHasher(args.num_perm)
+    totals = {'input': len(questions), 'exact': 0, 'near': 0}
+    for category in by_category:
+        kept, exact, near = dedupe_category(
+            by_category[category], hasher, args.bands, args.threshold,
+            args.shingle_size, not args.ignore_numbers,
+        )
+        by_category[category] = kept
+        totals['exact'] += exact
+        totals['near'] += near
+        if exact or near:
+            print(f"  {category}: {len(kept)} kept, {exact} exact and {near} near duplicates removed")
+    totals['output'] = sum(len(v) for v in by_category.values())
+
+    manifest = write_bank(args.out, default_category, by_category, totals)
+    print(f"Wrote {totals['output']} questions in {len(manifest['categories'])} categories to {args.out} "
+          f"(content hash {manifest['contentHash'][:12]})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+/**
+ * Password Hashing Benchmark
+ *
+ * Measures login password checks per second (bcrypt.compare at the
+ * production cost factor) for different worker pool sizes, alongside the
+ * event loop delay seen by the main thread. The "inline" row is the old
+ * behaviour of comparing on the request thread.
+ *
+ * Usage: npm run bench:hash [-- --logins 200 --sizes 1,2,4,8]
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+const os = require('os');
+const bcrypt = require('bcryptjs');
+const { HashPool } = require('../utils/passwordHasher');
+
+const ROUNDS = 10;
+const PROBE_INTERVAL_MS = 5;
+
+function parseArgs() {
+    const args = process.argv.slice(2);
+    const option = (name, fallback) => {
+        const i = args.indexOf(`--${name}`);
+        return i === -1 ? fallback : args[i + 1];
+    };
+    const maxSize = os.cpus().length;
+    const defaultSizes = [1, 2, 4, 8, 16].filter(n => n <= maxSize);
+    return {
+        logins: parseInt(option('logins', '200')),
+        sizes: option('sizes', defaultSizes.join(',')).split(',').map(Number)
+    };
+}
+
+/**
+ * Runs `logins` concurrent password checks and reports throughput and loop delay.
+ * @param {Function} compare - (password, hash) => Promise<boolean>.
+ * @param {number} logins - Number of checks.
+ * @param {string} passwordHash - Hash to check against.
+ * @returns {Promise<Object>} { perSecond, p99DelayMs, maxDelayMs }.
+ */
+async function measure(compare, logins, passwordHash) {
+    // A timer that should fire every PROBE_INTERVAL_MS; how late it runs is the
+    // delay any concurrent request would see
+    const delays = [];
+    let expected = Date.now() + PROBE_INTERVAL_MS;
+    const probe = setInterval(() => {
+        const now = Date.now();
+        delays.push(Math.max(0, now - expected));
+        expected = now + PROBE_INTERVAL_MS;
+    }, PROBE_INTERVAL_MS);
+
+    const started = process.hrtime.bigint();
+    await Promise.all(Array.from({ length: logins }, () => compare('correct horse battery staple', passwordHash)));
+    const seconds = Number(process.hrtime.bigint() - started) / 1e9;
+    clearInterval(probe);
+    // Include the stall (if any) between the last probe and the end of the run
+    delays.push(Math.max(0, Date.now() - expected));
+
+    delays.sort((a, b) => a - b);
+    return {
+        perSecond: logins / seconds,
+        p99DelayMs: delays[Math.min(delays.length - 1, Math.floor(delays.length * 0.99))],
+        maxDelayMs: delays[delays.length - 1]
+    };
+}
+
+async function main() {
+    const { logins, sizes } = parseArgs();
+    const passwordHash = bcrypt.hashSync('correct horse battery staple', ROUNDS);
+    console.log(`bcrypt cost ${ROUNDS}, ${logins} concurrent logins, ${os.cpus().length} CPUs\n`);
+
+    const rows = [];
+    const inline = await measure((p, h) => bcrypt.compare(p, h), logins, passwordHash);
+    rows.push({ pool: 'inline', ...inline });
+
+    for (const threads of sizes) {
+        const pool = new HashPool({ threads, maxQueue: Infinity });
+        // Start the threads before timing
+        await Promise.all(Array.from({ length: threads }, () => pool.run('compare', ['warmup', passwordHash])));
+        const result = await measure((p, h) => pool.run('compare', [p, h]), logins, passwordHash);
+        rows.push({ pool: `${threads} threads`, ...result });
+        await pool.close();
+    }
+
+    console.table(rows.map(r => ({
+        pool: r.pool,
+        'logins/sec': r.perSecond.toFixed(1),
+        'loop delay p99 (ms)': r.p99DelayMs.toFixed(1),
+        'loop delay max (ms)': r.maxDelayMs.toFixed(1)
+    })));
+}
+
+main().catch(err => {
+    console.error(err);
+    process.exit(1);
+});
@@ -0,0 +1,52 @@
+/**
+ * Fallback Bank Compiler
+ *
+ * Compiles data/fallbackQuestionBank.js into data/fallback/: one compact JSON
+ * file per category with questions pre-bucketed by difficulty, plus an
+ * index.json manifest. The server loads category files lazily on first use.
+ *
+ * `npm run build:bank` runs this and then scripts/bank_dedupe.py, which merges
+ * in data/generated/ and removes duplicates in place; running this file alone
+ * gives the undeduplicated bank.
+ *
+ * Usage: npm run build:bank
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+const fs = require('fs');
+const path = require('path');
+const { fallbackQuestionBank, defaultFallback } = require('../data/fallbackQuestionBank');
+const { compileCategory, slugify } = require('../utils/fallbackBank');
+
+const OUTPUT_DIR = path.join(__dirname, '..', 'data', 'fallback');
+const DEFAULT_CATEGORY = 'General Aptitude';
+
+/**
+ * Writes every category artifact and the manifest.
+ */
+function build() {
+    fs.rmSync(OUTPUT_DIR, { recursive: true, force: true });
+    fs.mkdirSync(OUTPUT_DIR, { recursive: true });
+
+    const manifest = { version: 1, defaultCategory: DEFAULT_CATEGORY, categories: {} };
+    const sources = { ...fallbackQuestionBank, [DEFAULT_CATEGORY]: defaultFallback };
+
+    for (const [category, questions] of Object.entries(sources)) {
+        const compiled = compileCategory(category, questions);
+        const file = `${slugify(category)}.json`;
+        fs.writeFileSync(path.join(OUTPUT_DIR, file), JSON.stringify(compiled));
+
+        const counts = {};
+        for (const [difficulty, bucket] of Object.entries(compiled.buckets)) {
+            counts[difficulty] = bucket.length;
+        }
+        manifest.categories[category] = { file, counts };
+    }
+
+    fs.writeFileSync(path.join(OUTPUT_DIR, 'index.json'), JSON.stringify(manifest, null, 2) + '\n');
+    console.log(`[Bank Build] Wrote ${Object.keys(manifest.categories).length} categories to ${OUTPUT_DIR}`);
+}
+
+build();
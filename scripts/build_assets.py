@@ -0,0 +1,319 @@
+"""
+Static asset build.
+
+Copies public/ to dist/public/ with the stylesheets and scripts under
+assets/css/ and assets/js/ minified and renamed with a content hash
+(app.js -> app.3f2a1b9c0d.js). It then rewrites the references in the HTML
+pages and the service worker's app shell list to match, and writes .gz
+(and .br, when the brotli package is installed) next to every text file.
+The server serves dist/public/ when it exists: hashed files are cached as
+immutable, and a precompressed variant is sent to clients that accept it.
+
+The minifiers are deliberately conservative. They remove comments and
+redundant whitespace, keep string, template and regex literals intact, and
+keep JavaScript line breaks so automatic semicolon insertion behaves as
+before.
+
+Usage:
+    npm run build:assets
+    python scripts/build_assets.py --src public --out dist/public [--no-brotli]
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+
+try:
+    import brotli
+except ImportError:  # Optional: gzip alone is still served
+    brotli = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FINGERPRINT_DIRS = ("assets/css", "assets/js")
+COMPRESSIBLE = (".html", ".css", ".js", ".json", ".svg", ".txt")
+HASH_LENGTH = 10
+
+# After these characters a "/" starts a regex literal rather than a division
+REGEX_PRECEDERS = set("(,=:[!&|?{};+-*%<>~^")
+REGEX_KEYWORDS = {"return", "typeof", "case", "do", "else", "in", "instanceof", "new", "void", "delete", "throw"}
+
+REFERENCE_RE = re.compile(r"""(\b(?:src|href)=["'])(/?)(assets/[^"'?#]+)""")
+# Quoted absolute asset paths, as listed in the service worker's app shell
+SHELL_REFERENCE_RE = re.compile(r"""(["'])/(assets/[^"'?#]+)(?=["'])""")
+SERVICE_WORKERS = ("sw.js",)
+
+
+def minify_js(source):
+    """Strips comments and indentation from JavaScript, keeping line breaks."""
+    out = []
+    i, n = 0, len(source)
+    last = ""          # Last significant character emitted
+    word = ""          # Identifier or keyword being emitted
+    last_word = ""     # Most recent complete identifier or keyword
+    template_depth = []  # Brace depth at each open ${ ... } inside template literals
+    brace_depth = 0
+
+    # Whitespace is normalized as it is emitted, so literal contents are never touched
+    def emit_newline():
+        while out and out[-1] == " ":
+            out.pop()
+        if out and out[-1] != "\n":
+            out.append("\n")
+
+    def emit_space():
+        if out and out[-1] not in (" ", "\n"):
+            out.append(" ")
+
+    def read_string(quote, start):
+        j = start + 1
+        while j < n and source[j] != quote:
+            j += 2 if source[j] == "\\" else 1
+        return j + 1
+
+    def read_template(start):
+        # Up to the closing backtick or the next ${
+        j = start
+        while j < n:
+            c = source[j]
+            if c == "\\":
+                j += 2
+            elif c == "`":
+                return j + 1, False
+            elif c == "$" and source.startswith("${", j):
+                return j + 2, True
+            else:
+                j += 1
+        return n, False
+
+    def read_regex(start):
+        j, in_class = start + 1, False
+        while j < n:
+            c = source[j]
+            if c == "\\":
+                j += 2
+                continue
+            if c == "[":
+                in_class = True
+            elif c == "]":
+                in_class = False
+            elif c == "/" and not in_class:
+                j += 1
+                while j < n and (source[j].isalnum() or source[j] == "_"):
+                    j += 1  # Flags
+                return j
+            elif c == "\n":
+                return j
+            j += 1
+        return n
+
+    while i < n:
+        c = source[i]
+        if c.isalnum() or c in "_$":
+            word += c
+            out.append(c)
+            last = c
+            i += 1
+            continue
+        if word:
+            last_word, word = word, ""
+
+        if c in "'\"":
+            end = read_string(c, i)
+            out.append(source[i:end])
+            last, i = c, end
+        elif c == "`":
+            end, opened = read_template(i + 1)
+            out.append(source[i:end])
+            if opened:
+                template_depth.append(brace_depth)
+            last, i = "`", end
+        elif c == "}" and template_depth and template_depth[-1] == brace_depth:
+            # End of a ${ ... } expression: continue the template literal
+            template_depth.pop()
+            end, opened = read_template(i + 1)
+            out.append(source[i:end])
+            if opened:
+                template_depth.append(brace_depth)
+            last, i = "`", end
+        elif source.startswith("//", i):
+            end = source.find("\n", i)
+            i = n if end == -1 else end
+        elif source.startswith("/*", i):
+            end = source.find("*/", i + 2)
+            end = n if end == -1 else end + 2
+            # A comment spanning lines still separates statements for ASI
+            if "\n" in source[i:end]:
+                emit_newline()
+            else:
+                emit_space()
+            i = end
+        elif c == "/" and (last == "" or last in REGEX_PRECEDERS or
+                           (last_word in REGEX_KEYWORDS and last.isalnum())):
+            end = read_regex(i)
+            out.append(source[i:end])
+            last, last_word, i = "/", "", end
+        elif c in " \t\r\n":
+            j = i
+            while j < n and source[j] in " \t\r\n":
+                j += 1
+            if "\n" in source[i:j]:
+                emit_newline()
+            else:
+                emit_space()
+            i = j
+        elif source.startswith(("++", "--"), i):
+            out.append(source[i:i + 2])
+            # Postfix ++/-- ends an operand, so a following "/" divides
+            postfix = last != "" and (last in ")]" or (last.isalnum() or last in "_$") and last_word not in REGEX_KEYWORDS)
+            last, last_word, i = (")" if postfix else c), "", i + 2
+        else:
+            if c == "{":
+                brace_depth += 1
+            elif c == "}":
+                brace_depth -= 1
+            out.append(c)
+            last, last_word = c, ""
+            i += 1
+
+    emit_newline()
+    return "".join(out).lstrip("\n")
+
+
+def minify_css(source):
+    """Strips comments and redundant whitespace from a stylesheet."""
+    parts = re.split(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""", source)
+    for k in range(0, len(parts), 2):  # Even parts are outside string literals
+        text = re.sub(r"/\*.*?\*/", "", parts[k], flags=re.S)
+        text = re.sub(r"\s+", " ", text)
+        text = re.sub(r"\s*([{};,>])\s*", r"\1", text)
+        text = re.sub(r":\s+", ":", text)
+        parts[k] = text.replace(";}", "}")
+    return "".join(parts).strip() + "\n"
+
+
+MINIFIERS = {".js": minify_js, ".css": minify_css}
+
+
+def fingerprint(rel_path, data):
+    """Inserts the content hash before the extension."""
+    stem, ext = os.path.splitext(rel_path)
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    return f"{stem}.{digest}{ext}"
+
+
+def rewrite_references(html, manifest):
+    """Points asset references in an HTML page at their fingerprinted names."""
+    def replace(match):
+        prefix, slash, ref = match.groups()
+        return prefix + slash + manifest.get(ref, ref)
+    return REFERENCE_RE.sub(replace, html)
+
+
+def rewrite_shell(script, manifest):
+    """Points the asset paths cached by the service worker at their fingerprinted names."""
+    def replace(match):
+        quote, ref = match.groups()
+        return quote + "/" + manifest.get(ref, ref)
+    return SHELL_REFERENCE_RE.sub(replace, script)
+
+
+def precompress(path, data, use_brotli):
+    """Writes .gz/.br variants when they are smaller than the original."""
+    written = {}
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    if len(gz) < len(data):
+        with open(path + ".gz", "wb") as f:
+            f.write(gz)
+        written["gz"] = len(gz)
+    if use_brotli:
+        br = brotli.compress(data, quality=11)
+        if len(br) < len(data):
+            with open(path + ".br", "wb") as f:
+                f.write(br)
+            written["br"] = len(br)
+    return written
+
+
+def build(src, out, use_brotli):
+    if os.path.abspath(out) in (os.path.abspath(src), ROOT):
+        sys.exit(f"Refusing to write the build into {out}")
+    if os.path.isdir(out):
+        shutil.rmtree(out)
+
+    manifest = {}
+    pages = []
+    workers = []
+    files = []
+    for dirpath, _, filenames in os.walk(src):
+        for name in sorted(filenames):
+            rel = os.path.relpath(os.path.join(dirpath, name), src).replace(os.sep, "/")
+            files.append(rel)
+
+    # Assets first, so pages can be rewritten against the complete manifest
+    for rel in files:
+        ext = os.path.splitext(rel)[1]
+        with open(os.path.join(src, rel), "rb") as f:
+            data = f.read()
+        if ext == ".html":
+            pages.append((rel, data))
+            continue
+        if rel in SERVICE_WORKERS:
+            workers.append((rel, data))
+            continue
+        target = rel
+        if os.path.dirname(rel) in FINGERPRINT_DIRS and ext in MINIFIERS:
+            data = MINIFIERS[ext](data.decode("utf-8")).encode("utf-8")
+            target = fingerprint(rel, data)
+            manifest[rel] = target
+        write_file(out, target, data, use_brotli)
+
+    for rel, data in pages:
+        html = rewrite_references(data.decode("utf-8"), manifest)
+        for ref in REFERENCE_RE.findall(html):
+            if ref[2].startswith(FINGERPRINT_DIRS) and ref[2] not in manifest.values():
+                print(f"  warning: {rel} references missing asset {ref[2]}")
+        write_file(out, rel, html.encode("utf-8"), use_brotli)
+
+    # The shell list changes with the build, so the worker's cache name changes too
+    for rel, data in workers:
+        write_file(out, rel, rewrite_shell(data.decode("utf-8"), manifest).encode("utf-8"), use_brotli)
+
+    with open(os.path.join(out, "asset-manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+def write_file(out, rel, data, use_brotli):
+    path = os.path.join(out, rel)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    if rel.endswith(COMPRESSIBLE):
+        sizes = precompress(path, data, use_brotli)
+        variants = ", ".join(f"{k} {v:,}" for k, v in sizes.items())
+        print(f"  {rel}: {len(data):,} bytes" + (f" ({variants})" if variants else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--src", default=os.path.join(ROOT, "public"), help="source directory (default: public/)")
+    parser.add_argument("--out", default=os.path.join(ROOT, "dist", "public"), help="output directory (default: dist/public/)")
+    parser.add_argument("--no-brotli", action="store_true", help="skip .br variants")
+    args = parser.parse_args()
+
+    use_brotli = brotli is not None and not args.no_brotli
+    if brotli is None and not args.no_brotli:
+        print("brotli is not installed; writing gzip variants only (pip install brotli)")
+
+    manifest = build(args.src, args.out, use_brotli)
+    print(f"Built {len(manifest)} fingerprinted assets into {args.out}")
+
+
+if __name__ == "__main__":
+    main()
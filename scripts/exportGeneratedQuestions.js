@@ -0,0 +1,63 @@
+/**
+ * Generated Question Exporter
+ *
+ * Copies the AI-generated questions cached in the shared question store
+ * (Redis) into data/generated/questions.jsonl, one question per line. The
+ * bank build (`npm run build:bank`) merges that file into the fallback bank
+ * and removes duplicates with scripts/bank_dedupe.py. Questions already in
+ * the file are kept, so repeated exports accumulate rather than overwrite.
+ *
+ * Usage: npm run export:questions [-- --out path/to/questions.jsonl]
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+const fs = require('fs');
+const path = require('path');
+
+// The in-process backend only lives inside a server, so export from the shared store
+process.env.QUESTION_STORE = 'redis';
+const questionStore = require('../utils/questionStore');
+const redisClient = require('../utils/redisClient');
+
+const DEFAULT_OUTPUT = path.join(__dirname, '..', 'data', 'generated', 'questions.jsonl');
+
+/**
+ * Reads the ids already present in an export file.
+ * @param {string} file - JSON Lines file.
+ * @returns {Set<string>} Question ids.
+ */
+function readExistingIds(file) {
+    const ids = new Set();
+    if (!fs.existsSync(file)) return ids;
+    for (const line of fs.readFileSync(file, 'utf8').split('\n')) {
+        if (!line.trim()) continue;
+        try {
+            ids.add(JSON.parse(line).id);
+        } catch (err) {
+            // Malformed lines are reported by bank_dedupe.py
+        }
+    }
+    return ids;
+}
+
+async function main() {
+    const outIndex = process.argv.indexOf('--out');
+    const output = outIndex > -1 ? path.resolve(process.argv[outIndex + 1]) : DEFAULT_OUTPUT;
+
+    const records = await questionStore.exportQuestions();
+    const existing = readExistingIds(output);
+    const fresh = records.filter(r => !existing.has(r.id));
+
+    fs.mkdirSync(path.dirname(output), { recursive: true });
+    fs.appendFileSync(output, fresh.map(r => JSON.stringify(r) + '\n').join(''));
+    console.log(`[Question Export] ${records.length} cached, ${fresh.length} new written to ${output}`);
+}
+
+main()
+    .catch(err => {
+        console.error('[Question Export] Failed:', err);
+        process.exitCode = 1;
+    })
+    .finally(() => redisClient.disconnect().catch(() => {}));
@@ -11,7 +11,9 @@
 const cors = require('cors');
 const dotenv = require('dotenv');
 const express = require('express');
+const fs = require('fs');
 const path = require('path');
+const staticAssets = require('./middleware/staticAssets');
 
 dotenv.config();
 
@@ -24,26 +26,62 @@ console.log('📦 Registering middleware...');
 app.use(cors());
 app.use(express.json());
 
-// Serve static files from public directory
-console.log('📂 Serving static files from "public"...');
-app.use(express.static(path.join(__dirname, 'public')));
+// Serve static files: the fingerprinted, precompressed build when there is one
+// (npm run build:assets), otherwise the sources in public/
+const BUILT_ASSETS_DIR = path.join(__dirname, 'dist', 'public');
+const useBuiltAssets = process.env.STATIC_ASSETS !== 'source' && fs.existsSync(BUILT_ASSETS_DIR);
+const STATIC_DIR = useBuiltAssets ? BUILT_ASSETS_DIR : path.join(__dirname, 'public');
+if (useBuiltAssets) {
+  console.log('📂 Serving built static files from "dist/public" (rerun npm run build:assets after editing public/)...');
+  app.use(staticAssets(BUILT_ASSETS_DIR));
+} else {
+  console.log('📂 Serving static files from "public"...');
+  app.use(express.static(STATIC_DIR));
+}
 
 // Import route modules
 const authRoutes = require('./routes/auth');
+const bootstrapRoutes = require('./routes/bootstrap');
 const milestoneRoutes = require('./routes/milestones');
 const sessionRoutes = require('./routes/session');
+const aiGenerator = require('./utils/aiGenerator');
+const { EmailWorker } = require('./utils/emailQueue');
+const geminiClient = require('./utils/geminiClient');
+const authMiddleware = require('./middleware/auth');
+const otpStore = require('./utils/otpStore');
+const passwordHasher = require('./utils/passwordHasher');
+const profileCache = require('./utils/profileCache');
+const questionStore = require('./utils/questionStore');
+const sessionStore = require('./utils/sessionStore');
 
 // API routes
 app.use('/api/auth', authRoutes);
+app.use('/api/bootstrap', bootstrapRoutes);
 app.use('/api/milestones', milestoneRoutes);
 app.use('/api/session', sessionRoutes);
 
+// Drain the outbound email queue in-process unless a dedicated worker runs it
+const emailWorker = process.env.EMAIL_WORKER === 'external' ? null : new EmailWorker();
+
 /**
  * Health check endpoint to verify server status.
  * @route GET /api/health
  */
 app.get('/api/health', (req, res) => {
-  res.json({ status: 'ok', version: '0.2.0', message: 'AptiRise API is running' });
+  res.json({
+    status: 'ok',
+    version: '0.2.0',
+    message: 'AptiRise API is running',
+    upstream: geminiClient.getBreakerState(),
+    questionCache: questionStore.getStats(),
+    feedbackCache: aiGenerator.getFeedbackCacheStats(),
+    sessions: sessionStore.getStats(),
+    otp: otpStore.getStats(),
+    passwordHashing: passwordHasher.getStats(),
+    tokenCache: authMiddleware.getTokenCacheStats(),
+    profileCache: profileCache.getStats(),
+    email: emailWorker ? emailWorker.getStats() : { worker: 'external' }
+  });
 });
 
 /**
@@ -51,15 +89,30 @@ app.get('/api/health', (req, res) => {
  * @route GET *
  */
 app.get('*', (req, res) => {
-  res.sendFile(path.join(__dirname, 'public', 'index.html'));
+  // A missing stylesheet or script is a 404, not the HTML page
+  if (req.path.startsWith('/assets/')) return res.status(404).end();
+  // The built index.html references the fingerprinted asset names
+  res.sendFile(path.join(STATIC_DIR, 'index.html'));
 });
 
 // Database synchronization
+const cluster = require('cluster');
 const { sequelize } = require('./models/index');
 
-// Sync database and start server
-sequelize.sync().then(() => {
-  app.listen(port, () => {
+/**
+ * Starts listening and closes the server gracefully on SIGTERM or SIGINT,
+ * letting in-flight requests finish before the process exits.
+ */
+function startServer() {
+  if (emailWorker) {
+    emailWorker.start().catch(err => console.error('[Email Queue] Worker failed to start:', err));
+  }
+
+  const server = app.listen(port, () => {
+    if (cluster.isWorker) {
+      console.log(`[Cluster] Worker ${process.pid} listening on port ${port}`);
+      return;
+    }
     console.log('--------------------------------------------');
     console.log('🚀 Starting AptiRise Server...');
     console.log('--------------------------------------------');
@@ -68,9 +121,30 @@ sequelize.sync().then(() => {
     console.log(`   API:     http://localhost:${port}/api`);
     console.log(`\n📚 Happy learning!\n`);
   });
-}).catch(err => {
-  console.error('Unable to connect to the database:', err);
-});
+
+  // Ctrl-C reaches cluster workers directly, so SIGINT drains the same way as SIGTERM
+  let closing = false;
+  const drain = () => {
+    if (closing) return;
+    closing = true;
+    if (emailWorker) emailWorker.stop();
+    server.close(() => process.exit(0));
+    // Idle keep-alive sockets would otherwise hold the server open
+    if (server.closeIdleConnections) server.closeIdleConnections();
+  };
+  process.on('SIGTERM', drain);
+  process.on('SIGINT', drain);
+}
+
+if (cluster.isWorker) {
+  // The cluster primary (cluster.js) has already synced the schema
+  startServer();
+} else {
+  // Sync database and start server
+  sequelize.sync().then(startServer).catch(err => {
+    console.error('Unable to connect to the database:', err);
+  });
+}
 
 // Server configuration confirmed
 
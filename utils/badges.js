@@ -0,0 +1,69 @@
+/**
+ * Badge Tiers
+ *
+ * XP thresholds for the gamification badges and helpers that place a user's
+ * XP within them.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+// Badge tiers with updated XP thresholds
+// Iron: 500 XP target, Silver: 2000 XP, Gold: 4500 XP, Elite: 7000 XP, Expert: 9500 XP, Master: 12000 XP
+const BADGE_TIERS = [
+    { name: 'Iron', minXP: 0, maxXP: 499 },
+    { name: 'Silver', minXP: 500, maxXP: 1999 },
+    { name: 'Gold', minXP: 2000, maxXP: 4499 },
+    { name: 'Elite', minXP: 4500, maxXP: 6999 },
+    { name: 'Expert', minXP: 7000, maxXP: 9499 },
+    { name: 'Master', minXP: 9500, maxXP: Infinity }
+];
+
+/**
+ * Determines the badge name based on accumulated XP.
+ * @param {number} xp - The total experience points of the user.
+ * @returns {string} The name of the earned badge tier.
+ */
+function getBadge(xp) {
+    for (const tier of BADGE_TIERS) {
+        if (xp >= tier.minXP && xp <= tier.maxXP) return tier.name;
+    }
+    return 'Iron';
+}
+
+/**
+ * Gets the next badge info for progress display.
+ * @param {number} xp - Current XP
+ * @returns {object} Next badge name and XP required
+ */
+function getNextBadgeInfo(xp) {
+    const nextTier = BADGE_TIERS.find(t => t.minXP > xp);
+    if (nextTier) {
+        return {
+            nextBadge: nextTier.name,
+            xpToNext: nextTier.minXP - xp
+        };
+    }
+    return { nextBadge: 'Master', xpToNext: 0 };
+}
+
+/**
+ * Computes progress within the current tier for the badge progress bar.
+ * @param {number} xp - Current XP
+ * @returns {object} Current badge, XP into the tier, tier size and next badge.
+ */
+function getBadgeProgress(xp) {
+    const current = getBadge(xp);
+    const { nextBadge, xpToNext } = getNextBadgeInfo(xp);
+    const currentTier = BADGE_TIERS.find(t => t.name === current);
+    return {
+        current,
+        currentXP: xp,
+        xpInCurrentTier: xp - currentTier.minXP,
+        tierRange: currentTier.maxXP === Infinity ? 10000 : (currentTier.maxXP - currentTier.minXP + 1), // +1 because inclusive
+        nextBadge,
+        xpToNext
+    };
+}
+
+module.exports = { BADGE_TIERS, getBadge, getNextBadgeInfo, getBadgeProgress };
@@ -0,0 +1,250 @@
+/**
+ * Outbound Email Queue
+ *
+ * Durable Redis-backed queue for transactional email, so requests return as
+ * soon as a message is queued instead of waiting on SMTP.
+ *
+ *   email:queue                 LIST  jobs waiting to be sent
+ *   email:processing:<worker>   LIST  jobs a worker has claimed (BLMOVE from the queue)
+ *   email:retry                 ZSET  failed jobs, scored by when to try again
+ *   email:dead                  LIST  jobs that exhausted their attempts (secrets
+ *                                     redacted, capped and expiring)
+ *
+ * Each worker heartbeats `email:worker:<id>`; jobs claimed by a worker whose
+ * heartbeat has expired are returned to the queue. When Redis is unavailable
+ * the message is sent inline instead.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+const crypto = require('crypto');
+const os = require('os');
+require('dotenv').config();
+const redisClient = require('./redisClient');
+const { sendOTP } = require('./emailService');
+
+const QUEUE_KEY = 'email:queue';
+const RETRY_KEY = 'email:retry';
+const DEAD_KEY = 'email:dead';
+const WORKERS_KEY = 'email:workers';
+
+const MAX_ATTEMPTS = parseInt(process.env.EMAIL_MAX_ATTEMPTS) || 5;
+const DEAD_LETTER_MAX = parseInt(process.env.EMAIL_DEAD_LETTER_MAX) || 1000;
+const DEAD_LETTER_TTL_SECONDS = parseInt(process.env.EMAIL_DEAD_LETTER_TTL_SECONDS) || 7 * 24 * 60 * 60;
+// OTPs are valid for 5 minutes (routes/auth.js); mailing one later is pointless
+const OTP_TTL_MS = 300 * 1000;
+const RETRY_BASE_MS = 2000;
+const HEARTBEAT_SECONDS = 30;
+const POLL_INTERVAL_MS = 1000;
+
+// Senders per job type; jobs carry only the data needed to render the message
+const senders = {
+    otp: ({ to, otp, username }) => sendOTP(to, otp, username)
+};
+
+// Message fields that must not outlive the job
+const SECRET_FIELDS = {
+    otp: ['otp']
+};
+
+/**
+ * Copies a job with its secret fields removed, for the dead-letter list.
+ * @param {Object} job - Failed job.
+ * @returns {Object} Redacted job.
+ */
+function redact(job) {
+    const data = { ...job.data };
+    (SECRET_FIELDS[job.type] || []).forEach(field => {
+        if (field in data) data[field] = '[redacted]';
+    });
+    return { ...job, data };
+}
+
+/**
+ * Sends a job immediately (used by the worker and as the no-Redis fallback).
+ * @param {Object} job - Queued job.
+ * @returns {Promise<void>}
+ */
+function deliver(job) {
+    const send = senders[job.type];
+    if (!send) return Promise.reject(new Error(`Unknown email job type: ${job.type}`));
+    return send(job.data);
+}
+
+/**
+ * Queues an email, or sends it inline when Redis cannot take it.
+ * @param {string} type - Job type (key of `senders`).
+ * @param {Object} data - Message parameters.
+ * @param {Object} [options] - `ttlMs`: drop the job instead of sending it after this long.
+ * @returns {Promise<boolean>} True if queued, false if it was sent inline.
+ */
+async function enqueue(type, data, { ttlMs } = {}) {
+    const queuedAt = Date.now();
+    const job = { id: crypto.randomUUID(), type, data, attempts: 0, queuedAt, ...(ttlMs && { expiresAt: queuedAt + ttlMs }) };
+    if (redisClient.isReady) {
+        try {
+            await redisClient.lPush(QUEUE_KEY, JSON.stringify(job));
+            return true;
+        } catch (err) {
+            console.warn('[Email Queue] Failed to queue email, sending inline:', err.message);
+        }
+    }
+    await deliver(job);
+    return false;
+}
+
+/**
+ * Queues a 2-step verification OTP email.
+ * @param {string} to - Recipient email address.
+ * @param {string} otp - The 6-digit OTP code.
+ * @param {string} username - User's display name.
+ * @returns {Promise<boolean>} True if queued, false if it was sent inline.
+ */
+function enqueueOTP(to, otp, username) {
+    return enqueue('otp', { to, otp, username }, { ttlMs: OTP_TTL_MS });
+}
+
+/**
+ * Queue consumer. Claims jobs with BLMOVE on a dedicated connection (blocking
+ * commands would stall the shared client), sends them through the pooled
+ * transport and schedules failures for retry with exponential backoff.
+ */
+class EmailWorker {
+    constructor({ concurrency = parseInt(process.env.EMAIL_WORKER_CONCURRENCY) || 2 } = {}) {
+        this.id = `${os.hostname()}:${process.pid}`;
+        this.processingKey = `email:processing:${this.id}`;
+        this.concurrency = concurrency;
+        this.running = false;
+        this.stats = { sent: 0, retried: 0, failed: 0, expired: 0 };
+    }
+
+    async start() {
+        if (this.running) return;
+        this.running = true;
+        this.blocking = redisClient.duplicate();
+        this.blocking.on('error', (err) => console.error('[Email Queue] Connection error', err.message));
+        await this.blocking.connect();
+
+        await this.heartbeat();
+        this.timer = setInterval(() => {
+            this.heartbeat()
+                .then(() => this.promoteRetries())
+                .then(() => this.recoverAbandoned())
+                .catch(err => console.error('[Email Queue] Maintenance failed:', err.message));
+        }, POLL_INTERVAL_MS);
+        this.timer.unref();
+
+        this.loops = Array.from({ length: this.concurrency }, () => this.consume());
+        console.log(`[Email Queue] Worker ${this.id} started (concurrency ${this.concurrency})`);
+    }
+
+    async stop() {
+        this.running = false;
+        clearInterval(this.timer);
+        if (this.blocking) await this.blocking.disconnect().catch(() => {});
+        await Promise.allSettled(this.loops || []);
+    }
+
+    async heartbeat() {
+        await redisClient.set(`email:worker:${this.id}`, '1', { EX: HEARTBEAT_SECONDS });
+        await redisClient.sAdd(WORKERS_KEY, this.id);
+    }
+
+    async consume() {
+        while (this.running) {
+            let raw;
+            try {
+                // Claims queue up on the blocking connection; sends still overlap
+                raw = await this.blocking.blMove(QUEUE_KEY, this.processingKey, 'RIGHT', 'LEFT', 5);
+            } catch (err) {
+                if (!this.running) return;
+                console.error('[Email Queue] Failed to claim job:', err.message);
+                await new Promise(resolve => setTimeout(resolve, POLL_INTERVAL_MS));
+                continue;
+            }
+            if (!raw) continue;
+            try {
+                await this.process(raw);
+            } catch (err) {
+                // The job stays in the processing list and is recovered if this worker dies
+                console.error('[Email Queue] Failed to process job:', err.message);
+            }
+        }
+    }
+
+    async process(raw) {
+        const job = JSON.parse(raw);
+        if (job.expiresAt && Date.now() >= job.expiresAt) {
+            this.stats.expired++;
+            console.warn(`[Email Queue] Dropping job ${job.id}: expired before it could be sent`);
+        } else {
+            try {
+                await deliver(job);
+                this.stats.sent++;
+            } catch (err) {
+                await this.fail(job, err);
+            }
+        }
+        await redisClient.lRem(this.processingKey, 1, raw);
+    }
+
+    /**
+     * Schedules a failed job for retry, or dead-letters it once it has run out
+     * of attempts or would only be retried after it expires.
+     */
+    async fail(job, err) {
+        job.attempts++;
+        job.lastError = err.message;
+        const retryAt = Date.now() + RETRY_BASE_MS * 2 ** (job.attempts - 1);
+        if (job.expiresAt && retryAt >= job.expiresAt) {
+            this.stats.expired++;
+            console.warn(`[Email Queue] Dropping job ${job.id}: it would expire before the next attempt`);
+        } else if (job.attempts >= MAX_ATTEMPTS) {
+            this.stats.failed++;
+            console.error(`[Email Queue] Giving up on job ${job.id} after ${job.attempts} attempts`);
+            await redisClient.multi()
+                .lPush(DEAD_KEY, JSON.stringify(redact(job)))
+                .lTrim(DEAD_KEY, 0, DEAD_LETTER_MAX - 1)
+                .expire(DEAD_KEY, DEAD_LETTER_TTL_SECONDS)
+                .exec();
+        } else {
+            this.stats.retried++;
+            await redisClient.zAdd(RETRY_KEY, { score: retryAt, value: JSON.stringify(job) });
+        }
+    }
+
+    /**
+     * Moves retries that are due back onto the queue.
+     */
+    async promoteRetries() {
+        const due = await redisClient.zRangeByScore(RETRY_KEY, 0, Date.now(), { LIMIT: { offset: 0, count: 100 } });
+        for (const raw of due) {
+            // Only the worker that removes the entry requeues it
+            if (await redisClient.zRem(RETRY_KEY, raw)) {
+                await redisClient.lPush(QUEUE_KEY, raw);
+            }
+        }
+    }
+
+    /**
+     * Returns jobs claimed by workers whose heartbeat has expired to the queue.
+     */
+    async recoverAbandoned() {
+        const workers = await redisClient.sMembers(WORKERS_KEY);
+        for (const id of workers) {
+            if (id === this.id || await redisClient.exists(`email:worker:${id}`)) continue;
+            const processingKey = `email:processing:${id}`;
+            let moved = 0;
+            while (await redisClient.lMove(processingKey, QUEUE_KEY, 'RIGHT', 'LEFT')) moved++;
+            await redisClient.sRem(WORKERS_KEY, id);
+            if (moved) console.warn(`[Email Queue] Requeued ${moved} jobs abandoned by worker ${id}`);
+        }
+    }
+
+    getStats() {
+        return { worker: this.id, running: this.running, ...this.stats };
+    }
+}
+
+module.exports = { enqueue, enqueueOTP, EmailWorker };
@@ -2,7 +2,8 @@
  * Email Service Utility
  * 
  * Handles sending transactional emails (OTPs) using Nodemailer.
- * Includes Aptirise branding templates.
+ * Includes Aptirise branding templates. The transport keeps a small pool of
+ * SMTP connections open so consecutive sends skip the handshake.
  */
 
 const nodemailer = require('nodemailer');
@@ -10,27 +11,32 @@ require('dotenv').config();
 
 // Configure SMTP transport with environment variables
 
+const smtpUser = process.env.APTIRISE_SMTP_USER || process.env.APTIRISE_SMTP_EMAIL;
+
 const transporter = nodemailer.createTransport({
     host: process.env.APTIRISE_SMTP_HOST || 'smtp.gmail.com',
     port: process.env.APTIRISE_SMTP_PORT || 587,
     secure: false, // Use TLS
-    auth: {
-        user: process.env.APTIRISE_SMTP_USER || process.env.APTIRISE_SMTP_EMAIL,
+    pool: true,
+    maxConnections: parseInt(process.env.APTIRISE_SMTP_MAX_CONNECTIONS) || 3,
+    // Local SMTP sinks accept unauthenticated mail, so only log in when credentials are set
+    auth: process.env.APTIRISE_SMTP_PASSWORD ? {
+        user: smtpUser,
         pass: process.env.APTIRISE_SMTP_PASSWORD
-    }
+    } : undefined
 });
 
 /**
- * Sends a 2-step verification OTP email.
+ * Builds the 2-step verification OTP email.
  * @param {string} toEmail - Recipient email address
  * @param {string} otp - The 6-digit OTP code
     // Branded email template with Aptirise styling
 
  * @param {string} username - User's display name
- * @returns {Promise<void>}
+ * @returns {Object} Nodemailer message options
  */
-async function sendOTP(toEmail, otp, username) {
-    const mailOptions = {
+function buildOtpEmail(toEmail, otp, username) {
+    return {
         from: `"Aptirise Security" <${process.env.APTIRISE_SMTP_EMAIL}>`,
         to: toEmail,
         subject: 'Your 2-Step Verification Code - Aptirise',
@@ -70,9 +76,18 @@ async function sendOTP(toEmail, otp, username) {
             </div>
         `
     };
+}
 
+/**
+ * Sends a 2-step verification OTP email.
+ * @param {string} toEmail - Recipient email address
+ * @param {string} otp - The 6-digit OTP code
+ * @param {string} username - User's display name
+ * @returns {Promise<void>}
+ */
+async function sendOTP(toEmail, otp, username) {
     try {
-        const info = await transporter.sendMail(mailOptions);
+        const info = await transporter.sendMail(buildOtpEmail(toEmail, otp, username));
         console.log(`[Email] OTP sent to ${toEmail}: ${info.messageId}`);
     } catch (error) {
         console.error('[Email] Failed to send OTP:', error);
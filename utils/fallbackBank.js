@@ -0,0 +1,203 @@
+/**
+ * Fallback Question Bank Loader
+ *
+ * Serves offline questions from the compiled artifacts in data/fallback/
+ * (see scripts/buildFallbackBank.js). Each category file is read on first use
+ * and kept pre-bucketed by difficulty, and sampling uses a partial
+ * Fisher-Yates shuffle that only touches the k items it returns.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+const crypto = require('crypto');
+const fs = require('fs');
+const path = require('path');
+
+const BANK_DIR = process.env.FALLBACK_BANK_DIR || path.join(__dirname, '..', 'data', 'fallback');
+const DEFAULT_CATEGORY = 'General Aptitude';
+// Questions per topic handed to clients for offline practice
+const OFFLINE_SLICE_SIZE = 30;
+
+/**
+ * Converts a category name into an artifact file name stem.
+ * @param {string} category - Topic name.
+ * @returns {string} Lowercase, dash-separated slug.
+ */
+function slugify(category) {
+    return category.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-|-$/g, '');
+}
+
+/**
+ * Content hash identifying a question independent of its position in the bank.
+ * @param {Object} q - Question with `question` and `options`.
+ * @returns {string} 16 hex characters of SHA-1 over the question text and options.
+ */
+function questionId(q) {
+    return crypto.createHash('sha1').update(`${q.question.trim()}\n${q.options.join('\n')}`).digest('hex').slice(0, 16);
+}
+
+/**
+ * Groups a category's questions into difficulty buckets, dropping the fields
+ * implied by the file (category) and bucket (difficulty).
+ * @param {string} category - Topic name.
+ * @param {Array} questions - Source questions.
+ * @returns {Object} Compiled artifact: { category, buckets: { [difficulty]: [...] } }.
+ */
+function compileCategory(category, questions) {
+    const buckets = {};
+    for (const q of questions) {
+        const difficulty = q.difficulty || 'medium';
+        if (!buckets[difficulty]) buckets[difficulty] = [];
+        buckets[difficulty].push({
+            id: q.id || questionId(q),
+            question: q.question,
+            options: q.options,
+            correctOptionIndex: q.correctOptionIndex,
+            solution: q.solution
+        });
+    }
+    return { category, buckets };
+}
+
+// Compiled manifest (null when artifacts are missing and the source module is used instead)
+let manifest;
+
+// Categories loaded so far: { category, buckets, all, byId } where `all` spans every difficulty
+const loadedCategories = new Map();
+
+/**
+ * Reads the artifact manifest once.
+ * @returns {Object|null} Manifest, or null if the bank has not been built.
+ */
+function getManifest() {
+    if (manifest === undefined) {
+        try {
+            manifest = JSON.parse(fs.readFileSync(path.join(BANK_DIR, 'index.json'), 'utf8'));
+        } catch (err) {
+            console.warn('[Fallback Bank] Compiled bank not found, compiling from source (run `npm run build:bank`)');
+            manifest = null;
+        }
+    }
+    return manifest;
+}
+
+/**
+ * Reads (or compiles) a single category.
+ * @param {string} category - Topic name known to the bank.
+ * @returns {Object} Compiled category.
+ */
+function readCategory(category) {
+    const bank = getManifest();
+    if (bank) {
+        const file = bank.categories[category].file;
+        return JSON.parse(fs.readFileSync(path.join(BANK_DIR, file), 'utf8'));
+    }
+    const { fallbackQuestionBank, defaultFallback } = require('../data/fallbackQuestionBank');
+    return compileCategory(category, fallbackQuestionBank[category] || defaultFallback);
+}
+
+/**
+ * Maps a requested topic to the bank category that serves it.
+ * @param {string} category - Requested topic name.
+ * @returns {string} The topic itself, or the default category for unknown topics.
+ */
+function resolveCategory(category) {
+    const bank = getManifest();
+    if (bank) {
+        return bank.categories[category] ? category : bank.defaultCategory;
+    }
+    const { fallbackQuestionBank } = require('../data/fallbackQuestionBank');
+    return fallbackQuestionBank[category] ? category : DEFAULT_CATEGORY;
+}
+
+/**
+ * Returns a loaded category, reading it on first access.
+ * @param {string} category - Requested topic name.
+ * @returns {Object} Loaded category with difficulty buckets and a combined pool.
+ */
+function loadCategory(category) {
+    const name = resolveCategory(category);
+    let entry = loadedCategories.get(name);
+    if (!entry) {
+        const compiled = readCategory(name);
+        for (const [difficulty, bucket] of Object.entries(compiled.buckets)) {
+            bucket.forEach(q => { q.difficulty = difficulty; });
+        }
+        const all = Object.values(compiled.buckets).flat();
+        entry = { ...compiled, all, byId: new Map(all.map(q => [q.id, q])) };
+        loadedCategories.set(name, entry);
+    }
+    return entry;
+}
+
+/**
+ * Draws k distinct random items using a partial Fisher-Yates shuffle.
+ * The pool is permuted in place, which is harmless because order carries no meaning.
+ * @param {Array} pool - Items to draw from.
+ * @param {number} k - Number of items wanted.
+ * @returns {Array} Up to k items in random order.
+ */
+function sampleInPlace(pool, k) {
+    const count = Math.min(k, pool.length);
+    const picked = new Array(count);
+    for (let i = 0; i < count; i++) {
+        const j = i + Math.floor(Math.random() * (pool.length - i));
+        [pool[i], pool[j]] = [pool[j], pool[i]];
+        picked[i] = pool[i];
+    }
+    return picked;
+}
+
+/**
+ * Samples fallback questions for a topic, preferring the requested difficulty
+ * when its bucket alone can supply `n` questions.
+ * @param {string} category - The question topic.
+ * @param {number} n - The number of questions requested.
+ * @param {string} difficulty - The desired difficulty level ('mixed' for any).
+ * @returns {Array} Fresh question objects ready for a session (tagged `source: 'fallback'`).
+ */
+function sample(category, n, difficulty) {
+    const entry = loadCategory(category);
+    let pool = entry.all;
+
+    if (difficulty && difficulty !== 'mixed') {
+        const bucket = entry.buckets[difficulty] || [];
+        if (bucket.length >= n) {
+            pool = bucket;
+        } else {
+            console.log(`[Fallback Bank] Not enough "${difficulty}" questions for "${entry.category}" (${bucket.length} < ${n}), using all difficulties`);
+        }
+    }
+
+    return sampleInPlace(pool, n).map(q => ({ ...q, category: entry.category, source: 'fallback' }));
+}
+
+/**
+ * Compact, stable copy of a topic's bank for clients that practise offline.
+ * @param {string} category - The question topic.
+ * @param {number} [limit] - Maximum number of questions.
+ * @returns {Object} { category, questions } where each question keeps its id and difficulty.
+ */
+function slice(category, limit = OFFLINE_SLICE_SIZE) {
+    const entry = loadCategory(category);
+    // `all` is reordered by sampling, so order by id to keep the slice (and its ETag) stable
+    const questions = [...entry.all].sort((a, b) => (a.id < b.id ? -1 : 1)).slice(0, limit);
+    return { category: entry.category, questions };
+}
+
+/**
+ * Looks up bank questions by id, e.g. to re-score a session completed offline.
+ * @param {string} category - The question topic.
+ * @param {Array<string>} ids - Question ids.
+ * @returns {Array<Object|null>} Fresh question objects in the order of `ids` (null for unknown ids).
+ */
+function findByIds(category, ids) {
+    const entry = loadCategory(category);
+    return ids.map(id => {
+        const q = entry.byId.get(id);
+        return q ? { ...q, category: entry.category, source: 'fallback' } : null;
+    });
+}
+
+module.exports = { sample, slice, findByIds, compileCategory, questionId, slugify, OFFLINE_SLICE_SIZE };
@@ -0,0 +1,102 @@
+/**
+ * Background Feedback Jobs
+ *
+ * Generates AI feedback for completed sessions off the request path. The job
+ * state lives on the session in the session store (`session.feedback`), so the
+ * result can be polled from any server process; processes that started a job
+ * can also await it directly.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+const aiGenerator = require('./aiGenerator');
+const sessionStore = require('./sessionStore');
+
+// A pending job older than this is assumed lost (e.g. its process restarted) and is started again
+const STALE_JOB_MS = 60 * 1000;
+const POLL_INTERVAL_MS = 500;
+
+// Jobs running in this process, keyed by sessionId
+const runningJobs = new Map();
+
+/**
+ * Starts generating feedback for a completed session unless it is ready or already running.
+ * @param {string} sessionId - Active session identifier.
+ * @param {Object} session - Session loaded from the store.
+ * @param {Object} stats - { accuracy, total } for the prompt.
+ */
+async function startFeedback(sessionId, session, stats) {
+    const state = session.feedback;
+    if (runningJobs.has(sessionId) || (state && state.status === 'ready')) return;
+    if (state && state.status === 'pending' && Date.now() - state.startedAt < STALE_JOB_MS) return;
+
+    session.feedback = { status: 'pending', startedAt: Date.now() };
+    await sessionStore.set(sessionId, session);
+
+    const job = aiGenerator.generateFeedback({
+        questions: session.questions,
+        answers: session.answers,
+        accuracy: stats.accuracy,
+        total: stats.total
+    }).then(async (feedback) => {
+        // Reload so the write does not clobber anything saved while the job ran
+        const latest = (await sessionStore.get(sessionId)) || session;
+        latest.feedback = { status: 'ready', data: feedback };
+        await sessionStore.set(sessionId, latest);
+        console.log(`[Feedback] Ready for session ${sessionId}`);
+        return latest.feedback;
+    }).catch(async (err) => {
+        console.error(`[Feedback] Job for session ${sessionId} failed:`, err);
+        // Settle the job so pollers and streams stop waiting on a pending state
+        try {
+            const latest = (await sessionStore.get(sessionId)) || session;
+            latest.feedback = { status: 'failed', failedAt: Date.now() };
+            await sessionStore.set(sessionId, latest);
+        } catch (storeErr) {
+            console.error(`[Feedback] Could not record the failure for session ${sessionId}:`, storeErr);
+        }
+        return null;
+    }).finally(() => {
+        runningJobs.delete(sessionId);
+    });
+    runningJobs.set(sessionId, job);
+}
+
+/**
+ * Returns the feedback state for a session.
+ * @param {string} sessionId - Active session identifier.
+ * @returns {Promise<Object|null>} { status: none|pending|ready|failed, feedback } or null if the session is unknown.
+ */
+async function getFeedback(sessionId) {
+    const session = await sessionStore.get(sessionId);
+    if (!session) return null;
+    const state = session.feedback;
+    if (!state) return { status: 'none', feedback: null };
+    return { status: state.status, feedback: state.status === 'ready' ? state.data : null };
+}
+
+/**
+ * Waits for a session's feedback to become ready.
+ * @param {string} sessionId - Active session identifier.
+ * @param {number} timeoutMs - Maximum time to wait.
+ * @returns {Promise<Object|null>} Latest feedback state, or null if the session is unknown.
+ */
+async function waitForFeedback(sessionId, timeoutMs) {
+    const job = runningJobs.get(sessionId);
+    if (job) {
+        await Promise.race([job, new Promise(resolve => setTimeout(resolve, timeoutMs))]);
+        return getFeedback(sessionId);
+    }
+
+    // Started by another process: follow it through the store
+    const deadline = Date.now() + timeoutMs;
+    let state = await getFeedback(sessionId);
+    while (state && state.status === 'pending' && Date.now() < deadline) {
+        await new Promise(resolve => setTimeout(resolve, POLL_INTERVAL_MS));
+        state = await getFeedback(sessionId);
+    }
+    return state;
+}
+
+module.exports = { startFeedback, getFeedback, waitForFeedback };
@@ -0,0 +1,280 @@
+/**
+ * Gemini Upstream Client
+ *
+ * Shared HTTP client for all Google Gemini calls. Requests reuse pooled
+ * keep-alive connections, are paced by a client-side token bucket sized to the
+ * API quota, and carry a hard deadline. A circuit breaker stops calling the
+ * upstream after repeated failures so callers can serve their local fallbacks
+ * immediately.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+require('dotenv').config();
+const axios = require('axios');
+const https = require('https');
+const { TokenBucket } = require('./tokenBucket');
+
+const GEMINI_BASE_URL = 'https://generativelanguage.googleapis.com/v1beta/models';
+const DEFAULT_MODEL = 'gemini-flash-latest';
+
+// Circuit breaker tuning (consecutive failures before opening, cool-down before probing)
+const FAILURE_THRESHOLD = parseInt(process.env.GEMINI_BREAKER_THRESHOLD) || 5;
+const COOLDOWN_MS = parseInt(process.env.GEMINI_BREAKER_COOLDOWN_MS) || 30000;
+const DEFAULT_TIMEOUT_MS = parseInt(process.env.GEMINI_TIMEOUT_MS) || 20000;
+
+// Request priorities: session starts are user-blocking, feedback can wait
+const PRIORITY = { START: 0, FEEDBACK: 1 };
+
+// Pooled keep-alive connections so consecutive calls skip the TCP/TLS handshake
+const httpsAgent = new https.Agent({
+    keepAlive: true,
+    keepAliveMsecs: 30000,
+    maxSockets: parseInt(process.env.GEMINI_MAX_SOCKETS) || 16
+});
+
+const upstream = axios.create({
+    baseURL: GEMINI_BASE_URL,
+    httpsAgent,
+    headers: { 'Content-Type': 'application/json' }
+});
+
+// Client-side quota (requests per minute) with a small burst allowance
+const rateLimiter = new TokenBucket({
+    ratePerMinute: parseInt(process.env.GEMINI_RATE_LIMIT_RPM) || 60,
+    burst: parseInt(process.env.GEMINI_RATE_LIMIT_BURST) || 10,
+    levels: Object.keys(PRIORITY).length
+});
+
+/**
+ * Raised when the breaker is open and the upstream call was not attempted.
+ */
+class CircuitOpenError extends Error {
+    constructor(retryInMs) {
+        super(`Gemini circuit open, retry in ${Math.ceil(retryInMs / 1000)}s`);
+        this.name = 'CircuitOpenError';
+        this.retryInMs = retryInMs;
+    }
+}
+
+// Breaker state: 'closed' (normal), 'open' (failing fast), 'half-open' (single probe allowed)
+const breaker = {
+    state: 'closed',
+    consecutiveFailures: 0,
+    openedAt: 0,
+    probeInFlight: false
+};
+
+/**
+ * Checks whether a call may proceed, moving an expired open breaker to half-open.
+ * @throws {CircuitOpenError} When the upstream should not be called.
+ */
+function acquirePermit() {
+    if (breaker.state === 'closed') return;
+
+    if (breaker.state === 'open') {
+        const elapsed = Date.now() - breaker.openedAt;
+        if (elapsed < COOLDOWN_MS) {
+            throw new CircuitOpenError(COOLDOWN_MS - elapsed);
+        }
+        breaker.state = 'half-open';
+        console.log('[Gemini Client] Breaker half-open, sending probe request');
+    }
+
+    // Half-open: exactly one probe at a time, everyone else keeps failing fast
+    if (breaker.probeInFlight) {
+        throw new CircuitOpenError(COOLDOWN_MS);
+    }
+    breaker.probeInFlight = true;
+}
+
+/**
+ * Records a successful upstream call and closes the breaker.
+ */
+function recordSuccess() {
+    if (breaker.state !== 'closed') {
+        console.log('[Gemini Client] Probe succeeded, breaker closed');
+    }
+    breaker.state = 'closed';
+    breaker.consecutiveFailures = 0;
+    breaker.probeInFlight = false;
+}
+
+/**
+ * Records a failed upstream call, opening the breaker when the threshold is reached.
+ */
+function recordFailure() {
+    breaker.consecutiveFailures++;
+    const probeFailed = breaker.state === 'half-open';
+    breaker.probeInFlight = false;
+
+    if (probeFailed || breaker.consecutiveFailures >= FAILURE_THRESHOLD) {
+        if (breaker.state !== 'open') {
+            console.warn(`[Gemini Client] Breaker opened after ${breaker.consecutiveFailures} consecutive failures`);
+        }
+        breaker.state = 'open';
+        breaker.openedAt = Date.now();
+    }
+}
+
+/**
+ * Determines whether an error reflects upstream health (vs. a bad request we sent).
+ * @param {Error} err - Error thrown by axios.
+ * @returns {boolean} True if the failure should count towards opening the breaker.
+ */
+function isUpstreamFailure(err) {
+    const status = err.response?.status;
+    if (!status) return true; // Timeout, abort, DNS or connection failure
+    return status >= 500 || status === 408 || status === 429;
+}
+
+/**
+ * Runs one upstream exchange under the breaker, the rate limiter and a hard deadline.
+ *
+ * @param {Object} options - Call options.
+ * @param {number} options.timeoutMs - Hard deadline for the whole call, including queueing.
+ * @param {number} options.priority - One of PRIORITY; lower values are sent first.
+ * @param {AbortSignal} [options.signal] - Cancels the call (e.g. the client went away).
+ * @param {Function} send - Receives { signal, timeout } and performs the request.
+ * @returns {Promise<*>} Whatever `send` resolves to.
+ * @throws {CircuitOpenError} When the breaker is open.
+ * @throws {RateLimitError} When no quota token became available before the deadline.
+ */
+async function callUpstream({ timeoutMs, priority, signal }, send) {
+    const startedAt = Date.now();
+    acquirePermit();
+
+    try {
+        await rateLimiter.acquire(priority, timeoutMs);
+    } catch (err) {
+        breaker.probeInFlight = false;
+        throw err;
+    }
+
+    // AbortController enforces a total deadline; axios' own timeout only covers socket idle time
+    const remainingMs = Math.max(1, timeoutMs - (Date.now() - startedAt));
+    const controller = new AbortController();
+    const deadline = setTimeout(() => controller.abort(), remainingMs);
+    const cancel = () => controller.abort();
+    if (signal) {
+        if (signal.aborted) cancel();
+        else signal.addEventListener('abort', cancel, { once: true });
+    }
+
+    try {
+        const result = await send({ signal: controller.signal, timeout: remainingMs });
+        recordSuccess();
+        return result;
+    } catch (err) {
+        if (signal?.aborted) {
+            // Cancelled by the caller: says nothing about the upstream's health
+            breaker.probeInFlight = false;
+            err.message = 'Gemini request cancelled by the caller';
+            throw err;
+        }
+        if (err.response?.status === 429) {
+            // Our bucket is more generous than the real quota right now; stop spending
+            rateLimiter.empty();
+        }
+        if (isUpstreamFailure(err)) {
+            recordFailure();
+        } else {
+            // The upstream answered; a rejected request says nothing about its health
+            breaker.probeInFlight = false;
+        }
+        if (controller.signal.aborted) {
+            err.message = `Gemini request exceeded ${timeoutMs}ms deadline`;
+        }
+        throw err;
+    } finally {
+        clearTimeout(deadline);
+        if (signal) signal.removeEventListener('abort', cancel);
+    }
+}
+
+/**
+ * Extracts the text of the first candidate from a Gemini response payload.
+ * @param {Object} payload - Parsed generateContent response (or stream chunk).
+ * @returns {string} Candidate text, or an empty string.
+ */
+function candidateText(payload) {
+    return payload?.candidates?.[0]?.content?.parts?.[0]?.text || '';
+}
+
+/**
+ * Sends a single-prompt generateContent request and returns the response text.
+ *
+ * @param {Object} params - Request configuration.
+ * @param {string} params.prompt - Full prompt text.
+ * @param {Object} params.generationConfig - Gemini generation settings.
+ * @param {number} [params.timeoutMs] - Hard deadline for the whole call, including queueing.
+ * @param {number} [params.priority] - One of PRIORITY; lower values are sent first.
+ * @param {string} [params.model] - Gemini model name.
+ * @returns {Promise<string>} Text of the first candidate (empty string if none).
+ */
+async function generateContent({ prompt, generationConfig, timeoutMs = DEFAULT_TIMEOUT_MS, priority = PRIORITY.START, model = DEFAULT_MODEL }) {
+    return callUpstream({ timeoutMs, priority }, async ({ signal, timeout }) => {
+        const response = await upstream.post(
+            `/${model}:generateContent?key=${process.env.OPENAI_API_KEY}`,
+            { contents: [{ parts: [{ text: prompt }] }], generationConfig },
+            { timeout, signal }
+        );
+        return candidateText(response.data);
+    });
+}
+
+/**
+ * Sends a streamGenerateContent request, passing each text fragment to `onText`
+ * as it arrives. The deadline covers the entire stream.
+ *
+ * @param {Object} params - Request configuration (same as generateContent).
+ * @param {Function} params.onText - Called with every text fragment in order.
+ * @param {AbortSignal} [params.signal] - Stops the stream early.
+ * @returns {Promise<string>} The full concatenated text once the stream ends.
+ */
+async function streamContent({ prompt, generationConfig, onText, signal: cancelSignal, timeoutMs = DEFAULT_TIMEOUT_MS, priority = PRIORITY.START, model = DEFAULT_MODEL }) {
+    return callUpstream({ timeoutMs, priority, signal: cancelSignal }, async ({ signal, timeout }) => {
+        const response = await upstream.post(
+            `/${model}:streamGenerateContent?alt=sse&key=${process.env.OPENAI_API_KEY}`,
+            { contents: [{ parts: [{ text: prompt }] }], generationConfig },
+            { timeout, signal, responseType: 'stream' }
+        );
+
+        // Server-sent events: one `data: {json}` line per generated chunk
+        let fullText = '';
+        let pending = '';
+        response.data.setEncoding('utf8'); // Keeps multi-byte characters intact across chunks
+        const handleLine = (line) => {
+            if (!line.startsWith('data:')) return;
+            const text = candidateText(JSON.parse(line.slice(5)));
+            if (text) {
+                fullText += text;
+                onText(text);
+            }
+        };
+
+        for await (const chunk of response.data) {
+            pending += chunk;
+            const lines = pending.split(/\r?\n/);
+            pending = lines.pop();
+            lines.forEach(handleLine);
+        }
+        handleLine(pending);
+        return fullText;
+    });
+}
+
+/**
+ * Returns a snapshot of the breaker and rate limiter for health reporting.
+ * @returns {Object} Current breaker state, failure count and limiter counters.
+ */
+function getBreakerState() {
+    return {
+        state: breaker.state,
+        consecutiveFailures: breaker.consecutiveFailures,
+        rateLimiter: rateLimiter.getStats()
+    };
+}
+
+module.exports = { generateContent, streamContent, getBreakerState, CircuitOpenError, PRIORITY };
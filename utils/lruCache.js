@@ -0,0 +1,143 @@
+/**
+ * LRU Cache Utility
+ *
+ * In-process least-recently-used cache with optional per-entry TTL, entry
+ * limit and byte budget. Map insertion order doubles as recency order, so
+ * get/set/evict are all O(1). Tracks hit, miss, eviction and expiry counters.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+class LruCache {
+    /**
+     * @param {Object} [options] - Cache limits.
+     * @param {number} [options.maxEntries] - Maximum number of entries.
+     * @param {number} [options.maxBytes] - Byte budget across all entries (requires sizeOf).
+     * @param {number} [options.ttlMs] - Default time-to-live for entries.
+     * @param {Function} [options.sizeOf] - Returns the byte size of a value.
+     */
+    constructor({ maxEntries = Infinity, maxBytes = Infinity, ttlMs = 0, sizeOf = null } = {}) {
+        this.maxEntries = maxEntries;
+        this.maxBytes = maxBytes;
+        this.ttlMs = ttlMs;
+        this.sizeOf = sizeOf;
+        this.entries = new Map(); // key -> { value, expiresAt, bytes }
+        this.bytes = 0;
+        this.stats = { hits: 0, misses: 0, evictions: 0, expirations: 0 };
+    }
+
+    /**
+     * Returns a cached value and marks it most recently used.
+     * @param {string} key - Cache key.
+     * @returns {*} The value, or undefined on a miss.
+     */
+    get(key) {
+        const entry = this.entries.get(key);
+        if (!entry) {
+            this.stats.misses++;
+            return undefined;
+        }
+        if (entry.expiresAt && entry.expiresAt <= Date.now()) {
+            this.remove(key, entry);
+            this.stats.expirations++;
+            this.stats.misses++;
+            return undefined;
+        }
+        this.entries.delete(key);
+        this.entries.set(key, entry);
+        this.stats.hits++;
+        return entry.value;
+    }
+
+    /**
+     * Stores a value, evicting least recently used entries to stay within limits.
+     * @param {string} key - Cache key.
+     * @param {*} value - Value to store.
+     * @param {number} [ttlMs] - Overrides the default TTL for this entry (0 = no expiry).
+     */
+    set(key, value, ttlMs = this.ttlMs) {
+        const existing = this.entries.get(key);
+        if (existing) this.remove(key, existing);
+
+        const bytes = this.sizeOf ? this.sizeOf(value) : 0;
+        if (bytes > this.maxBytes) return; // Would evict everything and still not fit
+
+        this.entries.set(key, { value, expiresAt: ttlMs ? Date.now() + ttlMs : 0, bytes });
+        this.bytes += bytes;
+
+        while (this.entries.size > this.maxEntries || this.bytes > this.maxBytes) {
+            const [oldestKey, oldest] = this.entries.entries().next().value;
+            this.remove(oldestKey, oldest);
+            this.stats.evictions++;
+        }
+    }
+
+    /**
+     * Restarts an entry's TTL (a sliding expiry) without changing its value.
+     * @param {string} key - Cache key.
+     * @param {number} [ttlMs] - New TTL (defaults to the cache's TTL).
+     * @returns {boolean} True if the entry exists.
+     */
+    touch(key, ttlMs = this.ttlMs) {
+        const entry = this.entries.get(key);
+        if (!entry) return false;
+        entry.expiresAt = ttlMs ? Date.now() + ttlMs : 0;
+        return true;
+    }
+
+    /**
+     * Removes an entry.
+     * @param {string} key - Cache key.
+     * @returns {boolean} True if an entry was removed.
+     */
+    delete(key) {
+        const entry = this.entries.get(key);
+        if (!entry) return false;
+        this.remove(key, entry);
+        return true;
+    }
+
+    /**
+     * Drops an entry and releases its bytes.
+     * @param {string} key - Cache key.
+     * @param {Object} entry - Stored entry.
+     */
+    remove(key, entry) {
+        this.entries.delete(key);
+        this.bytes -= entry.bytes;
+    }
+
+    /**
+     * Removes every expired entry (for periodic sweeps of rarely read keys).
+     * @returns {number} Number of entries removed.
+     */
+    prune() {
+        const now = Date.now();
+        let removed = 0;
+        for (const [key, entry] of this.entries) {
+            if (entry.expiresAt && entry.expiresAt <= now) {
+                this.remove(key, entry);
+                removed++;
+            }
+        }
+        this.stats.expirations += removed;
+        return removed;
+    }
+
+    /**
+     * Returns counters and current occupancy.
+     * @returns {Object} Hits, misses, evictions, expirations, hit rate, entries and bytes.
+     */
+    getStats() {
+        const lookups = this.stats.hits + this.stats.misses;
+        return {
+            ...this.stats,
+            hitRate: lookups ? Math.round((this.stats.hits / lookups) * 1000) / 1000 : 0,
+            entries: this.entries.size,
+            bytes: this.bytes
+        };
+    }
+}
+
+module.exports = LruCache;
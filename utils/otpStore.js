@@ -0,0 +1,175 @@
+/**
+ * OTP Store
+ *
+ * Short-lived storage for login verification codes. Redis is the primary
+ * store; when it is unavailable codes go to a bounded in-process map whose
+ * entries expire through a timer wheel, so an outage neither leaks memory
+ * nor slows logins down. Tracks hit, miss, expiry and fallback counters.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+require('dotenv').config();
+const redisClient = require('./redisClient');
+
+const KEY_PREFIX = 'otp:';
+const DEFAULT_TTL_SECONDS = 300;
+const MAX_MEMORY_ENTRIES = parseInt(process.env.OTP_MEMORY_MAX_ENTRIES) || 10000;
+
+// Timer wheel: one slot per second, spanning longer than any OTP lifetime
+const WHEEL_TICK_MS = 1000;
+const WHEEL_SLOTS = 512;
+
+/**
+ * In-process fallback. Each entry sits in the wheel slot for the tick it
+ * expires on, so a tick only touches the entries that are due.
+ */
+class MemoryOtpStore {
+    constructor(stats) {
+        this.entries = new Map(); // email -> { otp, expiresAt, slot }
+        this.wheel = Array.from({ length: WHEEL_SLOTS }, () => new Set());
+        this.tick = 0;
+        this.timer = null;
+        this.stats = stats;
+    }
+
+    schedule(email, entry) {
+        const ticks = Math.min(Math.max(Math.ceil((entry.expiresAt - Date.now()) / WHEEL_TICK_MS), 1), WHEEL_SLOTS - 1);
+        entry.slot = (this.tick + ticks) % WHEEL_SLOTS;
+        this.wheel[entry.slot].add(email);
+    }
+
+    set(email, otp, ttlSeconds) {
+        this.delete(email);
+        // Size cap: drop the oldest code (Map iteration follows insertion order)
+        if (this.entries.size >= MAX_MEMORY_ENTRIES) {
+            this.delete(this.entries.keys().next().value);
+            this.stats.evictions++;
+        }
+        const entry = { otp, expiresAt: Date.now() + ttlSeconds * 1000, slot: 0 };
+        this.entries.set(email, entry);
+        this.schedule(email, entry);
+
+        if (!this.timer) {
+            this.timer = setInterval(() => this.advance(), WHEEL_TICK_MS);
+            this.timer.unref();
+        }
+    }
+
+    get(email) {
+        const entry = this.entries.get(email);
+        if (!entry) return null;
+        if (entry.expiresAt <= Date.now()) {
+            this.delete(email);
+            this.stats.expirations++;
+            return null;
+        }
+        return entry.otp;
+    }
+
+    delete(email) {
+        const entry = this.entries.get(email);
+        if (!entry) return;
+        this.wheel[entry.slot].delete(email);
+        this.entries.delete(email);
+    }
+
+    /**
+     * Moves the wheel one slot and expires the entries due in it.
+     */
+    advance() {
+        this.tick = (this.tick + 1) % WHEEL_SLOTS;
+        const slot = this.wheel[this.tick];
+        if (slot.size > 0) {
+            const now = Date.now();
+            for (const email of slot) {
+                const entry = this.entries.get(email);
+                slot.delete(email);
+                if (!entry) continue;
+                if (entry.expiresAt <= now) {
+                    this.entries.delete(email);
+                    this.stats.expirations++;
+                } else {
+                    this.schedule(email, entry); // Timer drift: not due yet
+                }
+            }
+        }
+        if (this.entries.size === 0) {
+            clearInterval(this.timer);
+            this.timer = null;
+        }
+    }
+}
+
+const stats = { hits: 0, misses: 0, expirations: 0, evictions: 0, fallbackWrites: 0, redisErrors: 0 };
+const memory = new MemoryOtpStore(stats);
+
+/**
+ * Stores a code for an email address, replacing any previous one.
+ * @param {string} email - Account email.
+ * @param {string} otp - Verification code.
+ * @param {number} [ttlSeconds] - Lifetime of the code.
+ */
+async function set(email, otp, ttlSeconds = DEFAULT_TTL_SECONDS) {
+    // isReady fails fast during an outage instead of queueing behind reconnects
+    if (redisClient.isReady) {
+        try {
+            await redisClient.setEx(KEY_PREFIX + email, ttlSeconds, otp);
+            memory.delete(email);
+            return;
+        } catch (err) {
+            stats.redisErrors++;
+        }
+    }
+    console.warn('[OTP Store] Redis unavailable, using in-memory OTP storage');
+    stats.fallbackWrites++;
+    memory.set(email, otp, ttlSeconds);
+}
+
+/**
+ * Looks up the current code for an email address.
+ * @param {string} email - Account email.
+ * @returns {Promise<string|null>} The code, or null if none is active.
+ */
+async function get(email) {
+    let otp = null;
+    if (redisClient.isReady) {
+        try {
+            otp = await redisClient.get(KEY_PREFIX + email);
+        } catch (err) {
+            stats.redisErrors++;
+        }
+    }
+    // Codes issued during an outage stay valid after Redis recovers
+    if (!otp) otp = memory.get(email);
+
+    if (otp) stats.hits++;
+    else stats.misses++;
+    return otp;
+}
+
+/**
+ * Removes the code for an email address once it has been used.
+ * @param {string} email - Account email.
+ */
+async function remove(email) {
+    memory.delete(email);
+    if (redisClient.isReady) {
+        try {
+            await redisClient.del(KEY_PREFIX + email);
+        } catch (err) {
+            stats.redisErrors++;
+        }
+    }
+}
+
+/**
+ * Returns counters and the size of the in-memory fallback.
+ * @returns {Object} OTP store statistics.
+ */
+function getStats() {
+    return { ...stats, memoryEntries: memory.entries.size };
+}
+
+module.exports = { set, get, remove, getStats };
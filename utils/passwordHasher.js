@@ -0,0 +1,179 @@
+/**
+ * Password Hashing Pool
+ *
+ * Runs bcrypt hashing and comparison on a pool of worker threads so the
+ * request event loop stays responsive while passwords are being checked.
+ * Jobs wait in a bounded queue; once it is full new jobs are rejected with
+ * PoolSaturatedError and the route answers 503 so clients back off.
+ *
+ * This file is also the worker thread script.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+const os = require('os');
+const { Worker, isMainThread, parentPort } = require('worker_threads');
+
+if (!isMainThread) {
+    // Worker thread: bcrypt work requested by the pool
+    const bcrypt = require('bcryptjs');
+    parentPort.on('message', async ({ id, op, args }) => {
+        try {
+            const result = op === 'hash' ? await bcrypt.hash(...args) : await bcrypt.compare(...args);
+            parentPort.postMessage({ id, result });
+        } catch (err) {
+            parentPort.postMessage({ id, error: err.message });
+        }
+    });
+    return;
+}
+
+require('dotenv').config();
+
+const DEFAULT_THREADS = Math.max(1, Math.min(4, os.cpus().length - 1));
+
+/**
+ * Raised when the queue is full; callers should respond with 503.
+ */
+class PoolSaturatedError extends Error {
+    constructor() {
+        super('Password hashing pool is saturated');
+        this.name = 'PoolSaturatedError';
+    }
+}
+
+class HashPool {
+    /**
+     * @param {Object} [options] - Pool limits.
+     * @param {number} [options.threads] - Worker threads (started on first use).
+     * @param {number} [options.maxQueue] - Jobs allowed to wait for a free thread.
+     */
+    constructor({ threads = DEFAULT_THREADS, maxQueue = 64 } = {}) {
+        this.size = threads;
+        this.maxQueue = maxQueue;
+        this.idle = [];
+        this.workers = new Set();
+        this.queue = [];
+        this.running = new Map(); // worker -> job
+        this.nextId = 0;
+        this.stats = { completed: 0, failed: 0, rejected: 0 };
+    }
+
+    spawn() {
+        const worker = new Worker(__filename);
+        worker.unref();
+        worker.on('message', (msg) => this.finish(worker, msg));
+        worker.on('error', (err) => this.crash(worker, err));
+        worker.on('exit', (code) => {
+            if (this.workers.has(worker)) this.crash(worker, new Error(`Hash worker exited with code ${code}`));
+        });
+        this.workers.add(worker);
+        this.idle.push(worker);
+    }
+
+    /**
+     * Queues a job, or rejects immediately when the queue is full.
+     * @param {string} op - 'hash' or 'compare'.
+     * @param {Array} args - bcrypt arguments.
+     * @returns {Promise<*>} bcrypt result.
+     */
+    run(op, args) {
+        while (this.workers.size < this.size) this.spawn();
+        if (this.idle.length === 0 && this.queue.length >= this.maxQueue) {
+            this.stats.rejected++;
+            return Promise.reject(new PoolSaturatedError());
+        }
+        return new Promise((resolve, reject) => {
+            this.queue.push({ id: ++this.nextId, op, args, resolve, reject });
+            this.dispatch();
+        });
+    }
+
+    dispatch() {
+        while (this.idle.length > 0 && this.queue.length > 0) {
+            const worker = this.idle.pop();
+            const job = this.queue.shift();
+            this.running.set(worker, job);
+            worker.ref(); // Busy threads keep the process alive; idle ones do not
+            worker.postMessage({ id: job.id, op: job.op, args: job.args });
+        }
+    }
+
+    finish(worker, { id, result, error }) {
+        const job = this.running.get(worker);
+        this.running.delete(worker);
+        worker.unref();
+        this.idle.push(worker);
+        if (job && job.id === id) {
+            if (error) {
+                this.stats.failed++;
+                job.reject(new Error(error));
+            } else {
+                this.stats.completed++;
+                job.resolve(result);
+            }
+        }
+        this.dispatch();
+    }
+
+    crash(worker, err) {
+        console.error('[Password Hasher] Worker failed:', err.message);
+        const job = this.running.get(worker);
+        this.running.delete(worker);
+        this.workers.delete(worker);
+        this.idle = this.idle.filter(w => w !== worker);
+        if (job) {
+            this.stats.failed++;
+            job.reject(err);
+        }
+        worker.terminate().catch(() => {});
+        // Replace the thread and keep draining the queue
+        if (this.queue.length > 0) this.spawn();
+        this.dispatch();
+    }
+
+    async close() {
+        const workers = [...this.workers];
+        this.workers.clear();
+        this.idle = [];
+        await Promise.all(workers.map(w => w.terminate()));
+    }
+
+    getStats() {
+        return {
+            threads: this.workers.size,
+            busy: this.running.size,
+            queued: this.queue.length,
+            maxQueue: this.maxQueue,
+            ...this.stats
+        };
+    }
+}
+
+const pool = new HashPool({
+    threads: parseInt(process.env.PASSWORD_HASH_THREADS) || DEFAULT_THREADS,
+    maxQueue: parseInt(process.env.PASSWORD_HASH_MAX_QUEUE) || 64
+});
+
+/**
+ * Hashes a password off the event loop.
+ * @param {string} password - Plain-text password.
+ * @param {number} rounds - bcrypt cost factor.
+ * @returns {Promise<string>} bcrypt hash.
+ */
+function hash(password, rounds) {
+    return pool.run('hash', [password, rounds]);
+}
+
+/**
+ * Compares a password with a stored hash off the event loop.
+ * @param {string} password - Plain-text password.
+ * @param {string} passwordHash - Stored bcrypt hash.
+ * @returns {Promise<boolean>} True if they match.
+ */
+function compare(password, passwordHash) {
+    return pool.run('compare', [password, passwordHash]);
+}
+
+module.exports = { hash, compare, getStats: () => pool.getStats(), HashPool, PoolSaturatedError };
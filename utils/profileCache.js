@@ -0,0 +1,167 @@
+/**
+ * Profile Cache
+ *
+ * Precomputed `/api/auth/profile` views (badge tier, tier progress, average
+ * accuracy) so profile reads skip the database. Every write to a user's
+ * profile data (XP updates, profile edits, login streaks, session results)
+ * stores the fresh view straight away; the TTL only bounds staleness from
+ * writers that bypass this module.
+ *
+ * Uses an in-process LRU by default, or Redis with PROFILE_CACHE=redis so
+ * every server process sees the same view.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+require('dotenv').config();
+const LruCache = require('./lruCache');
+const { getBadgeProgress } = require('./badges');
+const { User } = require('../models/index');
+
+const BACKEND = process.env.PROFILE_CACHE || 'memory';
+const TTL_SECONDS = parseInt(process.env.PROFILE_CACHE_TTL_SECONDS) || 600;
+const MAX_ENTRIES = parseInt(process.env.PROFILE_CACHE_MAX_ENTRIES) || 10000;
+const KEY_PREFIX = 'profile:';
+
+/**
+ * Builds the profile view returned by /api/auth/profile.
+ * @param {Object} user - User row (all attributes).
+ * @returns {Object} Profile view.
+ */
+function buildProfile(user) {
+    const badgeProgress = getBadgeProgress(user.totalXP);
+    return {
+        id: user.id,
+        username: user.username,
+        email: user.email,
+        totalXP: user.totalXP,
+        currentBadge: badgeProgress.current,
+        streakCount: user.streakCount,
+        preferences: user.preferences,
+        stats: {
+            sessionsCompleted: user.sessionsCompleted,
+            avgAccuracy: user.sessionsCompleted > 0
+                ? Math.round(user.totalAccuracySum / user.sessionsCompleted)
+                : 0
+        },
+        badgeProgress
+    };
+}
+
+class MemoryProfileCache {
+    constructor() {
+        this.cache = new LruCache({ maxEntries: MAX_ENTRIES, ttlMs: TTL_SECONDS * 1000 });
+    }
+
+    async get(userId) {
+        return this.cache.get(String(userId)) || null;
+    }
+
+    async set(userId, profile) {
+        this.cache.set(String(userId), profile);
+    }
+
+    async delete(userId) {
+        this.cache.delete(String(userId));
+    }
+
+    getStats() {
+        return { backend: 'memory', ...this.cache.getStats() };
+    }
+}
+
+class RedisProfileCache {
+    constructor() {
+        this.client = require('./redisClient');
+        this.stats = { hits: 0, misses: 0 };
+    }
+
+    async get(userId) {
+        const raw = await this.client.get(KEY_PREFIX + userId);
+        if (!raw) {
+            this.stats.misses++;
+            return null;
+        }
+        this.stats.hits++;
+        return JSON.parse(raw);
+    }
+
+    async set(userId, profile) {
+        await this.client.set(KEY_PREFIX + userId, JSON.stringify(profile), { EX: TTL_SECONDS });
+    }
+
+    async delete(userId) {
+        await this.client.del(KEY_PREFIX + userId);
+    }
+
+    getStats() {
+        const lookups = this.stats.hits + this.stats.misses;
+        return {
+            backend: 'redis',
+            ...this.stats,
+            hitRate: lookups ? Math.round((this.stats.hits / lookups) * 1000) / 1000 : 0
+        };
+    }
+}
+
+const cache = BACKEND === 'redis' ? new RedisProfileCache() : new MemoryProfileCache();
+let errors = 0;
+
+/**
+ * Stores the view for a user row that was just written.
+ * @param {Object} user - Saved user row (all attributes).
+ * @returns {Promise<Object>} The stored profile view.
+ */
+async function store(user) {
+    const profile = buildProfile(user);
+    try {
+        await cache.set(user.id, profile);
+    } catch (err) {
+        // The write itself succeeded; drop the stale view rather than fail the request
+        errors++;
+        console.error('[Profile Cache] Failed to store profile:', err.message);
+        await cache.delete(user.id).catch(() => {});
+    }
+    return profile;
+}
+
+/**
+ * Re-reads a user after a write that was applied in SQL (e.g. atomic increments).
+ * @param {number} userId - User id.
+ * @returns {Promise<Object|null>} The stored profile view, or null if the user is gone.
+ */
+async function reload(userId) {
+    const user = await User.findByPk(userId);
+    if (!user) {
+        await cache.delete(userId).catch(() => {});
+        return null;
+    }
+    return store(user);
+}
+
+/**
+ * Returns a user's profile view, loading it from the database on a miss.
+ * @param {number} userId - User id.
+ * @returns {Promise<Object|null>} Profile view, or null if the user does not exist.
+ */
+async function get(userId) {
+    try {
+        const profile = await cache.get(userId);
+        if (profile) return profile;
+    } catch (err) {
+        errors++;
+        console.error('[Profile Cache] Lookup failed, reading from database:', err.message);
+    }
+    return reload(userId);
+}
+
+/**
+ * Returns cache counters for monitoring.
+ * @returns {Object} Backend, hit/miss counters and backend errors.
+ */
+function getStats() {
+    return { ...cache.getStats(), errors };
+}
+
+module.exports = { get, store, reload, getStats };
@@ -0,0 +1,126 @@
+/**
+ * Compact Question Schema
+ *
+ * Schema sent to Gemini as `responseSchema` when structured output is enabled,
+ * plus a validator compiled from the same definition. Short keys keep the
+ * generated payload small: q = question, o = options, a = correct option
+ * index, s = solution, d = difficulty.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+const COMPACT_QUESTION_SCHEMA = {
+    type: 'OBJECT',
+    properties: {
+        q: { type: 'STRING' },
+        o: { type: 'ARRAY', items: { type: 'STRING' }, minItems: 4, maxItems: 4 },
+        a: { type: 'INTEGER', minimum: 0, maximum: 3 },
+        s: { type: 'STRING' },
+        d: { type: 'STRING', enum: ['easy', 'medium', 'hard'] }
+    },
+    required: ['q', 'o', 'a', 's', 'd'],
+    propertyOrdering: ['q', 'o', 'a', 's', 'd']
+};
+
+/**
+ * Builds the response schema for a set of `n` questions.
+ * @param {number} n - Number of questions requested.
+ * @returns {Object} Gemini responseSchema (an array of compact questions).
+ */
+function questionSetSchema(n) {
+    return { type: 'ARRAY', items: COMPACT_QUESTION_SCHEMA, minItems: n, maxItems: n };
+}
+
+/**
+ * Compiles a schema into a validator closure once, so validating each item is a
+ * handful of direct checks rather than a walk over the schema definition.
+ * Supports the subset used here: OBJECT, ARRAY, STRING, INTEGER, enum, bounds and required.
+ *
+ * @param {Object} schema - Schema definition.
+ * @param {string} [path] - Location used in error messages.
+ * @returns {Function} Validator returning an error message, or null when valid.
+ */
+function compile(schema, path = '$') {
+    switch (schema.type) {
+        case 'OBJECT': {
+            const fields = Object.entries(schema.properties).map(([key, sub]) => [key, compile(sub, `${path}.${key}`)]);
+            const required = schema.required || [];
+            return (value) => {
+                if (value === null || typeof value !== 'object' || Array.isArray(value)) return `${path} must be an object`;
+                for (const key of required) {
+                    if (value[key] === undefined) return `${path}.${key} is required`;
+                }
+                for (const [key, check] of fields) {
+                    if (value[key] === undefined) continue;
+                    const err = check(value[key]);
+                    if (err) return err;
+                }
+                return null;
+            };
+        }
+        case 'ARRAY': {
+            const checkItem = compile(schema.items, `${path}[]`);
+            const min = schema.minItems ?? 0;
+            const max = schema.maxItems ?? Infinity;
+            return (value) => {
+                if (!Array.isArray(value)) return `${path} must be an array`;
+                if (value.length < min || value.length > max) return `${path} must have ${min}-${max} items`;
+                for (const item of value) {
+                    const err = checkItem(item);
+                    if (err) return err;
+                }
+                return null;
+            };
+        }
+        case 'STRING': {
+            const allowed = schema.enum ? new Set(schema.enum) : null;
+            return (value) => {
+                if (typeof value !== 'string' || value.length === 0) return `${path} must be a non-empty string`;
+                if (allowed && !allowed.has(value)) return `${path} must be one of ${schema.enum.join(', ')}`;
+                return null;
+            };
+        }
+        case 'INTEGER': {
+            const min = schema.minimum ?? -Infinity;
+            const max = schema.maximum ?? Infinity;
+            return (value) => {
+                if (!Number.isInteger(value) || value < min || value > max) return `${path} must be an integer in [${min}, ${max}]`;
+                return null;
+            };
+        }
+        default:
+            throw new Error(`Unsupported schema type: ${schema.type}`);
+    }
+}
+
+const validateCompactQuestion = compile(COMPACT_QUESTION_SCHEMA);
+
+/**
+ * Expands a validated compact question into the shape used by sessions.
+ * @param {Object} item - Compact question ({ q, o, a, s, d }).
+ * @param {string} category - Topic the question was generated for.
+ * @returns {Object} Question with full field names.
+ */
+function expandQuestion(item, category) {
+    return {
+        question: item.q,
+        options: item.o,
+        correctOptionIndex: item.a,
+        solution: item.s,
+        difficulty: item.d,
+        category
+    };
+}
+
+/**
+ * Checks that a full-shape question can be rendered and graded.
+ * @param {Object} q - Candidate question object.
+ * @returns {boolean} True if the question is usable.
+ */
+function isValidQuestion(q) {
+    return !!q && typeof q.question === 'string' && Array.isArray(q.options) && q.options.length >= 2
+        && Number.isInteger(q.correctOptionIndex) && q.correctOptionIndex >= 0 && q.correctOptionIndex < q.options.length;
+}
+
+module.exports = { questionSetSchema, validateCompactQuestion, expandQuestion, isValidQuestion, compile };
@@ -0,0 +1,290 @@
+/**
+ * Shared Question Store
+ *
+ * Cross-user cache of validated AI-generated questions, bucketed by topic and
+ * difficulty. Each user has a compact bitmap per bucket recording which cached
+ * questions they have already been served, so /start can hand out unseen
+ * questions without calling the upstream model. Generation is only needed once
+ * a user has exhausted the cache for a bucket. findUnseen() marks nothing:
+ * questions count as seen once add() records a session that was served.
+ * exportQuestions() lists the cache for scripts/exportGeneratedQuestions.js,
+ * which feeds the bank build.
+ *
+ * The default backend is in-process; QUESTION_STORE=redis keeps the cache and
+ * bitmaps in Redis so every server process shares them.
+ *
+ * @author Aptitude AI Team
+ * @version 1.2.0
+ */
+
+require('dotenv').config();
+const { questionId } = require('./fallbackBank');
+const { isValidQuestion } = require('./questionSchema');
+const LruCache = require('./lruCache');
+
+const BACKEND = process.env.QUESTION_STORE || 'memory';
+
+// Cached questions per (topic, difficulty); new questions are not cached once a bucket is full
+const MAX_PER_BUCKET = parseInt(process.env.QUESTION_STORE_MAX_PER_BUCKET) || 2000;
+
+// Seen-sets of users who stop practising are dropped after this long (and beyond the user cap)
+const SEEN_TTL_SECONDS = parseInt(process.env.QUESTION_STORE_SEEN_TTL_SECONDS) || 30 * 24 * 60 * 60;
+const SEEN_MAX_USERS = parseInt(process.env.QUESTION_STORE_SEEN_MAX_USERS) || 50000;
+
+// Returns a question's position in the bucket and whether it was appended. Runs
+// atomically, so an id is never left half-claimed and the cap holds under concurrency.
+const ADD_SCRIPT = `
+local position = tonumber(redis.call('HGET', KEYS[1], ARGV[1]))
+if position and position >= 0 then return {position, 0} end
+if redis.call('LLEN', KEYS[2]) >= tonumber(ARGV[3]) then return {-1, 0} end
+position = redis.call('RPUSH', KEYS[2], ARGV[2]) - 1
+redis.call('HSET', KEYS[1], ARGV[1], position)
+return {position, 1}
+`;
+
+/**
+ * Builds the cache key for a topic and difficulty.
+ * @param {string} topic - Topic name.
+ * @param {string} difficulty - Difficulty level.
+ * @returns {string} Bucket key.
+ */
+function bucketKey(topic, difficulty) {
+    return `${topic}|${difficulty}`;
+}
+
+/**
+ * Returns the questions worth caching from a served set, each with its content id.
+ * @param {Array} questions - Questions served in a session.
+ * @returns {Array} Generated, valid questions with `id` set.
+ */
+function cacheable(questions) {
+    return questions
+        .filter(q => q.source !== 'fallback' && isValidQuestion(q))
+        .map(q => ({ ...q, id: q.id || questionId(q), source: 'cache' }));
+}
+
+/**
+ * Converts a cached question to the export format read by scripts/bank_dedupe.py.
+ * @param {string} key - Bucket key ("topic|difficulty").
+ * @param {Object} q - Cached question.
+ * @returns {Object} Question with its category and difficulty.
+ */
+function exportRecord(key, q) {
+    const split = key.lastIndexOf('|');
+    return {
+        id: q.id,
+        category: key.slice(0, split),
+        difficulty: key.slice(split + 1),
+        question: q.question,
+        options: q.options,
+        correctOptionIndex: q.correctOptionIndex,
+        solution: q.solution
+    };
+}
+
+/**
+ * Lists the positions below `size` whose bit is clear in a seen-set bitmap.
+ * @param {Uint8Array|Buffer|null} bitmap - Seen-set bitmap (bit i = question i seen).
+ * @param {number} size - Number of cached questions in the bucket.
+ * @returns {Array<number>} Unseen positions.
+ */
+function unseenPositions(bitmap, size) {
+    const unseen = [];
+    for (let i = 0; i < size; i++) {
+        const byte = bitmap && (i >> 3) < bitmap.length ? bitmap[i >> 3] : 0;
+        if ((byte & (0x80 >> (i & 7))) === 0) unseen.push(i);
+    }
+    return unseen;
+}
+
+/**
+ * Picks `n` random positions with a partial Fisher-Yates shuffle.
+ * @param {Array<number>} positions - Candidate positions (permuted in place).
+ * @param {number} n - Number wanted.
+ * @returns {Array<number>} Chosen positions.
+ */
+function pick(positions, n) {
+    for (let i = 0; i < n; i++) {
+        const j = i + Math.floor(Math.random() * (positions.length - i));
+        [positions[i], positions[j]] = [positions[j], positions[i]];
+    }
+    return positions.slice(0, n);
+}
+
+/**
+ * In-process backend: questions in arrays, seen-sets as Uint8Array bitmaps.
+ * Bitmaps use MSB-first bit order within each byte, matching Redis SETBIT.
+ */
+class MemoryQuestionStore {
+    constructor() {
+        this.buckets = new Map();  // bucketKey -> { questions: [], ids: Map(questionId -> position) }
+        // userId -> Map(bucketKey -> Uint8Array); the TTL slides with every session
+        this.seenSets = new LruCache({ maxEntries: SEEN_MAX_USERS, ttlMs: SEEN_TTL_SECONDS * 1000 });
+        setInterval(() => this.seenSets.prune(), 60 * 60 * 1000).unref();
+        this.stats = { hits: 0, misses: 0, stored: 0 };
+    }
+
+    /**
+     * Returns a user's bitmap for a bucket, grown to cover `size` questions.
+     */
+    getBitmap(userId, key, size) {
+        let userSets = this.seenSets.get(userId);
+        if (!userSets) userSets = new Map();
+        this.seenSets.set(userId, userSets); // Refreshes the TTL
+        let bitmap = userSets.get(key);
+        const bytes = Math.ceil(size / 8);
+        if (!bitmap || bitmap.length < bytes) {
+            const grown = new Uint8Array(Math.max(bytes, 16));
+            if (bitmap) grown.set(bitmap);
+            bitmap = grown;
+            userSets.set(key, bitmap);
+        }
+        return bitmap;
+    }
+
+    async add(userId, topic, difficulty, questions) {
+        const key = bucketKey(topic, difficulty);
+        let bucket = this.buckets.get(key);
+        if (!bucket) {
+            bucket = { questions: [], ids: new Map() };
+            this.buckets.set(key, bucket);
+        }
+
+        const served = [];
+        let added = 0;
+        for (const q of cacheable(questions)) {
+            let position = bucket.ids.get(q.id);
+            if (position === undefined) {
+                if (bucket.questions.length >= MAX_PER_BUCKET) continue;
+                position = bucket.questions.length;
+                bucket.questions.push(q);
+                bucket.ids.set(q.id, position);
+                added++;
+            }
+            served.push(position);
+        }
+
+        const bitmap = this.getBitmap(userId, key, bucket.questions.length);
+        served.forEach(i => { bitmap[i >> 3] |= 0x80 >> (i & 7); });
+        this.stats.stored += added;
+        return added;
+    }
+
+    async findUnseen(userId, topic, difficulty, n) {
+        const key = bucketKey(topic, difficulty);
+        const bucket = this.buckets.get(key);
+        const size = bucket ? bucket.questions.length : 0;
+        const bitmap = size >= n ? this.getBitmap(userId, key, size) : null;
+        const unseen = bitmap ? unseenPositions(bitmap, size) : [];
+        if (unseen.length < n) {
+            this.stats.misses++;
+            return null;
+        }
+
+        this.stats.hits++;
+        return pick(unseen, n).map(position => {
+            const q = bucket.questions[position];
+            return { ...q, options: [...q.options] };
+        });
+    }
+
+    async exportQuestions() {
+        const records = [];
+        this.buckets.forEach((bucket, key) => {
+            bucket.questions.forEach(q => records.push(exportRecord(key, q)));
+        });
+        return records;
+    }
+
+    getStats() {
+        let cached = 0;
+        this.buckets.forEach(b => { cached += b.questions.length; });
+        const seen = this.seenSets.getStats();
+        return { backend: 'memory', ...this.stats, cached, buckets: this.buckets.size, users: seen.entries, seenEvictions: seen.evictions };
+    }
+}
+
+/**
+ * Redis backend: a list of question JSON per bucket, a hash of content id ->
+ * position for deduplication, and one SETBIT bitmap per (user, bucket).
+ */
+class RedisQuestionStore {
+    constructor() {
+        const { RESP_TYPES } = require('redis');
+        this.client = require('./redisClient');
+        // Bitmaps must come back as raw bytes, not UTF-8 strings
+        this.binary = this.client.withTypeMapping({ [RESP_TYPES.BLOB_STRING]: Buffer });
+        this.stats = { hits: 0, misses: 0, stored: 0 };
+    }
+
+    keys(topic, difficulty, userId) {
+        const bucket = bucketKey(topic, difficulty);
+        return {
+            list: `qstore:${bucket}:questions`,
+            ids: `qstore:${bucket}:ids`,
+            seen: `qstore:${bucket}:seen:${userId}`
+        };
+    }
+
+    async add(userId, topic, difficulty, questions) {
+        const keys = this.keys(topic, difficulty, userId);
+        const served = [];
+        let added = 0;
+
+        for (const q of cacheable(questions)) {
+            const [position, appended] = await this.client.eval(ADD_SCRIPT, {
+                keys: [keys.ids, keys.list],
+                arguments: [q.id, JSON.stringify(q), String(MAX_PER_BUCKET)]
+            });
+            if (position < 0) continue; // Bucket full
+            served.push(position);
+            added += appended;
+        }
+
+        if (served.length) {
+            const multi = this.client.multi();
+            served.forEach(position => multi.setBit(keys.seen, position, 1));
+            multi.expire(keys.seen, SEEN_TTL_SECONDS);
+            await multi.exec();
+        }
+        this.stats.stored += added;
+        return added;
+    }
+
+    async findUnseen(userId, topic, difficulty, n) {
+        const keys = this.keys(topic, difficulty, userId);
+        const size = await this.client.lLen(keys.list);
+        const bitmap = size >= n ? await this.binary.get(keys.seen) : null;
+        const unseen = size >= n ? unseenPositions(bitmap, size) : [];
+        if (unseen.length < n) {
+            this.stats.misses++;
+            return null;
+        }
+
+        const multi = this.client.multi();
+        pick(unseen, n).forEach(position => multi.lIndex(keys.list, position));
+        const replies = await multi.exec();
+        this.stats.hits++;
+        return replies.map(raw => JSON.parse(raw));
+    }
+
+    async exportQuestions() {
+        const records = [];
+        for await (const batch of this.client.scanIterator({ MATCH: 'qstore:*:questions', COUNT: 100 })) {
+            for (const listKey of [].concat(batch)) {
+                const key = listKey.slice('qstore:'.length, -':questions'.length);
+                const items = await this.client.lRange(listKey, 0, -1);
+                items.forEach(raw => records.push(exportRecord(key, JSON.parse(raw))));
+            }
+        }
+        return records;
+    }
+
+    getStats() {
+        return { backend: 'redis', ...this.stats };
+    }
+}
+
+const store = BACKEND === 'redis' ? new RedisQuestionStore() : new MemoryQuestionStore();
+
+module.exports = store;
@@ -0,0 +1,112 @@
+/**
+ * Incremental Question Stream Parser
+ *
+ * Consumes model output fragment by fragment and emits each element of the
+ * `questions` array as soon as its closing brace arrives, so a session can
+ * start before the whole JSON document has been generated.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+class QuestionStreamParser {
+    /**
+     * @param {Function} onQuestion - Called with each fully parsed question object.
+     */
+    constructor(onQuestion) {
+        this.onQuestion = onQuestion;
+        this.buffer = '';
+        this.pos = 0;
+        this.stack = [];          // Open containers: { type: '{' | '[', isQuestions }
+        this.inString = false;
+        this.escaped = false;
+        this.stringStart = -1;
+        this.lastString = null;   // Most recently closed string literal (candidate key)
+        this.pendingKey = null;   // Key whose value is about to start
+        this.objectStart = -1;    // Buffer offset of the question object being read
+    }
+
+    /**
+     * Feeds the next fragment of model output.
+     * @param {string} text - Newly generated text.
+     */
+    push(text) {
+        this.buffer += text;
+        for (; this.pos < this.buffer.length; this.pos++) {
+            this.step(this.buffer[this.pos]);
+        }
+    }
+
+    /**
+     * Advances the scanner by one character.
+     * @param {string} ch - Current character.
+     */
+    step(ch) {
+        if (this.inString) {
+            if (this.escaped) {
+                this.escaped = false;
+            } else if (ch === '\\') {
+                this.escaped = true;
+            } else if (ch === '"') {
+                this.inString = false;
+                this.lastString = this.buffer.slice(this.stringStart + 1, this.pos);
+            }
+            return;
+        }
+
+        // Outside any JSON container (e.g. a ```json fence) only an opening bracket matters
+        if (this.stack.length === 0 && ch !== '{' && ch !== '[') return;
+
+        const top = this.stack[this.stack.length - 1];
+        switch (ch) {
+            case '"':
+                this.inString = true;
+                this.stringStart = this.pos;
+                break;
+            case ':':
+                this.pendingKey = this.lastString;
+                break;
+            case ',':
+                this.pendingKey = null;
+                break;
+            case '[':
+                // The questions array, or a bare top-level array of questions
+                this.stack.push({ type: '[', isQuestions: this.pendingKey === 'questions' || !top });
+                this.pendingKey = null;
+                break;
+            case '{':
+                if (top && top.isQuestions) this.objectStart = this.pos;
+                this.stack.push({ type: '{', isQuestions: false });
+                this.pendingKey = null;
+                break;
+            case ']':
+            case '}':
+                this.stack.pop();
+                if (ch === '}' && this.objectStart !== -1) {
+                    const parent = this.stack[this.stack.length - 1];
+                    if (parent && parent.isQuestions) this.emit();
+                }
+                break;
+            default:
+                break;
+        }
+    }
+
+    /**
+     * Parses and emits the question object that just closed.
+     */
+    emit() {
+        const raw = this.buffer.slice(this.objectStart, this.pos + 1);
+        this.objectStart = -1;
+        let question;
+        try {
+            question = JSON.parse(raw);
+        } catch (err) {
+            console.warn('[Stream Parser] Skipping malformed question object:', err.message);
+            return;
+        }
+        this.onQuestion(question);
+    }
+}
+
+module.exports = QuestionStreamParser;
@@ -0,0 +1,142 @@
+/**
+ * Session Result Service
+ *
+ * Scores a completed practice session and persists the result. Persistence
+ * runs as one transaction that inserts the session row idempotently (keyed on
+ * the session id) and, only when the row is new, applies the user's XP,
+ * accuracy and streak updates as atomic SQL increments. Repeated result
+ * requests for the same session therefore never count it twice. The user's
+ * cached profile view is refreshed once the transaction commits.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+const { Transaction } = require('sequelize');
+const { sequelize, Session, User } = require('../models/index');
+const profileCache = require('./profileCache');
+const topicStats = require('./topicStats');
+
+// XP awarded per correct answer before the category weight is applied
+const BASE_XP = 10;
+
+/**
+ * Grades a session's answers.
+ * @param {Object} session - Active session with questions and answers.
+ * @returns {Object} { total, correct, accuracy, xpEarned, categoryWeight, details }.
+ */
+function scoreSession(session) {
+    const total = session.questions.length;
+    let correct = 0;
+    const details = session.questions.map((q, idx) => {
+        const ans = session.answers[idx];
+        const isCorrect = ans && ans.selectedOption === q.correctOptionIndex;
+        if (isCorrect) correct++;
+        return {
+            question: q.question,
+            options: q.options,
+            correctOptionIndex: q.correctOptionIndex,
+            userAnswer: ans ? ans.selectedOption : null,
+            isCorrect,
+            solution: q.solution
+        };
+    });
+
+    // Calculate accuracy percentage
+    const accuracy = total ? Math.round((correct / total) * 100) : 0;
+
+    // XP calculation: Accuracy * baseXP * category specific weight
+    const categoryWeight = 1.0; // TODO: Fetch weight from topic configuration
+    const xpEarned = Math.round(correct * BASE_XP * categoryWeight);
+
+    return { total, correct, accuracy, xpEarned, categoryWeight, details };
+}
+
+/**
+ * Computes the streak after a session completed now.
+ * @param {Date|string|null} lastActiveDate - Date of the user's previous session.
+ * @param {number} streakCount - Current streak length.
+ * @returns {number} New streak length.
+ */
+function nextStreak(lastActiveDate, streakCount) {
+    // First session ever
+    if (!lastActiveDate) return 1;
+
+    // Reset time part to ensure we strictly compare dates
+    const today = new Date();
+    today.setHours(0, 0, 0, 0);
+    const lastActive = new Date(lastActiveDate);
+    lastActive.setHours(0, 0, 0, 0);
+
+    const diffDays = Math.ceil(Math.abs(today - lastActive) / (1000 * 60 * 60 * 24));
+    if (diffDays === 1) return streakCount + 1; // Consecutive day
+    if (diffDays > 1) return 1;                 // Break in streak
+    return streakCount;                         // Same day
+}
+
+/**
+ * Persists a scored session and updates the user's aggregates, once per session id.
+ * @param {string} sessionId - Active session identifier (primary key of the row).
+ * @param {number} userId - Owner of the session.
+ * @param {Object} session - Active session object.
+ * @param {Object} score - Result of scoreSession().
+ * @returns {Promise<Object>} { created, totalXP, previousXP, streakCount }; created is
+ *   false when the session had already been persisted.
+ */
+async function persistSessionResult(sessionId, userId, session, score) {
+    const { total, correct, accuracy, xpEarned } = score;
+    const topicName = session.topicName || session.questions[0].category || 'General';
+
+    // IMMEDIATE takes SQLite's write lock up front, so concurrent completions
+    // queue instead of failing when both try to upgrade a read lock
+    const result = await sequelize.transaction({ type: Transaction.TYPES.IMMEDIATE }, async (transaction) => {
+        const [, created] = await Session.findOrCreate({
+            where: { id: sessionId },
+            defaults: {
+                id: sessionId,
+                userId,
+                topicId: session.topicId,
+                topicName,
+                milestoneName: session.questions[0].milestone || 'Unknown',
+                totalQuestions: total,
+                correctAnswers: correct,
+                accuracy, // percentage
+                xpEarned,
+                difficulty: session.questions[0].difficulty || 'medium',
+                durationSeconds: Math.round((Date.now() - session.startTime) / 1000)
+            },
+            transaction
+        });
+
+        const user = await User.findByPk(userId, {
+            attributes: ['id', 'totalXP', 'streakCount', 'lastActiveDate'],
+            transaction
+        });
+        const previousXP = user ? user.totalXP : 0;
+        if (!created || !user) {
+            // Already counted (e.g. the result page was refreshed)
+            return { created: false, totalXP: previousXP, previousXP, streakCount: user ? user.streakCount : 0 };
+        }
+
+        await topicStats.recordSession({ userId, topicName, accuracy, correctAnswers: correct, totalQuestions: total }, transaction);
+
+        // Aggregates are incremented in SQL so concurrent completions cannot overwrite each other
+        const streakCount = nextStreak(user.lastActiveDate, user.streakCount);
+        await User.update({
+            totalXP: sequelize.literal(`"totalXP" + ${Number(xpEarned)}`),
+            sessionsCompleted: sequelize.literal('"sessionsCompleted" + 1'),
+            totalAccuracySum: sequelize.literal(`"totalAccuracySum" + ${Number(accuracy)}`),
+            streakCount,
+            lastActiveDate: new Date()
+        }, { where: { id: userId }, transaction });
+
+        console.log(`[Session] Persisted session ${sessionId} to DB. Streak: ${streakCount}, XP: +${xpEarned}`);
+        return { created: true, totalXP: previousXP + xpEarned, previousXP, streakCount };
+    });
+
+    // The increments were applied in SQL, so refresh the cached profile from the committed row
+    if (result.created) await profileCache.reload(userId);
+    return result;
+}
+
+module.exports = { scoreSession, persistSessionResult };
@@ -0,0 +1,109 @@
+/**
+ * Active Session Store
+ *
+ * Pluggable storage for in-progress practice sessions. The default backend is
+ * an in-process LRU with a TTL and a byte budget; setting SESSION_STORE=redis
+ * keeps sessions in Redis (via utils/redisClient.js) as compact JSON so they
+ * survive restarts and can be shared between server processes.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+require('dotenv').config();
+const LruCache = require('./lruCache');
+
+const BACKEND = process.env.SESSION_STORE || 'memory';
+const TTL_SECONDS = parseInt(process.env.SESSION_TTL_SECONDS) || 3 * 60 * 60;
+const MAX_BYTES = parseInt(process.env.SESSION_STORE_MAX_BYTES) || 64 * 1024 * 1024;
+const KEY_PREFIX = 'session:';
+
+/**
+ * In-process backend: O(1) LRU lookups, evicting least recently used sessions
+ * once the byte budget is exceeded and dropping sessions idle past the TTL.
+ * Reads and writes both restart the TTL, matching the Redis backend.
+ */
+class MemorySessionStore {
+    constructor() {
+        this.cache = new LruCache({
+            ttlMs: TTL_SECONDS * 1000,
+            maxBytes: MAX_BYTES,
+            sizeOf: session => Buffer.byteLength(JSON.stringify(session))
+        });
+        // Sweep expired sessions that are never read again
+        setInterval(() => this.cache.prune(), 60 * 1000).unref();
+    }
+
+    async get(sessionId) {
+        const session = this.cache.get(sessionId);
+        if (!session) return null;
+        // Slide the expiry like Redis GETEX, so an active session never times out mid-practice
+        this.cache.touch(sessionId);
+        return session;
+    }
+
+    async set(sessionId, session) {
+        this.cache.set(sessionId, session);
+    }
+
+    async delete(sessionId) {
+        this.cache.delete(sessionId);
+    }
+
+    getStats() {
+        return { backend: 'memory', ...this.cache.getStats() };
+    }
+}
+
+/**
+ * Redis backend: one key per session with a sliding expiry. Redis applies its
+ * own maxmemory policy, so evictions are not tracked here.
+ */
+class RedisSessionStore {
+    constructor() {
+        this.client = require('./redisClient');
+        this.stats = { hits: 0, misses: 0, errors: 0 };
+    }
+
+    async get(sessionId) {
+        try {
+            const raw = await this.client.getEx(KEY_PREFIX + sessionId, { EX: TTL_SECONDS });
+            if (!raw) {
+                this.stats.misses++;
+                return null;
+            }
+            this.stats.hits++;
+            return JSON.parse(raw);
+        } catch (err) {
+            this.stats.errors++;
+            throw err;
+        }
+    }
+
+    async set(sessionId, session) {
+        try {
+            await this.client.set(KEY_PREFIX + sessionId, JSON.stringify(session), { EX: TTL_SECONDS });
+        } catch (err) {
+            this.stats.errors++;
+            throw err;
+        }
+    }
+
+    async delete(sessionId) {
+        await this.client.del(KEY_PREFIX + sessionId);
+    }
+
+    getStats() {
+        const lookups = this.stats.hits + this.stats.misses;
+        return {
+            backend: 'redis',
+            ...this.stats,
+            hitRate: lookups ? Math.round((this.stats.hits / lookups) * 1000) / 1000 : 0
+        };
+    }
+}
+
+const store = BACKEND === 'redis' ? new RedisSessionStore() : new MemorySessionStore();
+console.log(`[Session Store] Using ${BACKEND} backend (TTL ${TTL_SECONDS}s)`);
+
+module.exports = store;
@@ -0,0 +1,135 @@
+/**
+ * Token Bucket Rate Limiter
+ *
+ * Client-side limiter that keeps outbound calls within an API quota.
+ * Callers that find the bucket empty wait in priority queues (lower number
+ * = served first) instead of being sent upstream to collect a 429.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+/**
+ * Raised when a caller cannot obtain a token (queue full or wait deadline passed).
+ */
+class RateLimitError extends Error {
+    constructor(message) {
+        super(message);
+        this.name = 'RateLimitError';
+    }
+}
+
+class TokenBucket {
+    /**
+     * @param {Object} options - Limiter configuration.
+     * @param {number} options.ratePerMinute - Sustained tokens granted per minute.
+     * @param {number} options.burst - Maximum tokens that can accumulate.
+     * @param {number} [options.maxQueue] - Maximum number of waiting callers.
+     * @param {number} [options.levels] - Number of priority levels.
+     */
+    constructor({ ratePerMinute, burst, maxQueue = 200, levels = 2 }) {
+        this.intervalMs = 60000 / ratePerMinute;
+        this.capacity = burst;
+        this.tokens = burst;
+        this.lastRefill = Date.now();
+        this.maxQueue = maxQueue;
+        this.queues = Array.from({ length: levels }, () => []);
+        this.queued = 0;
+        this.timer = null;
+    }
+
+    /**
+     * Adds the tokens accrued since the last refill.
+     */
+    refill() {
+        const now = Date.now();
+        const earned = Math.floor((now - this.lastRefill) / this.intervalMs);
+        if (earned > 0) {
+            this.tokens = Math.min(this.capacity, this.tokens + earned);
+            this.lastRefill += earned * this.intervalMs;
+        }
+        if (this.tokens === this.capacity) this.lastRefill = now;
+    }
+
+    /**
+     * Waits for a token.
+     * @param {number} priority - Queue level (0 is served first).
+     * @param {number} maxWaitMs - Give up (reject) if no token arrives in time.
+     * @returns {Promise<void>} Resolves once a token has been taken.
+     */
+    acquire(priority = 0, maxWaitMs = Infinity) {
+        this.refill();
+        if (this.queued === 0 && this.tokens > 0) {
+            this.tokens--;
+            return Promise.resolve();
+        }
+        if (this.queued >= this.maxQueue) {
+            return Promise.reject(new RateLimitError('Rate limiter queue is full'));
+        }
+
+        const level = Math.min(Math.max(priority, 0), this.queues.length - 1);
+        return new Promise((resolve, reject) => {
+            const waiter = { resolve, reject, expiry: null };
+            if (maxWaitMs !== Infinity) {
+                waiter.expiry = setTimeout(() => {
+                    const queue = this.queues[level];
+                    const pos = queue.indexOf(waiter);
+                    if (pos !== -1) {
+                        queue.splice(pos, 1);
+                        this.queued--;
+                    }
+                    reject(new RateLimitError(`No rate limit token within ${maxWaitMs}ms`));
+                }, maxWaitMs);
+            }
+            this.queues[level].push(waiter);
+            this.queued++;
+            this.schedule();
+        });
+    }
+
+    /**
+     * Hands out available tokens to waiters, highest priority first.
+     */
+    drainQueues() {
+        this.timer = null;
+        this.refill();
+        for (const queue of this.queues) {
+            while (queue.length && this.tokens > 0) {
+                const waiter = queue.shift();
+                this.queued--;
+                this.tokens--;
+                clearTimeout(waiter.expiry);
+                waiter.resolve();
+            }
+        }
+        this.schedule();
+    }
+
+    /**
+     * Arms a timer for the next token if anyone is waiting.
+     */
+    schedule() {
+        if (this.timer || this.queued === 0) return;
+        const wait = Math.max(0, this.lastRefill + this.intervalMs - Date.now());
+        this.timer = setTimeout(() => this.drainQueues(), wait);
+    }
+
+    /**
+     * Discards banked tokens, e.g. after the upstream reports a quota overrun.
+     */
+    empty() {
+        this.tokens = 0;
+        this.lastRefill = Date.now();
+    }
+
+    /**
+     * Returns limiter counters for health reporting.
+     * @returns {Object} Available tokens and waiting callers.
+     */
+    getStats() {
+        this.refill();
+        return { tokens: this.tokens, queued: this.queued };
+    }
+}
+
+module.exports = { TokenBucket, RateLimitError };
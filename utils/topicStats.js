@@ -0,0 +1,116 @@
+/**
+ * Topic Statistics Service
+ *
+ * Maintains the per-(user, topic) aggregates in the topic_stats table.
+ * Results add to them inside the transaction that persists the session, and
+ * users whose history predates the table are backfilled from the sessions
+ * table with a single GROUP BY the first time they are needed.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+const { fn, col } = require('sequelize');
+const { Session, TopicStat } = require('../models/index');
+
+/**
+ * Rebuilds a user's topic aggregates from their session history if they have none yet.
+ * @param {number} userId - User whose aggregates are needed.
+ * @param {Object} [transaction] - Active transaction, if any.
+ * @returns {Promise<boolean>} True if the aggregates were rebuilt.
+ */
+async function ensureBackfilled(userId, transaction) {
+    const existing = await TopicStat.findOne({ where: { userId }, attributes: ['id'], transaction });
+    if (existing) return false;
+
+    const rows = await Session.findAll({
+        where: { userId },
+        attributes: [
+            'topicName',
+            [fn('COUNT', col('id')), 'sessionsCount'],
+            [fn('SUM', col('accuracy')), 'accuracySum'],
+            [fn('SUM', col('correctAnswers')), 'correctAnswers'],
+            [fn('SUM', col('totalQuestions')), 'totalQuestions'],
+            [fn('MAX', col('createdAt')), 'lastSessionAt']
+        ],
+        group: ['topicName'],
+        raw: true,
+        transaction
+    });
+    if (rows.length === 0) return false;
+
+    await TopicStat.bulkCreate(rows.map(row => ({ ...row, userId })), { ignoreDuplicates: true, transaction });
+    console.log(`[Topic Stats] Backfilled ${rows.length} topics for user ${userId}`);
+    return true;
+}
+
+/**
+ * Adds a newly persisted session to its topic aggregate. Must run after the
+ * session row is written, in the same transaction.
+ * @param {Object} result - Persisted session values.
+ * @param {number} result.userId - Owner of the session.
+ * @param {string} result.topicName - Topic practiced.
+ * @param {number} result.accuracy - Accuracy percentage.
+ * @param {number} result.correctAnswers - Correct answers in the session.
+ * @param {number} result.totalQuestions - Questions in the session.
+ * @param {Object} transaction - Transaction persisting the session.
+ */
+async function recordSession({ userId, topicName, accuracy, correctAnswers, totalQuestions }, transaction) {
+    // A rebuild already includes the session just written
+    if (await ensureBackfilled(userId, transaction)) return;
+
+    const [stat] = await TopicStat.findOrCreate({
+        where: { userId, topicName },
+        defaults: { userId, topicName },
+        transaction
+    });
+    // UPDATE ... SET col = col + n, so concurrent completions cannot lose updates
+    await stat.increment({
+        sessionsCount: 1,
+        accuracySum: accuracy,
+        correctAnswers,
+        totalQuestions
+    }, { transaction });
+    await stat.update({ lastSessionAt: new Date() }, { transaction });
+}
+
+/**
+ * Returns a user's aggregates for every topic they have practiced.
+ * @param {number} userId - User to look up.
+ * @returns {Promise<Array<Object>>} Rows with topicName, sessionsCount, accuracySum, correctAnswers and totalQuestions.
+ */
+async function getTopicStats(userId) {
+    const stats = await TopicStat.findAll({ where: { userId }, raw: true });
+    if (stats.length > 0) return stats;
+    if (!(await ensureBackfilled(userId))) return [];
+    return TopicStat.findAll({ where: { userId }, raw: true });
+}
+
+/**
+ * Topics where the user averages under 60% accuracy, weakest first.
+ * @param {number} userId - User to analyse.
+ * @param {number} sessionsCompleted - User's completed session count (unlocks the analysis at 10).
+ * @returns {Promise<Object>} { eligible, message } or { eligible, weakAreas }.
+ */
+async function getWeakAreas(userId, sessionsCompleted) {
+    if (sessionsCompleted < 10) {
+        return {
+            eligible: false,
+            message: `Complete ${10 - sessionsCompleted} more sessions to unlock Weak Area analysis.`
+        };
+    }
+
+    // One indexed read of at most one row per topic
+    const stats = await getTopicStats(userId);
+
+    const weakAreas = [];
+    for (const stat of stats) {
+        const avg = stat.accuracySum / stat.sessionsCount;
+        if (avg < 60) {
+            weakAreas.push({ name: stat.topicName, accuracy: Math.round(avg), count: stat.sessionsCount });
+        }
+    }
+    return { eligible: true, weakAreas: weakAreas.sort((a, b) => a.accuracy - b.accuracy) };
+}
+
+module.exports = { recordSession, getTopicStats, getWeakAreas };
@@ -0,0 +1,32 @@
+/**
+ * AptiRise - Email Worker Entry Point
+ *
+ * Standalone consumer for the outbound email queue (utils/emailQueue.js).
+ * Run it alongside the API with EMAIL_WORKER=external set on the API
+ * servers, so they only enqueue and never send mail themselves.
+ *
+ * @author Aptitude AI Team
+ * @version 1.0.0
+ */
+
+require('dotenv').config();
+const { EmailWorker } = require('../utils/emailQueue');
+
+const worker = new EmailWorker();
+
+worker.start().catch(err => {
+    console.error('[Email Worker] Failed to start:', err);
+    process.exit(1);
+});
+
+/**
+ * Stops claiming jobs, lets in-flight sends finish and exits.
+ */
+async function shutdown() {
+    console.log('[Email Worker] Shutting down', worker.getStats());
+    await worker.stop();
+    process.exit(0);
+}
+
+process.on('SIGTERM', shutdown);
+process.on('SIGINT', shutdown);